@@ -6,6 +6,7 @@ For more in-depth execution tests, see ``tests.functional``.
 import base64
 import dataclasses
 import json
+import os
 import urllib.parse
 import uuid
 from typing import TYPE_CHECKING, List, cast
@@ -19,7 +20,14 @@ from tests.utils import MockedRequest
 from weaver.datatype import Job
 from weaver.formats import ContentEncoding, ContentType
 from weaver.processes.constants import WPS_BOUNDINGBOX_DATA, WPS_COMPLEX_DATA, WPS_LITERAL, WPS_CategoryType
-from weaver.processes.execution import parse_kvp_inputs_outputs, parse_wps_inputs, submit_job, submit_job_from_kvp
+from weaver.processes.execution import (
+    make_results_digest,
+    parse_kvp_inputs_outputs,
+    parse_wps_inputs,
+    submit_job,
+    submit_job_from_kvp
+)
+from weaver.utils import compute_file_digest_multibase
 from weaver.wps_restapi.swagger_definitions import OGC_API_PROC_BBOX_CRS
 
 if TYPE_CHECKING:
@@ -1376,3 +1384,29 @@ def test_kvp_response_collection_in_submission():
 
     error_json = exc_info.value.json
     assert "response=collection" in error_json.get("detail", "").lower()
+
+
+def test_make_results_digest(tmpdir):
+    wps_dir = os.path.join(tmpdir, "wpsoutputs")
+    settings = {
+        "weaver.wps_output_dir": wps_dir,
+        "weaver.wps_output_url": "https://localhost/wpsoutputs",
+    }
+    data = b"test-data"
+    for name in ["file.txt", "item.txt"]:
+        os.makedirs(os.path.join(wps_dir, "job"), exist_ok=True)
+        with open(os.path.join(wps_dir, "job", name), mode="wb") as out_file:
+            out_file.write(data)
+    results = [
+        {"identifier": "file", "reference": "https://localhost/wpsoutputs/job/file.txt"},
+        {"identifier": "array", "data": [{"reference": f"file://{wps_dir}/job/item.txt"}]},
+        {"identifier": "remote", "reference": "https://remote.com/file.txt"},
+        {"identifier": "literal", "data": 1},
+    ]
+    results = make_results_digest(results, settings)
+    expect_digest = compute_file_digest_multibase(os.path.join(wps_dir, "job", "file.txt"))
+    assert results[0]["digestMultibase"] == expect_digest
+    assert results[1]["data"][0]["digestMultibase"] == expect_digest
+    assert "digestMultibase" not in results[2]
+    assert "digestMultibase" not in results[3]
+    assert sorted(os.listdir(wps_dir)) == ["job"], "digests should not be stored in the WPS output directory"
@@ -0,0 +1,78 @@
+import os
+import pstats
+import time
+
+import pytest
+
+from weaver.processes.profiling import (
+    JOB_PROFILING_HEADER,
+    ProfilingFormat,
+    SamplingProfiler,
+    get_job_profiling_format,
+    start_job_profiling,
+    stop_job_profiling
+)
+
+
+@pytest.mark.parametrize(
+    ["settings", "headers", "expect"],
+    [
+        ({}, {}, None),
+        ({}, {JOB_PROFILING_HEADER: "true"}, None),  # header not allowed
+        ({"weaver.job_profiling": "true"}, {}, ProfilingFormat.PSTATS),
+        ({"weaver.job_profiling": "true", "weaver.job_profiling_format": "collapsed"}, {}, ProfilingFormat.COLLAPSED),
+        ({"weaver.job_profiling": "true"}, {JOB_PROFILING_HEADER: "false"}, ProfilingFormat.PSTATS),
+        (
+            {"weaver.job_profiling": "true", "weaver.job_profiling_header": "true"},
+            {JOB_PROFILING_HEADER: "false"},
+            None,
+        ),
+        ({"weaver.job_profiling_header": "true"}, {}, None),
+        ({"weaver.job_profiling_header": "true"}, {JOB_PROFILING_HEADER: "true"}, ProfilingFormat.PSTATS),
+        ({"weaver.job_profiling_header": "true"}, {JOB_PROFILING_HEADER: "collapsed"}, ProfilingFormat.COLLAPSED),
+        ({"weaver.job_profiling_header": "true"}, [(JOB_PROFILING_HEADER.lower(), "PSTATS")], ProfilingFormat.PSTATS),
+    ]
+)
+def test_get_job_profiling_format(settings, headers, expect):
+    assert get_job_profiling_format(headers, settings) == expect
+
+
+def _busy_function(duration):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+def test_job_profiling_disabled(tmpdir):
+    profiler = start_job_profiling({}, {})
+    assert profiler is None
+    assert stop_job_profiling(profiler, os.path.join(tmpdir, "job-profile")) is None
+    assert not os.listdir(tmpdir)
+
+
+def test_job_profiling_pstats(tmpdir):
+    profiler = start_job_profiling({}, {"weaver.job_profiling": "true"})
+    _busy_function(0.05)
+    path = stop_job_profiling(profiler, os.path.join(tmpdir, "job-profile"))
+    assert path == os.path.join(tmpdir, "job-profile.pstats")
+    stats = pstats.Stats(path)
+    assert any(func[2] == _busy_function.__name__ for func in stats.stats)
+
+
+def test_job_profiling_collapsed(tmpdir):
+    settings = {
+        "weaver.job_profiling": "true",
+        "weaver.job_profiling_format": "collapsed",
+        "weaver.job_profiling_interval": "0.001",
+    }
+    profiler = start_job_profiling({}, settings)
+    assert isinstance(profiler, SamplingProfiler)
+    _busy_function(0.1)
+    path = stop_job_profiling(profiler, os.path.join(tmpdir, "nested", "job-profile"))
+    assert path == os.path.join(tmpdir, "nested", "job-profile.collapsed")
+    with open(path, mode="r", encoding="utf-8") as prof_file:
+        lines = prof_file.read().splitlines()
+    assert lines
+    _, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert any(_busy_function.__name__ in line for line in lines)
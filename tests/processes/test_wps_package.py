@@ -16,16 +16,22 @@ import re
 import shutil
 import sys
 import tempfile
+import threading
+import time
 import uuid
 import warnings
+from concurrent.futures import CancelledError
 from typing import TYPE_CHECKING, cast
+from urllib.parse import urlparse
 
 import cwltool.process
 import mock
 import pytest
 from _pytest.outcomes import Failed
+from cwltool.context import LoadingContext, RuntimeContext
 from cwltool.errors import WorkflowException
 from cwltool.factory import Factory as CWLFactory
+from cwltool.workflow import default_make_tool as cwl_default_make_tool
 from pywps.inout.formats import Format
 from pywps.inout.outputs import ComplexOutput
 from pywps.validator import emptyvalidator, get_validator
@@ -58,9 +64,12 @@ from weaver.processes.constants import (
     CWL_REQUIREMENT_TIME_LIMIT,
     PACKAGE_FILE_TYPE
 )
+from weaver.processes.types import ProcessType
 from weaver.processes.wps_package import (
     WpsPackage,
+    _is_package_tool_cacheable,
     _load_package_content,
+    _load_supported_schemas,
     _patch_wps_process_description_url,
     _update_package_compatibility,
     _update_package_metadata,
@@ -673,7 +682,8 @@ def test_cwl_extension_requirements_no_error():
     with mock.patch("weaver.processes.wps_package._load_supported_schemas", side_effect=lambda: None):
         # mock caches to ensure that previous tests did not already perform schema registration,
         # making the "unknown" extensions for below test to actually be defined and valid in advance
-        with mock.patch.dict("weaver.processes.wps_package.PACKAGE_SCHEMA_CACHE", {}, clear=True):
+        with mock.patch.dict("weaver.processes.wps_package.PACKAGE_SCHEMA_CACHE", {}, clear=True), \
+             mock.patch.dict("weaver.processes.wps_package.PACKAGE_TOOL_CACHE", {}, clear=True):
             with mock.patch.dict("cwltool.process.SCHEMA_CACHE", {}, clear=True):
                 cwltool.process.use_standard_schema("v1.2")  # enforce standard CWL without any extension
 
@@ -741,6 +751,232 @@ def test_cwl_extension_requirements_no_error():
     )
 
 
+def test_load_package_content_tool_cached():
+    cwl = {
+        "cwlVersion": "v1.2",
+        "class": "CommandLineTool",
+        "baseCommand": ["echo"],
+        "inputs": {"message": {"type": "string", "inputBinding": {"position": 1}}},
+        "outputs": {"output": {"type": "stdout"}},
+    }  # type: CWL
+    with mock.patch.dict("weaver.processes.wps_package.PACKAGE_TOOL_CACHE", {}, clear=True) as tool_cache:
+        runtime_context_1 = RuntimeContext()
+        runtime_context_2 = RuntimeContext()
+        pkg_1, pkg_type_1, _ = _load_package_content(copy.deepcopy(cwl), "test", runtime_context=runtime_context_1)
+        pkg_2, pkg_type_2, _ = _load_package_content(copy.deepcopy(cwl), "test", runtime_context=runtime_context_2)
+        assert len(tool_cache) == 1
+        assert pkg_type_1 == pkg_type_2 == ProcessType.APPLICATION
+        assert pkg_1.t.tool is pkg_2.t.tool, "loaded tool object should be reused for identical package"
+        assert pkg_1.t is not pkg_2.t, "each run should obtain its own copy to attach execution references"
+        assert pkg_1.factory.runtime_context is runtime_context_1, "runtime context must remain specific to each run"
+        assert pkg_2.factory.runtime_context is runtime_context_2, "runtime context must remain specific to each run"
+
+        cwl["baseCommand"] = ["cat"]
+        pkg_3, _, _ = _load_package_content(copy.deepcopy(cwl), "test")
+        assert pkg_3.t is not pkg_1.t, "modified package must not reuse the cached tool object"
+        assert len(tool_cache) == 2
+
+        # cache size limit evicts the least recently used tool objects
+        _load_package_content(copy.deepcopy(cwl), "other", container={"weaver.cwl_tool_cache_size": "1"})
+        assert len(tool_cache) == 1
+
+        # tools constructed with execution-specific references must not be cached
+        tool_cache.clear()
+        loading_context = LoadingContext()
+        loading_context.construct_tool_object = lambda *_, **__: cwl_default_make_tool(*_, **__)
+        _load_package_content(copy.deepcopy(cwl), "test", loading_context=loading_context)
+        assert len(tool_cache) == 0
+
+        # provenance is attached to a copy of the tool object when running it, not when loading it
+        loading_context = LoadingContext()
+        loading_context.research_obj = mock.MagicMock()
+        _load_package_content(copy.deepcopy(cwl), "test", loading_context=loading_context)
+        assert len(tool_cache) == 1
+
+
+@pytest.mark.parametrize("provenance", [True, False])
+def test_load_package_content_workflow_tool_not_cached(provenance):
+    """
+    Workflow steps are bound to the executed job for their dispatch, and their provenance is bound at construction.
+    """
+    loading_context = LoadingContext()
+    loading_context.research_obj = mock.MagicMock() if provenance else None
+    assert not _is_package_tool_cacheable(ProcessType.WORKFLOW)
+    assert not _is_package_tool_cacheable(ProcessType.WORKFLOW, loading_context)
+    assert _is_package_tool_cacheable(ProcessType.APPLICATION, loading_context)
+
+
+def make_staging_package(settings):
+    cwl = cast("CWL", {
+        "cwlVersion": "v1.2",
+        "class": "CommandLineTool",
+        "requirements": {CWL_REQUIREMENT_APP_DOCKER: {"dockerPull": "debian:latest"}},
+        "inputs": {},
+        "outputs": {},
+    })
+    return MockWpsPackage("test", package=cwl, settings=settings)
+
+
+def test_make_location_inputs_concurrent_host_limit():
+    lock = threading.Lock()
+    active = {}
+    max_active = {}
+
+    def mock_make_location_input(_io_def, input_def, fetch_callback=None):
+        host = urlparse(input_def.url).hostname
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            max_active[host] = max(max_active.get(host, 0), active[host])
+        time.sleep(0.05)
+        fetch_callback(b"data")
+        with lock:
+            active[host] -= 1
+        return {"location": input_def.url}
+
+    inputs = [
+        (
+            mock.MagicMock(type=PACKAGE_FILE_TYPE),
+            mock.MagicMock(identifier=f"input-{i}", url=f"https://{host}.example.com/data/{i}.nc"),
+        )
+        for i, host in enumerate(["host-a"] * 6 + ["host-b"] * 2)
+    ]
+    settings = {"weaver.inputs_fetch_max_workers": "8", "weaver.inputs_fetch_max_host_workers": "2"}
+    pkg = make_staging_package(settings)
+    with mock.patch.object(pkg, "make_location_input", side_effect=mock_make_location_input):
+        results = pkg.make_location_inputs(inputs)
+    assert results == [{"location": input_def.url} for _, input_def in inputs], "ordering must be preserved"
+    assert max_active == {"host-a.example.com": 2, "host-b.example.com": 2}
+
+
+def test_make_location_inputs_concurrent_abort():
+    aborted = []
+
+    def mock_make_location_input(_io_def, input_def, fetch_callback=None):
+        if input_def.identifier == "input-0":
+            time.sleep(0.05)
+            raise PackageExecutionError("fetch failed")
+        try:
+            for _ in range(100):  # simulate download chunks
+                time.sleep(0.01)
+                fetch_callback(b"data")
+        except CancelledError:
+            aborted.append(input_def.identifier)
+            raise
+        return {"location": input_def.url}
+
+    inputs = [
+        (
+            mock.MagicMock(type=PACKAGE_FILE_TYPE),
+            mock.MagicMock(identifier=f"input-{i}", url=f"https://host-{i}.example.com/data-{i}.nc"),
+        )
+        for i in range(8)
+    ]
+    pkg = make_staging_package({"weaver.inputs_fetch_max_workers": "4"})
+    with mock.patch.object(pkg, "make_location_input", side_effect=mock_make_location_input) as mock_input:
+        timer = time.perf_counter()
+        with pytest.raises(PackageExecutionError, match="fetch failed"):
+            pkg.make_location_inputs(inputs)
+        duration = time.perf_counter() - timer
+    assert sorted(aborted) == ["input-1", "input-2", "input-3"], "fetch in progress should be aborted"
+    assert mock_input.call_count == 4, "pending inputs should not be staged after failure"
+    assert duration < 0.5, "staging should fail fast without waiting for other downloads to complete"
+
+
+def test_make_location_inputs_concurrent_same_name():
+    lock = threading.Lock()
+    active = {}
+    max_active = {}
+    staged = []
+
+    def mock_make_location_input(_io_def, input_def, fetch_callback=None):
+        name = os.path.basename(urlparse(input_def.url).path)
+        with lock:
+            active[name] = active.get(name, 0) + 1
+            max_active[name] = max(max_active.get(name, 0), active[name])
+        time.sleep(0.05)
+        fetch_callback(b"data")
+        with lock:
+            active[name] -= 1
+            staged.append(input_def.url)
+        return {"location": input_def.url}
+
+    urls = [f"https://host-{i}.example.com/data/{name}" for i, name in enumerate(["a.nc"] * 3 + ["b.nc"] * 3)]
+    inputs = [
+        (mock.MagicMock(type=PACKAGE_FILE_TYPE), mock.MagicMock(identifier=f"input-{i}", url=url))
+        for i, url in enumerate(urls)
+    ]
+    pkg = make_staging_package({"weaver.inputs_fetch_max_workers": "6"})
+    with mock.patch.object(pkg, "make_location_input", side_effect=mock_make_location_input):
+        results = pkg.make_location_inputs(inputs)
+    assert results == [{"location": url} for url in urls], "ordering must be preserved"
+    assert max_active == {"a.nc": 1, "b.nc": 1}, "references staged under the same name must not run concurrently"
+    assert [url for url in staged if url.endswith("a.nc")] == urls[:3], "same name must be staged in order"
+    assert [url for url in staged if url.endswith("b.nc")] == urls[3:], "same name must be staged in order"
+
+
+def test_load_supported_schemas_once():
+    requirements = list(cwltool.process.supportedProcessRequirements)
+    with mock.patch.dict("weaver.processes.wps_package.PACKAGE_SCHEMA_CACHE", {}, clear=True) as schema_cache, \
+         mock.patch.dict("cwltool.process.SCHEMA_CACHE", {}, clear=True), \
+         mock.patch.object(cwltool.process, "supportedProcessRequirements", requirements):
+        _load_supported_schemas(preload=True)
+        schemas = dict(cwltool.process.SCHEMA_CACHE)
+        supported = list(requirements)
+        assert all(version in schemas for version in ["v1.0", "v1.1", "v1.2"])
+
+        with mock.patch("weaver.processes.wps_package.yaml.safe_load") as mock_load:
+            _load_supported_schemas()
+            _load_supported_schemas()
+        assert not mock_load.called, "schema definitions should not be parsed again"
+        assert requirements == supported, "supported requirements should not grow with each call"
+        assert all(cwltool.process.SCHEMA_CACHE[version] is schemas[version] for version in schemas), (
+            "compiled schemas should be preserved when already registered"
+        )
+
+        # schemas replaced by another definition must be registered again, without regenerating them
+        cwltool.process.use_standard_schema("v1.2")
+        _load_supported_schemas()
+        assert cwltool.process.custom_schemas["v1.2"] == schema_cache["v1.2"]
+        assert "v1.2" not in cwltool.process.SCHEMA_CACHE
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_load_package_content_schemas_benchmark():
+    """
+    Compare the duration of loading an :term:`Application Package` with and without previously loaded schemas.
+
+    The first load (cold) must generate and compile the :term:`CWL` schemas with supported extensions, which is
+    what would be observed by the first deploy or execute request of each process if they are not preloaded.
+    """
+    cwl = {
+        "cwlVersion": "v1.2",
+        "class": "CommandLineTool",
+        "baseCommand": ["echo"],
+        "inputs": {"message": {"type": "string", "inputBinding": {"position": 1}}},
+        "outputs": {"output": {"type": "stdout"}},
+    }  # type: CWL
+    with mock.patch.dict("weaver.processes.wps_package.PACKAGE_SCHEMA_CACHE", {}, clear=True), \
+         mock.patch.dict("weaver.processes.wps_package.PACKAGE_TOOL_CACHE", {}, clear=True) as tool_cache, \
+         mock.patch.dict("cwltool.process.SCHEMA_CACHE", {}, clear=True):
+        timer = time.perf_counter()
+        _load_package_content(copy.deepcopy(cwl), "test")
+        cold = time.perf_counter() - timer
+
+        warm = []
+        for _ in range(3):
+            tool_cache.clear()  # only measure schema reuse, not tool object reuse
+            timer = time.perf_counter()
+            _load_package_content(copy.deepcopy(cwl), "test")
+            warm.append(time.perf_counter() - timer)
+        warm = min(warm)
+
+    assert warm < cold, (
+        "Loading a package with previously compiled schemas should be faster. "
+        f"Obtained durations: cold={cold:.3f}s, warm={warm:.3f}s."
+    )
+
+
 @pytest.mark.parametrize(
     "cwl",
     [
@@ -217,6 +217,20 @@ def test_process_split_version(process_id, result):
     assert Process.split_version(process_id) == result
 
 
+def test_process_revision_hash():
+    package = {"cwlVersion": "v1.2", "class": "CommandLineTool", "inputs": {}, "outputs": {}}
+    process = Process(id="test-revision-hash", processEndpointWPS1="blah", version="1.0.0", package=deepcopy(package))
+    same = Process(id="test-revision-hash", processEndpointWPS1="blah", version="1.0.0", package=deepcopy(package))
+    assert process.revision_hash == same.revision_hash, "same definition should produce the same revision"
+
+    same.version = "1.0.1"
+    assert process.revision_hash != same.revision_hash, "updated version should produce a different revision"
+
+    package["baseCommand"] = "echo"  # redeploy with same ID/version but modified definition
+    redeploy = Process(id="test-revision-hash", processEndpointWPS1="blah", version="1.0.0", package=package)
+    assert process.revision_hash != redeploy.revision_hash, "redeploy should produce a different revision"
+
+
 def test_process_outputs_alt():
     """
     Validates handling of additional formats for output transform.
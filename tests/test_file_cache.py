@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+
+import mock
+
+from weaver.file_cache import FileCache, clone_file, get_file_cache
+
+
+def test_clone_file(tmpdir):
+    src_path = os.path.join(tmpdir, "src.txt")
+    dst_path = os.path.join(tmpdir, "dst.txt")
+    with open(src_path, mode="w", encoding="utf-8") as src_file:
+        src_file.write("data")
+    method = clone_file(src_path, dst_path)
+    assert method in ["reflink", "copy"], "hardlink must only be employed when explicitly allowed"
+    with open(dst_path, mode="r", encoding="utf-8") as dst_file:
+        assert dst_file.read() == "data"
+
+    os.remove(dst_path)
+    with mock.patch("weaver.file_cache.fcntl", None):
+        assert clone_file(src_path, dst_path, hardlink=True) == "hardlink"
+        assert os.path.samefile(src_path, dst_path)
+
+    os.remove(dst_path)
+    with mock.patch("weaver.file_cache.fcntl", None), mock.patch("os.link", side_effect=OSError("cross-device")):
+        assert clone_file(src_path, dst_path, hardlink=True) == "copy"
+
+
+def test_file_cache_store_dedup_and_link(tmpdir):
+    cache = FileCache(os.path.join(tmpdir, "cache"), max_size=1024)
+    entry_1 = cache.store("https://example.com/a.txt", "a.txt", [b"same", b"-data"], etag="\"1\"")
+    entry_2 = cache.store("https://mirror.com/b.txt", "b.txt", [b"same-data"], last_modified="today")
+    assert entry_1["digest"] == entry_2["digest"], "identical contents must be stored once"
+    assert cache.get("https://example.com/a.txt") == entry_1
+    assert cache.get("https://unknown.com/c.txt") is None
+    assert cache.validators(entry_1) == {"If-None-Match": "\"1\""}
+    assert cache.validators(entry_2) == {"If-Modified-Since": "today"}
+
+    out_dir = os.path.join(tmpdir, "out")
+    os.makedirs(out_dir)
+    out_path = cache.link(entry_2, out_dir)
+    assert out_path == os.path.join(out_dir, "b.txt")
+    with open(out_path, mode="rb") as out_file:
+        assert out_file.read() == b"same-data"
+
+
+def test_file_cache_evict_least_recently_used(tmpdir):
+    cache = FileCache(os.path.join(tmpdir, "cache"), max_size=10)
+    with mock.patch("weaver.file_cache.FILE_CACHE_EVICT_GRACE", -1):
+        entry_old = cache.store("https://example.com/old", "old", [b"0" * 6])
+        time.sleep(0.01)
+        entry_used = cache.store("https://example.com/used", "used", [b"1" * 4])
+        time.sleep(0.01)
+        assert cache.get("https://example.com/old")  # mark as recently used
+        time.sleep(0.01)
+        cache.store("https://example.com/new", "new", [b"2" * 4])
+    assert cache.get("https://example.com/old") == entry_old
+    assert cache.get("https://example.com/used") is None, "least recently used file should be evicted"
+    assert cache.link(entry_used, str(tmpdir)) is None, "evicted file cannot be linked anymore"
+    assert cache.get("https://example.com/new")
+
+
+def test_file_cache_use_preserves_linked_files(tmpdir):
+    cache = FileCache(os.path.join(tmpdir, "cache"), max_size=1024)
+    entry = cache.store("https://example.com/a.txt", "a.txt", [b"data"])
+    blob_path = cache._blob_path(entry["digest"])  # noqa: W0212
+    os.utime(blob_path, ns=(1_000_000_000, 1_000_000_000))  # distinguishable from any time set by operations
+    out_dir = os.path.join(tmpdir, "out")
+    os.makedirs(out_dir)
+    out_path = cache.link(entry, out_dir)
+    out_stat = os.stat(out_path)
+
+    time.sleep(0.01)
+    assert cache.get("https://example.com/a.txt") == entry
+    assert cache.link(entry, os.path.join(tmpdir)) == os.path.join(tmpdir, "a.txt")
+    assert os.stat(blob_path).st_mtime_ns == 1_000_000_000, "cached file shared by hardlinks must not be modified"
+    assert os.stat(out_path).st_mtime_ns == out_stat.st_mtime_ns, "linked file must not be modified by other uses"
+    assert os.stat(cache._stamp_path(entry["digest"])).st_mtime > 1, "use should be recorded by the stamp"  # noqa
+
+
+def test_file_cache_lock_serializes_url(tmpdir):
+    cache = get_file_cache(os.path.join(tmpdir, "cache"), 1024)
+    assert get_file_cache(os.path.join(tmpdir, "cache"), 1024) is cache
+    assert get_file_cache(None, 1024) is None
+    active = []
+    overlap = []
+
+    def locked_operation():
+        with cache.lock("https://example.com/file"):
+            active.append(1)
+            if len(active) > 1:
+                overlap.append(1)
+            time.sleep(0.05)
+            active.pop()
+
+    threads = [threading.Thread(target=locked_operation) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not overlap, "operations on the same URL should never overlap"
+
+
+def test_file_cache_evict_expired_and_link_unmodified(tmpdir):
+    cache = FileCache(os.path.join(tmpdir, "cache"), max_size=1024, max_age=60)
+    entry_old = cache.store("transform:old", "old.txt", [b"old"])
+    old_stamp = cache._stamp_path(entry_old["digest"])  # noqa: W0212
+    os.utime(old_stamp, (time.time() - 120, time.time() - 120))
+    old_mtime = os.stat(old_stamp).st_mtime_ns
+    assert cache.get("transform:old", touch=False) == entry_old
+    assert os.stat(old_stamp).st_mtime_ns == old_mtime, "cached file should not be marked as used"
+
+    out_dir = os.path.join(tmpdir, "out")
+    os.makedirs(out_dir)
+    out_path = cache.link(entry_old, out_dir)
+    out_stat = os.stat(out_path)
+    assert cache.link(entry_old, out_dir) == out_path
+    assert os.stat(out_path).st_mtime_ns == out_stat.st_mtime_ns, "already generated file should be unmodified"
+
+    os.utime(old_stamp, (time.time() - 120, time.time() - 120))
+    cache.store("transform:new", "new.txt", [b"new"])
+    assert cache.get("transform:old") is None, "cached file unused for longer than maximum age should be evicted"
+    assert cache.get("transform:new")
+
+
+def test_file_cache_locked(tmpdir):
+    cache = FileCache(os.path.join(tmpdir, "cache"), max_size=1024)
+    assert not cache.locked("https://example.com/file")
+    with cache.lock("https://example.com/file"):
+        assert cache.locked("https://example.com/file")
+        assert not cache.locked("https://example.com/other")
+    assert not cache.locked("https://example.com/file")
+
+
+def test_file_cache_locked_marker(tmpdir):
+    cache = FileCache(os.path.join(tmpdir, "cache"), max_size=1024)
+    with cache.lock("https://example.com/file"):
+        assert cache.locked("https://example.com/file")
+        assert not cache.locked("https://example.com/file", marker=True), "lock without marker should be ignored"
+    with cache.lock("https://example.com/file", marker=True):
+        assert cache.locked("https://example.com/file")
+        assert cache.locked("https://example.com/file", marker=True)
+    assert not cache.locked("https://example.com/file", marker=True)
+    assert not any(name.endswith(".marker") for name in os.listdir(cache.locks_dir)), "marker should be removed"
@@ -0,0 +1,95 @@
+import uuid
+from datetime import datetime, timedelta
+
+from beaker.cache import cache_managers
+from prometheus_client import generate_latest
+
+from weaver.metrics.utils import (
+    CACHE_HITS,
+    CACHE_MISSES,
+    JOB_DURATION,
+    JOB_QUEUE_WAIT,
+    JobStatusCollector,
+    MetricsCollection,
+    NoOpMetric,
+    cache_region,
+    get_metrics_collector,
+    observe_job_finished,
+    observe_job_started
+)
+from weaver.utils import invalidate_region, setup_cache
+
+
+def test_cache_region_hit_miss_counted():
+    setup_cache({"cache.request.enabled": "true", "cache.request.expire": "60"})
+    region = "request"
+    calls = []
+
+    @cache_region(region)
+    def _cached(value):
+        calls.append(value)
+        return value
+
+    misses = CACHE_MISSES.labels(region=region)._value.get()
+    hits = CACHE_HITS.labels(region=region)._value.get()
+    key = str(uuid.uuid4())
+    try:
+        assert _cached(key) == key
+        assert _cached(key) == key
+        assert calls == [key]
+        assert CACHE_MISSES.labels(region=region)._value.get() == misses + 1
+        assert CACHE_HITS.labels(region=region)._value.get() == hits + 1
+
+        invalidate_region((_cached, region, key))
+        assert _cached(key) == key
+        assert calls == [key, key], "invalidation should work through the metrics wrapper"
+    finally:
+        cache_managers.clear()
+
+
+def test_job_metrics_observed():
+    process = f"test-{uuid.uuid4()}"
+    created = datetime.now()
+    started = created + timedelta(seconds=2)
+    finished = started + timedelta(seconds=5)
+    observe_job_started(process, created, started)
+    observe_job_finished(process, "succeeded", started, finished)
+    observe_job_finished(process, "failed", None, finished)  # ignored
+    assert JOB_QUEUE_WAIT.labels(process=process)._sum.get() == 2
+    assert JOB_DURATION.labels(process=process, status="succeeded")._sum.get() == 5
+    assert JOB_DURATION.labels(process=process, status="failed")._sum.get() == 0
+
+
+def test_metrics_collection_job_status_and_cache_ratio():
+    class FakeCacheCollector(object):
+        @staticmethod
+        def collect():
+            for counter, value in [(CACHE_HITS, 3), (CACHE_MISSES, 1)]:
+                for metric in counter.collect():
+                    metric.samples = [
+                        sample._replace(labels={"region": "fake"}, value=value)
+                        for sample in metric.samples if sample.name.endswith("_total")
+                    ][:1]
+                    yield metric
+
+    collector = MetricsCollection(
+        FakeCacheCollector(),
+        JobStatusCollector(lambda: {"running": 2, "accepted": 1}),
+    )
+    text = generate_latest(collector).decode()
+    assert 'weaver_jobs{status="accepted"} 1.0' in text
+    assert 'weaver_jobs{status="running"} 2.0' in text
+    assert 'weaver_cache_hit_ratio{region="fake"} 0.75' in text
+
+
+def test_get_metrics_collector_process_metrics():
+    text = generate_latest(get_metrics_collector()).decode()
+    assert "weaver_request_duration_seconds" in text
+    assert "weaver_cache_hit_ratio" in text
+
+
+def test_noop_metric_ignores_observations():
+    metric = NoOpMetric("ignored", "Ignored metric.", labelnames=["region"])
+    assert metric.labels(region="any") is metric
+    assert metric.inc(2) is None
+    assert metric.observe(1.5) is None
@@ -0,0 +1,125 @@
+import datetime
+import json
+import time
+import uuid
+
+import pytest
+from box import Box
+from pyramid import testing
+from pyramid.renderers import render, render_to_response
+
+from weaver.formats import OutputFormat, json_default_handler
+from weaver.renderers import JSON_RENDERER_DEFAULT, JSON_RENDERER_FAST, get_json_renderer, json_dumps_fast
+
+
+def make_jobs_payload(count):
+    created = datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc)
+    jobs = [
+        {
+            "jobID": str(uuid.UUID(int=i)),
+            "processID": "jsonarray2netcdf",
+            "type": "process",
+            "status": "successful",
+            "message": "Job succeeded. Résultats disponibles.",
+            "created": created + datetime.timedelta(minutes=i),
+            "started": (created + datetime.timedelta(minutes=i)).date(),
+            "progress": 100,
+            "duration": 12.5,
+            "links": [
+                {"href": f"https://localhost/jobs/{uuid.UUID(int=i)}/{rel}", "rel": rel, "type": "application/json"}
+                for rel in ["status", "results", "logs", "inputs", "outputs"]
+            ],
+        }
+        for i in range(count)
+    ]
+    return Box({"jobs": jobs, "total": count, "page": 0, "limit": count, "links": []})
+
+
+@pytest.fixture(name="fast_renderer")
+def make_fast_renderer():
+    config = testing.setUp(settings={"weaver.json_renderer": JSON_RENDERER_FAST})
+    config.include("weaver.renderers")
+    config.commit()
+    yield config
+    testing.tearDown()
+
+
+@pytest.mark.parametrize(
+    ["renderer", "expect"],
+    [
+        (None, JSON_RENDERER_DEFAULT),
+        ("json", JSON_RENDERER_DEFAULT),
+        ("unknown", JSON_RENDERER_DEFAULT),
+        ("orjson", JSON_RENDERER_FAST),
+        (" ORJSON ", JSON_RENDERER_FAST),
+    ]
+)
+def test_get_json_renderer(renderer, expect):
+    assert get_json_renderer({"weaver.json_renderer": renderer}) == expect
+
+
+def test_json_dumps_fast_matches_json():
+    data = make_jobs_payload(3)
+    data["extra"] = {1: "non-string key", "big": 2 ** 70, "nested": [None, True, 1.5]}
+    result = json_dumps_fast(data)
+    assert isinstance(result, bytes)
+    assert json.loads(result) == json.loads(json.dumps(data, default=json_default_handler))
+    del data["extra"]["big"]  # above 64 bits, serialized by 'json' instead of 'orjson'
+    assert json.loads(json_dumps_fast(data)) == json.loads(json.dumps(data, default=json_default_handler))
+
+
+def test_json_dumps_fast_default_handlers():
+    class Adapted(object):
+        def __json__(self, request):
+            return {"adapted": True}
+
+    def default(obj):
+        if isinstance(obj, Adapted):
+            return obj.__json__(None)
+        raise TypeError
+
+    when = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    result = json_dumps_fast({"obj": Adapted(), "when": when}, default=default)
+    assert json.loads(result) == {"obj": {"adapted": True}, "when": when.isoformat()}
+    with pytest.raises(TypeError):
+        json_dumps_fast({"obj": object()}, default=default)
+
+
+def test_fast_renderer_registered(fast_renderer):  # pylint: disable=W0613
+    class Adapted(object):
+        def __json__(self, request):
+            return "adapted"
+
+    data = make_jobs_payload(2)
+    data["adapted"] = Adapted()
+    resp = render_to_response(OutputFormat.JSON, data, request=testing.DummyRequest())
+    assert resp.content_type == "application/json"
+    assert json.loads(resp.text) == json.loads(json.dumps(data, default=lambda obj: (
+        "adapted" if isinstance(obj, Adapted) else json_default_handler(obj)
+    )))
+    assert "Résultats" in resp.text, "characters should not be escaped by the fast renderer"
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_fast_renderer_benchmark(fast_renderer):  # pylint: disable=W0613
+    """
+    Report the duration of the fast renderer against the default :mod:`json` serialization of a large listing.
+
+    Timings are only reported, since they depend on concurrent load of the machine running the test suite.
+    """
+    data = make_jobs_payload(1000)
+    repeat = 20
+
+    timer = time.perf_counter()
+    for _ in range(repeat):
+        expect = json.dumps(data, default=json_default_handler)
+    reference = time.perf_counter() - timer
+
+    timer = time.perf_counter()
+    for _ in range(repeat):
+        result = render(OutputFormat.JSON, data)
+    fast = time.perf_counter() - timer
+
+    assert json.loads(result) == json.loads(expect)
+    print(f"Fast renderer: {fast:.3f}s, default JSON serialization: {reference:.3f}s ({reference / fast:.2f}x).")
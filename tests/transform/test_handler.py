@@ -1,15 +1,19 @@
 import os
 import shutil
+import tarfile
 import tempfile
+import threading
 
+import mock
 import pytest
+from PIL import Image
 from pyramid.httpexceptions import HTTPUnprocessableEntity
 from pyramid.response import FileResponse
 
 from tests.resources import TRANSFORM_PATH
 from weaver.formats import ContentType, get_content_type
 from weaver.transform.const import CONVERSION_DICT
-from weaver.transform.handlers import Transform
+from weaver.transform.handlers import Transform, get_transform_cache, get_transform_image_max_size, images_to_any
 
 
 def using_mimes(func):
@@ -59,7 +63,6 @@ def test_unsupported_conversions(file_ext, content, current_type, wanted_type):
 
 
 def test_unsupported_image_conversion():
-    from PIL import Image
     with tempfile.TemporaryDirectory() as tmp_path:
         png_file = os.path.join(tmp_path, "test.png")
         img = Image.new('RGB', (100, 100), color='red')
@@ -141,3 +144,122 @@ def test_csv_with_empty_headers():
         result = trans.get()
         assert isinstance(result, FileResponse)
         assert os.path.exists(trans.output_path)
+
+
+def test_transform_cache_default_not_served(tmpdir):
+    settings = {
+        "weaver.wps_output_dir": os.path.join(tmpdir, "wpsoutputs"),
+        "weaver.wps_workdir": os.path.join(tmpdir, "workdir"),
+    }
+    cache = get_transform_cache(settings)
+    assert cache.path.startswith(settings["weaver.wps_workdir"])
+    assert not os.path.exists(settings["weaver.wps_output_dir"]), "cache must not be under the served directory"
+
+
+@pytest.mark.parametrize(
+    ["value", "expect"],
+    [
+        (None, None),
+        ("0", None),
+        ("invalid", None),
+        ("512", 512),
+        (256, 256),
+    ]
+)
+def test_get_transform_image_max_size(value, expect):
+    assert get_transform_image_max_size({"weaver.transform_image_max_size": value}) == expect
+
+
+def test_transform_geotiff_image_max_size(tmpdir):
+    tif_file = os.path.join(tmpdir, "wildfires.tif")
+    shutil.copy(os.path.join(TRANSFORM_PATH, "wildfires.tif"), tif_file)
+    settings = {"weaver.transform_image_max_size": "64"}
+    trans = Transform(tif_file, ContentType.IMAGE_GEOTIFF, ContentType.IMAGE_PNG, settings=settings)
+    trans.get()
+    with Image.open(trans.output_path) as img:
+        assert max(img.size) == 64
+
+
+def test_transform_cached(tmpdir):
+    settings = {"weaver.transform_cache_dir": os.path.join(tmpdir, "cache")}
+    txt_file = os.path.join(tmpdir, "test.txt")
+    with open(txt_file, "w", encoding="utf-8") as f:
+        f.write("test content")
+
+    def transform_html():
+        trans = Transform(txt_file, ContentType.TEXT_PLAIN, ContentType.TEXT_HTML, settings=settings)
+        trans.get()
+        return trans.output_path
+
+    with mock.patch.object(Transform, "process", side_effect=Transform.process, autospec=True) as mock_process:
+        threads = [threading.Thread(target=transform_html) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert mock_process.call_count == 1, "concurrent requests should wait for a single transformation"
+
+        html_file = transform_html()
+        html_stat = os.stat(html_file)
+        assert transform_html() == html_file
+        assert mock_process.call_count == 1, "repeated requests should reuse the cached transformation"
+        assert os.stat(html_file).st_mtime_ns == html_stat.st_mtime_ns, "transformed file should be served directly"
+
+        os.remove(html_file)
+        assert transform_html() == html_file
+        assert mock_process.call_count == 1, "removed transformed file should be generated from the cache"
+
+        with open(txt_file, "w", encoding="utf-8") as f:
+            f.write("modified content")
+        html_file = transform_html()
+        assert mock_process.call_count == 2, "modified source should be transformed again"
+        with open(html_file, "r", encoding="utf-8") as f:
+            assert "modified content" in f.read()
+
+
+def test_transform_pending(tmpdir):
+    txt_file = os.path.join(tmpdir, "test.txt")
+    with open(txt_file, "w", encoding="utf-8") as f:
+        f.write("test content")
+
+    trans = Transform(txt_file, ContentType.TEXT_PLAIN, ContentType.TEXT_HTML)
+    assert not trans.pending(), "pending state cannot be known without cache"
+
+    settings = {"weaver.transform_cache_dir": os.path.join(tmpdir, "cache")}
+    trans = Transform(txt_file, ContentType.TEXT_PLAIN, ContentType.TEXT_HTML, settings=settings)
+    assert not trans.pending()
+    with trans.cache.lock(trans._cache_key()):  # noqa: W0212  # simulate concurrent on demand request
+        assert not trans.pending(), "concurrent on demand conversion should be waited for instead"
+    with trans.cache.lock(trans._cache_key(), marker=True):  # noqa: W0212  # simulate concurrent worker precompute
+        assert trans.pending()
+    trans.get()
+    assert not trans.pending()
+    assert os.path.isfile(trans.output_path)
+
+
+def test_images_to_any_streamed_archive(tmpdir):
+    events = []
+
+    def make_images():
+        for color in ["red", "green", "blue"]:
+            events.append("load")
+            yield Image.new("RGB", (4, 4), color)
+
+    def tar_add(tar, name, *_, **__):
+        events.append("add")
+        return tar_add_orig(tar, name, *_, **__)
+
+    out_path = os.path.join(tmpdir, "result.png")
+    tar_add_orig = tarfile.TarFile.add
+    with mock.patch.object(tarfile.TarFile, "add", side_effect=tar_add, autospec=True):
+        images_to_any(make_images(), out_path)
+    assert events == ["load", "load", "add", "add", "load", "add"], "images should be archived as they are loaded"
+    assert not os.path.exists(out_path)
+    with tarfile.open(f"{out_path}.tar.gz", "r:gz") as tar:
+        assert [name.split(".", 1)[0] for name in tar.getnames()] == ["0000", "0001", "0002"]
+        assert all(name.endswith(".png") for name in tar.getnames())
+        colors = [Image.open(tar.extractfile(name)).convert("RGB").getpixel((0, 0)) for name in tar.getnames()]
+    assert colors == [(255, 0, 0), (0, 128, 0), (0, 0, 255)]
+
+    images_to_any(iter([Image.new("RGB", (4, 4), "red")]), out_path)
+    assert os.path.isfile(out_path), "single image should be written directly without archive"
@@ -0,0 +1,143 @@
+import re
+import time
+from io import StringIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from weaver.transform.png2svg import add_tuple, joined_edges, rgba_image_to_svg_contiguous, svg_header
+
+
+def rgba_image_to_svg_contiguous_pixels(img, opaque=None, keep_every_point=False):
+    """
+    Reference implementation visiting every pixel individually, used to validate the vectorized conversion.
+    """
+    adjacent = ((1, 0), (0, 1), (-1, 0), (0, -1))
+    visited = set()
+    color_pixel_lists = {}
+    width, height = img.size
+    for x in range(width):
+        for y in range(height):
+            here = (x, y)
+            if here in visited:
+                continue
+            rgba = img.getpixel(here)
+            if opaque and not rgba[3]:
+                continue
+            piece = []
+            queue = [here]
+            visited.add(here)
+            while queue:
+                here = queue.pop()
+                for offset in adjacent:
+                    neighbour = add_tuple(here, offset)
+                    if not 0 <= neighbour[0] < width or not 0 <= neighbour[1] < height:
+                        continue
+                    if neighbour in visited or img.getpixel(neighbour) != rgba:
+                        continue
+                    queue.append(neighbour)
+                    visited.add(neighbour)
+                piece.append(here)
+            color_pixel_lists.setdefault(rgba, []).append(piece)
+
+    edges = {
+        (-1, 0): ((0, 0), (0, 1)),
+        (0, 1): ((0, 1), (1, 1)),
+        (1, 0): ((1, 1), (1, 0)),
+        (0, -1): ((1, 0), (0, 0)),
+    }
+    svg = StringIO()
+    svg.write(svg_header(width, height))
+    for color, pieces in color_pixel_lists.items():
+        for piece in pieces:
+            pixels = set(piece)
+            edge_set = set()
+            for coord in piece:
+                for offset, (start_offset, end_offset) in edges.items():
+                    if add_tuple(coord, offset) not in pixels:
+                        edge_set.add((add_tuple(coord, start_offset), add_tuple(coord, end_offset)))
+            svg.write(""" <path d=" """)
+            for sub_shape in joined_edges(edge_set, keep_every_point):
+                here = sub_shape.pop(0)[0]
+                svg.write(f" M {here[0]},{here[1]} ")
+                for edge in sub_shape:
+                    svg.write(f" L {edge[0][0]},{edge[0][1]} ")
+                svg.write(" Z ")
+            svg.write(
+                f""" " style="fill:rgb{color[0:3]}; fill-opacity:{float(color[3]) / 255:.3f}; stroke:none;" />\n""")
+    svg.write("""</svg>\n""")
+    return svg.getvalue()
+
+
+def svg_path_edges(svg):
+    """
+    Obtains the style and unit-length edges of every path, regardless of the starting point and joining of edges.
+    """
+    paths = []
+    for path, style in re.findall(r'<path d="(.*?)" style="(.*?)"', svg):
+        edges = set()
+        for sub_path in path.split("Z"):
+            points = [tuple(map(int, point.split(","))) for point in re.findall(r"\d+,\d+", sub_path)]
+            for start, end in zip(points, points[1:] + points[:1]):
+                step = (int(np.sign(end[0] - start[0])), int(np.sign(end[1] - start[1])))
+                while start != end:
+                    edges.add((start, add_tuple(start, step)))
+                    start = add_tuple(start, step)
+        paths.append((style, edges))
+    return paths
+
+
+def make_blocks_image(width, height, block, colors, seed=0):
+    rng = np.random.default_rng(seed)
+    palette = rng.integers(0, 256, (colors, 4), dtype=np.uint8)
+    pixels = palette[rng.integers(0, colors, (height // block + 1, width // block + 1))]
+    pixels = pixels.repeat(block, axis=0).repeat(block, axis=1)[:height, :width]
+    return Image.fromarray(np.ascontiguousarray(pixels), "RGBA")
+
+
+def test_rgba_image_to_svg_contiguous_shapes():
+    pixels = np.zeros((4, 4, 4), dtype=np.uint8)
+    pixels[:, :, 3] = 255
+    pixels[1:3, 1:3] = [255, 0, 0, 128]
+    svg = rgba_image_to_svg_contiguous(Image.fromarray(pixels, "RGBA"))
+    paths = re.findall(r'<path d="(.*?)" style="(.*?)"', svg)
+    assert len(paths) == 2
+    assert paths[0][0].split("Z")[:2] == ["  M 0,0  L 0,4  L 4,4  L 4,0  ", "  M 3,1  L 3,3  L 1,3  L 1,1  "]
+    assert paths[0][1] == "fill:rgb(0, 0, 0); fill-opacity:1.000; stroke:none;"
+    assert paths[1][0].split("Z")[0] == "  M 1,1  L 1,3  L 3,3  L 3,1  "
+    assert paths[1][1] == "fill:rgb(255, 0, 0); fill-opacity:0.502; stroke:none;"
+
+
+@pytest.mark.parametrize("opaque", [None, True])
+@pytest.mark.parametrize("keep_every_point", [False, True])
+@pytest.mark.parametrize("seed", range(10))
+def test_rgba_image_to_svg_contiguous_matches_pixels(seed, opaque, keep_every_point):
+    rng = np.random.default_rng(seed)
+    img = make_blocks_image(*rng.integers(1, 16, 2), block=int(rng.integers(1, 4)), colors=3, seed=seed)
+    expect = rgba_image_to_svg_contiguous_pixels(img, opaque=opaque, keep_every_point=keep_every_point)
+    result = rgba_image_to_svg_contiguous(img, opaque=opaque, keep_every_point=keep_every_point)
+    assert svg_path_edges(result) == svg_path_edges(expect)
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_rgba_image_to_svg_contiguous_benchmark():
+    """
+    Compare the duration of the vectorized conversion against the reference visiting every pixel, for the same output.
+    """
+    img = make_blocks_image(200, 150, block=4, colors=4)
+
+    timer = time.perf_counter()
+    expect = rgba_image_to_svg_contiguous_pixels(img)
+    reference = time.perf_counter() - timer
+
+    timer = time.perf_counter()
+    result = rgba_image_to_svg_contiguous(img)
+    vectorized = time.perf_counter() - timer
+
+    assert svg_path_edges(result) == svg_path_edges(expect)
+    assert vectorized < reference, (
+        f"Vectorized conversion ({vectorized:.3f}s) should be faster than "
+        f"visiting every pixel ({reference:.3f}s)."
+    )
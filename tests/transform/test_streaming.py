@@ -0,0 +1,107 @@
+import json
+import os
+
+import mock
+import pytest
+import yaml
+
+from tests.resources import TRANSFORM_PATH
+from weaver.formats import ContentType
+from weaver.transform import handlers
+from weaver.transform.streaming import StreamUnsupportedError, stream_convert
+
+CSV_CONTENT = "a,b,\n1,x y,3\n2,\"q,\"\"z\",4\n"
+JSON_LIST = [{"a": 1, "b": [1, 2], "c": {"d": "é"}}, {"a": None, "e": True, "f": 1.5}, {"a": "s"}]
+JSON_DICT = {"x": 1, "y": [1, {"z": 2}], "1": "k"}
+JSON_NUMBERS = [
+    {"a": 1, "b": 1, "c": 1.0, "d": True, "e": 2 ** 63, "f": 1, "g": float("nan")},
+    {"a": None, "b": 2.5, "c": 2, "d": None, "e": None, "f": "x", "h": 3},
+    {"b": 1e20, "c": 0.1, "e": 1, "g": 2},
+]
+YAML_DICT = "x: 1\ny:\n  - 1\n  - z: 2\nw: &a {k: v}\nv: *a\n"
+XML_MIXED = "<r a=\"1\"><t>x</t><b><n>1</n></b><b><n>2</n></b><c/></r>"
+
+
+@pytest.fixture(name="files")
+def make_files(tmpdir):
+    files = {
+        "csv": ("test.csv", CSV_CONTENT),
+        "json_list": ("list.json", json.dumps(JSON_LIST)),
+        "json_dict": ("dict.json", json.dumps(JSON_DICT)),
+        "json_numbers": ("numbers.json", json.dumps(JSON_NUMBERS)),
+        "yaml_dict": ("dict.yaml", YAML_DICT),
+        "xml_mixed": ("mixed.xml", XML_MIXED),
+    }
+    paths = {"xml_books": os.path.join(TRANSFORM_PATH, "test-books.xml")}
+    for name, (file_name, content) in files.items():
+        paths[name] = os.path.join(tmpdir, file_name)
+        with open(paths[name], mode="w", encoding="utf-8") as file:
+            file.write(content)
+    return paths
+
+
+@pytest.mark.parametrize(
+    ["source", "current_media_type", "wanted_media_type", "converter"],
+    [
+        ("csv", ContentType.TEXT_CSV, ContentType.APP_JSON, handlers.csv_to_json),
+        ("csv", ContentType.TEXT_CSV, ContentType.APP_YAML, handlers.csv_to_yaml),
+        ("csv", ContentType.TEXT_CSV, ContentType.APP_XML, handlers.csv_to_xml),
+        ("json_list", ContentType.APP_JSON, ContentType.APP_YAML, handlers.json_to_yaml),
+        ("json_list", ContentType.APP_JSON, ContentType.APP_XML, handlers.json_to_xml),
+        ("json_list", ContentType.APP_JSON, ContentType.TEXT_CSV, handlers.json_to_csv),
+        ("json_numbers", ContentType.APP_JSON, ContentType.TEXT_CSV, handlers.json_to_csv),
+        ("json_dict", ContentType.APP_JSON, ContentType.APP_YAML, handlers.json_to_yaml),
+        ("json_dict", ContentType.APP_JSON, ContentType.APP_XML, handlers.json_to_xml),
+        ("yaml_dict", ContentType.APP_YAML, ContentType.APP_JSON, handlers.yaml_to_json),
+        ("yaml_dict", ContentType.APP_YAML, ContentType.APP_XML, handlers.yaml_to_xml),
+        ("xml_books", ContentType.APP_XML, ContentType.APP_JSON, handlers.xml_to_json),
+        ("xml_books", ContentType.APP_XML, ContentType.APP_YAML, handlers.xml_to_yaml),
+        ("xml_mixed", ContentType.APP_XML, ContentType.APP_JSON, handlers.xml_to_json),
+        ("xml_mixed", ContentType.APP_XML, ContentType.APP_YAML, handlers.xml_to_yaml),
+    ]
+)
+def test_stream_convert_matches_in_memory(files, tmpdir, source, current_media_type, wanted_media_type, converter):
+    expect_path = os.path.join(tmpdir, "expect.out")
+    result_path = os.path.join(tmpdir, "result.out")
+    converter(files[source], expect_path)
+    with mock.patch("weaver.transform.streaming.STREAM_CHUNK_SIZE", 4):  # values split across chunks
+        assert stream_convert(files[source], result_path, current_media_type, wanted_media_type)
+    with open(expect_path, mode="r", encoding="utf-8") as expect_file:
+        with open(result_path, mode="r", encoding="utf-8") as result_file:
+            assert result_file.read() == expect_file.read()
+
+
+def test_stream_convert_unsupported(files, tmpdir):
+    out_path = os.path.join(tmpdir, "result.out")
+    xml_path = os.path.join(tmpdir, "split.xml")
+    with open(xml_path, mode="w", encoding="utf-8") as xml_file:
+        xml_file.write("<r><b>1</b><c/><b>2</b></r>")
+    with pytest.raises(StreamUnsupportedError):
+        stream_convert(xml_path, out_path, ContentType.APP_XML, ContentType.APP_JSON)
+    with pytest.raises(StreamUnsupportedError):
+        stream_convert(files["json_dict"], out_path, ContentType.APP_JSON, ContentType.TEXT_CSV)
+    assert not stream_convert(files["csv"], out_path, ContentType.TEXT_CSV, ContentType.TEXT_CSV)
+    assert not stream_convert(files["csv"], out_path, ContentType.TEXT_CSV, ContentType.IMAGE_PNG)
+
+
+def test_transform_stream_threshold(files, tmpdir):
+    yaml_path = os.path.join(tmpdir, "list.yaml")
+    with open(yaml_path, mode="w", encoding="utf-8") as yaml_file:
+        yaml.safe_dump(JSON_LIST, yaml_file)
+
+    settings = {"weaver.transform_stream_threshold": "0"}
+    trans = handlers.Transform(yaml_path, ContentType.APP_YAML, ContentType.APP_JSON, settings=settings)
+    with mock.patch.object(trans, "process_yaml", side_effect=AssertionError("should be streamed")):
+        trans.process()
+    with open(trans.output_path, mode="r", encoding="utf-8") as json_file:
+        assert json.load(json_file) == JSON_LIST
+
+    trans = handlers.Transform(files["json_dict"], ContentType.APP_JSON, ContentType.TEXT_CSV, settings=settings)
+    with mock.patch.object(trans, "process_json", wraps=trans.process_json) as mock_process:
+        trans.process()
+    assert mock_process.called, "unsupported streamed structure should use in-memory conversion"
+
+    trans = handlers.Transform(files["csv"], ContentType.TEXT_CSV, ContentType.APP_JSON)
+    with mock.patch("weaver.transform.handlers.stream_convert", side_effect=AssertionError("not above threshold")):
+        trans.process()
+    assert os.path.isfile(trans.output_path)
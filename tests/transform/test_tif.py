@@ -1,5 +1,6 @@
 import os
 
+import mock
 import numpy as np
 from PIL import Image
 
@@ -127,3 +128,79 @@ def test_multipage_detection():
     images = tiff_multi.get_images()
     assert isinstance(images, list), "get_images should return a list"
     assert len(images) > 0, "get_images should return at least one image"
+
+
+def test_get_images_geotiff_windows():
+    """
+    Test that full resolution conversion by windows gives the same image as normalizing complete bands.
+    """
+    tiff = Tiff(WILDFIRES_TIF_PATH)
+    expect = (np.dstack([normalize_band(tiff.get_band(idx)) for idx in tiff.range]) * 255).astype(np.uint8)
+    with mock.patch("weaver.transform.tiff.TIFF_WINDOW_PIXELS", tiff.width * 20):
+        windows = tiff.windows()
+        images = tiff.get_images()
+    assert len(windows) > 1, "test requires multiple windows to validate statistics across them"
+    assert sum(window.height for window in windows) == tiff.height
+    assert all(window.height % tiff.dataset.block_shapes[0][0] == 0 for window in windows[:-1])
+    assert np.array_equal(np.asarray(images[0]), expect)
+
+
+def test_get_images_geotiff_preview():
+    """
+    Test getting a decimated preview of a GeoTIFF bounded by the requested size.
+    """
+    tiff = Tiff(WILDFIRES_TIF_PATH)
+    with mock.patch.object(tiff, "get_image", side_effect=AssertionError("full resolution should not be read")):
+        images = tiff.get_images(max_size=50)
+    assert len(images) == 1
+    assert images[0].size == (50, round(tiff.height * 50 / tiff.width))
+    preview = np.asarray(images[0])
+    assert preview.min() == 0 and preview.max() == 255, "preview should be normalized with its own statistics"
+
+    images = tiff.get_images(max_size=max(tiff.width, tiff.height) + 10)
+    assert images[0].size == (tiff.width, tiff.height), "preview larger than image should use full resolution"
+
+
+def test_get_image_geotiff_windows():
+    """
+    Test that the full resolution image written by windows matches the array of the complete bands.
+    """
+    tiff = Tiff(WILDFIRES_TIF_PATH)
+    with mock.patch("weaver.transform.tiff.TIFF_WINDOW_PIXELS", tiff.width * 20):
+        expect = tiff.get_array(list(tiff.range))
+        image = tiff.get_image(list(tiff.range))
+        band = tiff.get_image([1])
+    assert image.mode == "RGB"
+    assert np.array_equal(np.asarray(image), expect)
+    assert band.mode == "L"
+    assert np.array_equal(np.asarray(band), expect[:, :, 0])
+
+
+def test_get_statistics_geotiff_metadata():
+    """
+    Test that band statistics stored in the GeoTIFF metadata are employed instead of reading the bands.
+    """
+    tiff = Tiff(WILDFIRES_TIF_PATH)
+    expect = [(float(tiff.get_band(idx).min()), float(tiff.get_band(idx).max())) for idx in tiff.range]
+    assert tiff.get_statistics(list(tiff.range)) == expect
+
+    tags = {"STATISTICS_MINIMUM": "1", "STATISTICS_MAXIMUM": "10"}
+    with mock.patch.object(tiff.dataset, "tags", return_value=tags), \
+         mock.patch.object(tiff.dataset, "read", side_effect=AssertionError("bands should not be read")):
+        assert tiff.get_statistics([1, 2]) == [(1.0, 10.0), (1.0, 10.0)]
+
+
+def test_iter_images_multi_tif_lazy():
+    """
+    Test that pages of a multi-page TIFF are loaded one at a time, matching the complete stack.
+    """
+    with mock.patch("weaver.transform.tiff.mtif.read_stack", side_effect=AssertionError("stack should not be read")):
+        tiff = Tiff(MULTI_TIF_PATH)
+        assert not tiff.is_geotiff
+        pages = tiff.iter_images()
+        first = next(pages)
+        assert isinstance(first, Image.Image)
+        images = [first, *pages]
+    assert len(images) == tiff.nb_pages
+    for image, page in zip(images, tiff.images.pages):
+        assert np.array_equal(np.asarray(image), page)
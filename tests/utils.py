@@ -56,6 +56,7 @@ from weaver.utils import (
     get_weaver_url,
     null,
     request_extra,
+    reset_s3_clients,
     str2bytes
 )
 from weaver.wps.utils import get_wps_output_dir, get_wps_output_url, load_pywps_config
@@ -1367,8 +1368,12 @@ def mocked_aws_s3(test_func):
             mock_aws_s3 = moto.mock_aws  # pylint: disable=E1101,no-member
         else:
             mock_aws_s3 = moto.mock_s3  # pylint: disable=E1101,no-member
-        with mock_aws_s3():
-            return test_func(*args, **kwargs)
+        reset_s3_clients()  # avoid reusing clients created outside the mocked credentials and endpoints
+        try:
+            with mock_aws_s3():
+                return test_func(*args, **kwargs)
+        finally:
+            reset_s3_clients()
     return wrapped
 
 
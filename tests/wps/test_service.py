@@ -0,0 +1,34 @@
+import contextlib
+
+import mock
+
+from weaver.datatype import Process
+from weaver.processes.wps_default import HelloWPS
+from weaver.utils import reset_cache, setup_cache
+from weaver.wps.service import WorkerService, get_pywps_worker_service
+
+
+def test_get_pywps_worker_service_cached_by_revision():
+    package = {"cwlVersion": "v1.2", "class": "CommandLineTool", "inputs": {}, "outputs": {}}
+    process = Process(id=HelloWPS.identifier, processEndpointWPS1="blah", version="1.0.0", package=package)
+    setup_cache({})
+    try:
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(mock.patch("weaver.wps.service.get_settings", return_value={}))
+            mock_wps = stack.enter_context(mock.patch.object(Process, "wps", side_effect=lambda *_, **__: HelloWPS()))
+
+            service = get_pywps_worker_service(process)
+            assert isinstance(service, WorkerService)
+            assert service.is_worker
+            assert list(service.processes) == [HelloWPS.identifier]
+            assert get_pywps_worker_service(process) is service, "same revision should reuse the loaded service"
+            same = Process(**dict(process))
+            assert get_pywps_worker_service(same) is service, "other instance of same revision should reuse it"
+            assert mock_wps.call_count == 1
+
+            process.version = "1.0.1"  # redeployed/updated process
+            updated = get_pywps_worker_service(process)
+            assert updated is not service, "updated revision should load a new service"
+            assert mock_wps.call_count == 2
+    finally:
+        reset_cache()
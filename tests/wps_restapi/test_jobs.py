@@ -16,6 +16,7 @@ import pytest
 from dateutil import parser as date_parser
 from parameterized import parameterized
 from pyramid.httpexceptions import HTTPBadRequest, HTTPCreated, HTTPInternalServerError
+from pyramid.request import Request
 
 from tests.functional.utils import JobUtils
 from tests.resources import load_example
@@ -48,12 +49,18 @@ from weaver.notify import decrypt_email
 from weaver.processes.constants import JobInputsOutputsSchema, JobStatusProfileSchema, JobStatusType
 from weaver.processes.wps_testing import WpsTestProcess
 from weaver.status import JOB_STATUS_CATEGORIES, Status, StatusCategory
-from weaver.utils import compute_file_digest_multibase, explode_headers, get_path_kvp, now
+from weaver.utils import compute_file_digest_multibase, explode_headers, get_href_headers, get_path_kvp, now
 from weaver.visibility import Visibility
 from weaver.warning import TimeZoneInfoAlreadySetWarning
 from weaver.wps.utils import get_wps_output_url
 from weaver.wps_restapi import swagger_definitions as sd
-from weaver.wps_restapi.jobs.utils import get_job_results_document, get_job_status_schema, get_results
+from weaver.wps_restapi.jobs.utils import (
+    get_job_results_document,
+    get_job_results_multipart,
+    get_job_status_schema,
+    get_results,
+    make_result_file_response
+)
 from weaver.wps_restapi.swagger_definitions import (
     DATETIME_INTERVAL_CLOSED_SYMBOL,
     DATETIME_INTERVAL_OPEN_END_SYMBOL,
@@ -664,6 +671,21 @@ class WpsRestApiJobsTest(JobUtils):
         assert resp.json["total"] == 1, "Should match exactly 1 email with specified literal string as query param."
         assert resp.json["jobs"][0]["jobID"] == job_id
 
+    def test_append_job_logs_preserves_other_fields(self):
+        job = self.job_store.fetch_by_id(self.job_info[0].id)
+        logs_count = len(job.logs)
+        job.save_log(message="Generated result representation.")
+        other = self.job_store.fetch_by_id(job.id)
+        other.tags = ["modified"]
+        self.job_store.update_job(other)
+
+        assert self.job_store.append_job_logs(job.id, job.logs[logs_count:])
+        assert not self.job_store.append_job_logs(job.id, [])
+        updated = self.job_store.fetch_by_id(job.id)
+        assert updated.tags == ["modified"], "job modified after fetching it should not be overwritten"
+        assert len(updated.logs) == logs_count + 1
+        assert "Generated result representation." in updated.logs[-1]
+
     @pytest.mark.oap_part1
     def test_get_jobs_by_type_process(self):
         path = get_path_kvp(sd.jobs_service.path, type="process")
@@ -4337,3 +4359,120 @@ def test_get_job_status_profile_valid(accept_profile, query_profile, expected_pr
     request = MockedRequest(params=queries, headers=headers)
     profile, _ = get_job_status_schema(request)
     assert profile == expected_profile
+
+
+def test_get_job_results_multipart_streamed(tmpdir):
+    """
+    Validate that multipart results are streamed by chunks instead of being loaded entirely in memory.
+    """
+    job = Job(task_id="test", id="11111111-2222-3333-4444-555555555555")
+    file_path = os.path.join(tmpdir, "data.bin")
+    with open(file_path, mode="wb") as file:
+        file.write(os.urandom(300 * 1024))
+    streams = []
+
+    def mock_result(_job, _result, result_id, *_, **__):
+        stream = open(file_path, mode="rb")  # pylint: disable=R1732  # closed by streamed response
+        streams.append(stream)
+        headers = {"Content-Type": ContentType.APP_OCTET_STREAM, "Content-ID": f"<{result_id}@{_job.id}>"}
+        return headers, stream
+
+    results = {"single": {"href": file_path}, "array": [{"href": file_path}, {"href": file_path}]}
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch("weaver.wps_restapi.jobs.utils.generate_or_resolve_result",
+                                       side_effect=mock_result))
+        stack.enter_context(mock.patch("weaver.wps_restapi.jobs.utils.get_job_output_transmission",
+                                       return_value=(ExecuteTransmissionMode.VALUE, None)))
+        resp = get_job_results_multipart(job, results, headers={}, settings={})
+
+    assert not isinstance(resp.app_iter, list), "response should not be pre-loaded in memory"
+    assert len(streams) == 3, "nested array items should be resolved as distinct parts"
+    assert all(not stream.closed for stream in streams)
+    chunks = list(resp.app_iter)
+    assert len(chunks) > 1
+    body = b"".join(chunks)
+    assert resp.content_length == len(body)
+    assert body.count(b"Content-ID: <array.1@") == 1
+    assert all(stream.closed for stream in streams), "file parts should be closed once streamed"
+
+
+@pytest.mark.parametrize(
+    ["offload", "in_output_dir", "expect_header", "expect_value"],
+    [
+        (None, True, None, None),
+        ("x-accel-redirect", True, "X-Accel-Redirect", "/internal/job/out%20file.bin"),
+        ("x-sendfile", True, "X-Sendfile", "{out_dir}/job/out file.bin"),
+        ("x-accel-redirect", False, None, None),  # cannot offload outside WPS outputs
+    ]
+)
+def test_make_result_file_response_offload(tmpdir, offload, in_output_dir, expect_header, expect_value):
+    out_dir = os.path.join(tmpdir, "outputs")
+    file_dir = os.path.join(out_dir, "job") if in_output_dir else os.path.join(tmpdir, "other")
+    file_path = os.path.join(file_dir, "out file.bin")
+    os.makedirs(file_dir)
+    data = os.urandom(1024)
+    with open(file_path, mode="wb") as file:
+        file.write(data)
+    settings = {
+        "weaver.wps_output_dir": out_dir,
+        "weaver.wps_output_file_offload": offload,
+        "weaver.wps_output_file_offload_path": "/internal/",
+    }
+    headers = {"Content-Disposition": "attachment; filename=\"out file.bin\"", "Content-Length": "1"}
+    resp = make_result_file_response(file_path, ContentType.APP_OCTET_STREAM, headers, settings=settings)
+
+    assert resp.status_code == 200
+    assert resp.content_type == ContentType.APP_OCTET_STREAM
+    assert resp.headers["Content-Disposition"] == headers["Content-Disposition"]
+    if expect_header:
+        assert resp.headers[expect_header] == expect_value.format(out_dir=out_dir)
+        assert resp.body == b"", "contents should be transferred by the front server"
+        assert resp.content_length == 0
+    else:
+        assert "X-Accel-Redirect" not in resp.headers and "X-Sendfile" not in resp.headers
+        assert not isinstance(resp.app_iter, list), "file should be streamed instead of loaded in memory"
+        assert resp.content_length == len(data)
+        assert b"".join(resp.app_iter) == data
+        resp.app_iter.close()
+
+
+@pytest.mark.parametrize(
+    ["method", "request_headers", "expect_status", "expect_range"],
+    [
+        ("GET", {}, 200, None),
+        ("GET", {"Range": "bytes=100-199"}, 206, (100, 200)),
+        ("GET", {"Range": "bytes=-50"}, 206, (974, 1024)),
+        ("GET", {"Range": "bytes=100-199", "If-Range": "\"outdated\""}, 200, None),
+        ("GET", {"Range": "bytes=100-199", "If-Range": "{etag}"}, 206, (100, 200)),
+        ("GET", {"Range": "bytes=2000-"}, 416, None),
+        ("GET", {"If-None-Match": "{etag}"}, 304, None),
+        ("GET", {"If-None-Match": "\"outdated\""}, 200, None),
+        ("HEAD", {"If-None-Match": "{etag}"}, 304, None),
+        ("HEAD", {}, 200, None),
+    ]
+)
+def test_make_result_file_response_conditional(tmpdir, method, request_headers, expect_status, expect_range):
+    file_path = os.path.join(tmpdir, "data.bin")
+    data = os.urandom(1024)
+    with open(file_path, mode="wb") as file:
+        file.write(data)
+    headers = get_href_headers(file_path, content_headers=True, etag_header=True)
+    etag = headers["ETag"]
+    request_headers = {name: value.format(etag=etag) for name, value in request_headers.items()}
+    request = Request.blank("/jobs/test/results/output", method=method, headers=request_headers)
+    resp = make_result_file_response(file_path, ContentType.APP_OCTET_STREAM, headers, settings={}, request=request)
+    resp = request.get_response(resp)
+
+    assert resp.status_code == expect_status
+    if expect_status in [200, 206, 304]:
+        assert resp.headers["ETag"] == etag
+    if expect_status == 206:
+        start, stop = expect_range
+        assert resp.headers["Content-Range"] == f"bytes {start}-{stop - 1}/{len(data)}"
+        assert resp.body == data[start:stop]
+    elif expect_status == 200:
+        assert resp.headers["Accept-Ranges"] == "bytes"
+        assert resp.content_length == len(data)
+        assert resp.body == (data if method == "GET" else b"")
+    elif expect_status == 304:
+        assert resp.body == b""
@@ -53,7 +53,9 @@ def includeme(config):
 
     config.include("weaver.config")
     config.include("weaver.database")
+    config.include("weaver.metrics")
     config.include("weaver.processes")
+    config.include("weaver.renderers")
     config.include("weaver.vault")
     config.include("weaver.wps")
     config.include("weaver.wps_restapi")
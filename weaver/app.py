@@ -13,7 +13,7 @@ from weaver.config import WEAVER_DEFAULT_REQUEST_OPTIONS_CONFIG, get_weaver_conf
 from weaver.database import get_db
 from weaver.processes.builtin import register_builtin_processes
 from weaver.processes.utils import register_cwl_processes_from_config, register_wps_processes_from_config
-from weaver.utils import parse_extra_options, setup_cache, setup_loggers
+from weaver.utils import get_request_options_matcher, parse_extra_options, setup_cache, setup_loggers
 from weaver.wps_restapi.patches import Configurator, patch_pyramid_view_no_auto_head_get_method
 
 if TYPE_CHECKING:
@@ -51,6 +51,8 @@ def main(global_config, **settings):
         LOGGER.info("Loading request options...")
         with open(req_file, mode="r", encoding="utf-8") as f:
             settings.update({"weaver.request_options": yaml.safe_load(f)})
+        if isinstance(settings["weaver.request_options"], dict):
+            get_request_options_matcher(settings["weaver.request_options"])  # precompile for requests lookup
     else:
         LOGGER.warning("No request options found.")
 
@@ -6,6 +6,7 @@ import abc
 import base64
 import copy
 import enum
+import hashlib
 import inspect
 import io
 import json
@@ -2395,6 +2396,18 @@ class Process(Base):
             version = as_version_major_minor_patch(version, VersionFormat.STRING)
         self["version"] = sd.Version().deserialize(version)
 
+    @property
+    def revision_hash(self):
+        # type: () -> str
+        """
+        Digest of the complete :term:`Process` definition that identifies uniquely its current revision.
+
+        Any update or redeployment that modifies the definition, even when preserving the same identifier and version,
+        results in a different digest. This allows invalidating cached references to the loaded :term:`Process`.
+        """
+        params = json.dumps(self.params(), sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(params.encode("utf-8")).hexdigest()
+
     @property
     def inputs(self):
         # type: () -> Optional[List[Dict[str, JSON]]]
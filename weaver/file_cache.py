@@ -0,0 +1,430 @@
+"""
+Content-addressable cache of remote files shared by all :term:`Job` executions on the same host.
+
+Downloaded files are stored once under their content digest (``blobs/``) and referenced by the digest of their
+source URL (``refs/``) along with the HTTP validators (``ETag``, ``Last-Modified``) of the response that provided
+them. A cached file is never reused without revalidation by a conditional request to its source, which ensures
+that the requester is still allowed to access it and that the contents did not change.
+
+Cached files are cloned into the :term:`Job` working directory by reflink (copy-on-write) when the filesystem
+supports it, or by hardlink otherwise, falling back to a plain copy (e.g.: when on another filesystem).
+Since cached files can be shared by hardlinks with staged files, they are never modified once stored, including
+their modification time. The last use of each cached file is instead recorded by a separate stamp file (``stamps/``).
+
+.. warning::
+    This module must remain importable by :mod:`weaver.utils` without circular references.
+    Therefore, it should not import any other :mod:`weaver` module at the top level.
+"""
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover  # non-POSIX
+    fcntl = None
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, Iterator, Optional, Tuple, TypedDict
+
+    from weaver.typedefs import Number, Path
+
+    FileCacheEntry = TypedDict("FileCacheEntry", {
+        "url": str,
+        "digest": str,
+        "size": int,
+        "file_name": str,
+        "etag": Optional[str],
+        "last_modified": Optional[str],
+    }, total=True)
+
+LOGGER = logging.getLogger(__name__)
+
+FILE_CACHE_LOCK_TIMEOUT = 3600
+FILE_CACHE_EVICT_GRACE = 60
+FILE_CACHE_CHUNK_SIZE = 8 * 1024 * 1024
+FICLONE = 0x40049409  # ioctl request code of reflink on Linux (from 'linux/fs.h')
+
+
+def clone_file(src_path, dst_path, hardlink=False):
+    # type: (Path, Path, bool) -> str
+    """
+    Generates the destination file from the source with the least expensive method supported by the filesystem.
+
+    Attempts a reflink (copy-on-write clone), then a hardlink if allowed, and finally a full copy if none are possible.
+
+    .. warning::
+        A hardlink shares the contents and the metadata (permissions, modification time) of the source. Any
+        modification of either file (e.g.: by a process writing to its input in place) affects the other one.
+        Hardlinks should therefore only be allowed for sources known to be read-only, such as cached files.
+
+    :param src_path: File to clone.
+    :param dst_path: Location of the generated file.
+    :param hardlink: Allow a hardlink if a reflink is not supported.
+    :returns: Name of the method that was employed (``reflink``, ``hardlink`` or ``copy``).
+    """
+    if fcntl is not None:
+        try:
+            with open(src_path, "rb") as src_file, open(dst_path, "wb") as dst_file:
+                fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+            return "reflink"
+        except OSError:  # not supported by the filesystem or across devices
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(dst_path)
+    if hardlink:
+        try:
+            os.link(src_path, dst_path)
+            return "hardlink"
+        except FileNotFoundError:
+            raise
+        except OSError:  # across devices
+            pass
+    shutil.copyfile(src_path, dst_path)
+    return "copy"
+
+
+class FileCache(object):
+    """
+    Cache of files downloaded from remote locations, limited in size by evicting the least recently used files.
+
+    Operations on the same URL are serialized across threads and processes (file lock) such that concurrent
+    :term:`Job` executions wait for a single download of a file instead of retrieving it multiple times.
+
+    The URL is only employed as identifier of the cached file. Any other string that uniquely identifies the contents
+    (e.g.: a file converted from another one) can be used as well.
+    """
+
+    def __init__(self, path, max_size, max_age=None):
+        # type: (Path, int, Optional[Number]) -> None
+        self.path = os.path.abspath(path)
+        self.max_size = max_size
+        self.max_age = max_age
+        self.blobs_dir = os.path.join(self.path, "blobs")
+        self.refs_dir = os.path.join(self.path, "refs")
+        self.locks_dir = os.path.join(self.path, "locks")
+        self.stamps_dir = os.path.join(self.path, "stamps")
+        for cache_dir in [self.blobs_dir, self.refs_dir, self.locks_dir, self.stamps_dir]:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _hash_url(url):
+        # type: (str) -> str
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _ref_path(self, url):
+        # type: (str) -> str
+        return os.path.join(self.refs_dir, f"{self._hash_url(url)}.json")
+
+    def _blob_path(self, digest):
+        # type: (str) -> str
+        return os.path.join(self.blobs_dir, digest[:2], digest)
+
+    def _stamp_path(self, digest):
+        # type: (str) -> str
+        return os.path.join(self.stamps_dir, digest)
+
+    def _touch(self, digest):
+        # type: (str) -> None
+        """
+        Marks the cached file as recently used, without modifying the cached file shared by hardlinks.
+        """
+        stamp_path = self._stamp_path(digest)
+        with open(stamp_path, mode="ab"):
+            pass
+        os.utime(stamp_path)
+
+    def _last_used(self, digest, blob_stat):
+        # type: (str, os.stat_result) -> float
+        try:
+            return os.stat(self._stamp_path(digest)).st_mtime
+        except FileNotFoundError:  # not used since stored
+            return blob_stat.st_mtime
+
+    def _marker_path(self, url):
+        # type: (str) -> str
+        return os.path.join(self.locks_dir, f"{self._hash_url(url)}.marker")
+
+    @contextlib.contextmanager
+    def lock(self, url, timeout=FILE_CACHE_LOCK_TIMEOUT, marker=False):
+        # type: (str, int, bool) -> Iterator[None]
+        """
+        Lock operations on the cached file of the URL, waiting for another thread or process to release it.
+
+        If the lock cannot be obtained within the timeout, operations continue regardless to avoid blocking a
+        :term:`Job` indefinitely because of a misbehaving concurrent process.
+
+        :param url: Identifier of the cached file.
+        :param timeout: Maximum duration to wait for the lock.
+        :param marker: Mark the lock while it is held, such that other processes can distinguish it with :meth:`locked`.
+        """
+        lock_path = os.path.join(self.locks_dir, f"{self._hash_url(url)}.lock")
+        with open(lock_path, "a+b") as lock_file:
+            locked = False
+            if fcntl is not None:
+                end = time.monotonic() + timeout
+                while not locked:
+                    try:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        locked = True
+                    except BlockingIOError:
+                        if time.monotonic() > end:
+                            LOGGER.warning("Timeout waiting for file cache lock of [%s]. Ignoring lock.", url)
+                            break
+                        time.sleep(0.1)
+            if marker:
+                with open(self._marker_path(url), mode="ab"):
+                    pass
+            try:
+                yield
+            finally:
+                if marker:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(self._marker_path(url))
+                if locked:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def locked(self, url, marker=False):
+        # type: (str, bool) -> bool
+        """
+        Indicates if operations on the cached file of the URL are currently locked by another thread or process.
+
+        :param url: Identifier of the cached file.
+        :param marker: Only consider a lock obtained with the marker (see :meth:`lock`).
+        """
+        if fcntl is None:
+            return False
+        if marker and not os.path.exists(self._marker_path(url)):
+            return False
+        lock_path = os.path.join(self.locks_dir, f"{self._hash_url(url)}.lock")
+        with open(lock_path, "a+b") as lock_file:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        return False
+
+    def get(self, url, touch=True):
+        # type: (str, bool) -> Optional[FileCacheEntry]
+        """
+        Obtain the cached file details of the URL, or ``None`` if not cached or if the file was evicted.
+
+        :param url: Identifier of the cached file.
+        :param touch: Mark the cached file as recently used. Otherwise, it is only marked when it is linked.
+        """
+        ref_path = self._ref_path(url)
+        try:
+            with open(ref_path, mode="r", encoding="utf-8") as ref_file:
+                entry = json.load(ref_file)  # type: FileCacheEntry
+            os.stat(self._blob_path(entry["digest"]))  # validate that it still exists
+            if touch:
+                self._touch(entry["digest"])
+        except FileNotFoundError:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(ref_path)
+            return None
+        except (OSError, ValueError, KeyError) as exc:
+            LOGGER.warning("Discarding invalid file cache reference [%s] for [%s] (%s)", ref_path, url, exc)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(ref_path)
+            return None
+        return entry
+
+    @staticmethod
+    def validators(entry):
+        # type: (Optional[FileCacheEntry]) -> Dict[str, str]
+        """
+        Obtain the conditional request headers to revalidate the cached file.
+        """
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, file_name, chunks, etag=None, last_modified=None):
+        # type: (str, str, Iterable[bytes], Optional[str], Optional[str]) -> FileCacheEntry
+        """
+        Stores the contents of a file downloaded from the URL, and evicts other files if needed to respect the quota.
+
+        Contents are first written to a temporary file such that a partial download (e.g.: aborted) never becomes
+        visible in the cache. Identical contents from distinct URLs are stored only once.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=self.blobs_dir, prefix=".download-")
+        try:
+            with os.fdopen(tmp_fd, "wb") as tmp_file:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    size += len(chunk)
+                    tmp_file.write(chunk)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+        return self._commit(url, file_name, tmp_path, digest.hexdigest(), size, etag, last_modified)
+
+    def store_file(self, url, file_name, file_path, etag=None, last_modified=None, digest=None):
+        # type: (str, str, Path, Optional[str], Optional[str], Optional[str]) -> FileCacheEntry
+        """
+        Stores a file already downloaded from the URL by moving it into the cache.
+
+        :param digest: Hexadecimal SHA-256 digest of the file if already known, to avoid reading it again.
+
+        .. seealso::
+            :meth:`store`
+        """
+        if digest:
+            size = os.stat(file_path).st_size
+        else:
+            hash_obj = hashlib.sha256()
+            size = 0
+            with open(file_path, "rb") as file:
+                while chunk := file.read(FILE_CACHE_CHUNK_SIZE):
+                    hash_obj.update(chunk)
+                    size += len(chunk)
+            digest = hash_obj.hexdigest()
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=self.blobs_dir, prefix=".download-")
+        os.close(tmp_fd)
+        try:
+            shutil.move(file_path, tmp_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+        return self._commit(url, file_name, tmp_path, digest, size, etag, last_modified)
+
+    def _commit(self, url, file_name, tmp_path, blob_digest, size, etag, last_modified):
+        # type: (str, str, str, str, int, Optional[str], Optional[str]) -> FileCacheEntry
+        blob_path = self._blob_path(blob_digest)
+        try:
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            # read-only to protect the shared contents against modifications through hardlinks
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp_path, blob_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+        entry = {
+            "url": url,
+            "digest": blob_digest,
+            "size": size,
+            "file_name": file_name,
+            "etag": etag,
+            "last_modified": last_modified,
+        }  # type: FileCacheEntry
+        ref_path = self._ref_path(url)
+        with tempfile.NamedTemporaryFile("w", dir=self.refs_dir, suffix=".tmp", delete=False) as ref_file:
+            json.dump(entry, ref_file)
+        os.replace(ref_file.name, ref_path)
+        self._touch(blob_digest)
+        self.evict(keep=blob_path)
+        return entry
+
+    def link(self, entry, file_outdir):
+        # type: (FileCacheEntry, Path) -> Optional[str]
+        """
+        Generates the cached file under the output directory.
+
+        If the file was already generated from the same cached file by a previous call, it is returned unmodified.
+        Otherwise, the generated file preserves the modification time of the cached file, such that the file can be
+        identified as unmodified on following calls, even if it is not a hardlink. In both cases, the cached file is
+        marked as recently used.
+
+        :returns: Path of the generated file, or ``None`` if the cached file was evicted in the meantime.
+        """
+        file_path = os.path.join(file_outdir, entry["file_name"])
+        blob_path = self._blob_path(entry["digest"])
+        with contextlib.suppress(OSError):
+            file_stat = os.stat(file_path)
+            blob_stat = os.stat(blob_path)
+            if os.path.samestat(file_stat, blob_stat) or (
+                file_stat.st_size == blob_stat.st_size and file_stat.st_mtime_ns == blob_stat.st_mtime_ns
+            ):
+                self._touch(entry["digest"])
+                return file_path  # already generated by a previous call
+        if os.path.lexists(file_path):
+            os.remove(file_path)
+        try:
+            method = clone_file(blob_path, file_path, hardlink=True)  # blobs are read-only
+            if method != "hardlink":
+                blob_stat = os.stat(blob_path)
+                os.utime(file_path, ns=(blob_stat.st_atime_ns, blob_stat.st_mtime_ns))
+        except FileNotFoundError:
+            return None
+        self._touch(entry["digest"])
+        LOGGER.debug("Generated [%s] from file cache by %s of [%s]", file_path, method, entry["digest"])
+        return file_path
+
+    def evict(self, keep=None):
+        # type: (Optional[str]) -> None
+        """
+        Removes the least recently used files until the total size of the cache respects the quota.
+
+        Files that were not used for longer than the maximum age, if specified, are removed regardless of the size.
+        Files used very recently are preserved regardless of the quota, since they could be about to be linked.
+        """
+        blobs = []
+        total = 0
+        expired = time.time() - self.max_age if self.max_age else None
+        for blob_dir, _, blob_names in os.walk(self.blobs_dir):
+            for blob_name in blob_names:
+                if blob_name.startswith("."):
+                    continue
+                blob_path = os.path.join(blob_dir, blob_name)
+                with contextlib.suppress(FileNotFoundError):
+                    blob_stat = os.stat(blob_path)
+                    blob_used = self._last_used(blob_name, blob_stat)
+                    if expired and blob_used < expired and blob_path != keep:
+                        self._remove(blob_path)
+                        LOGGER.debug("Evicted expired [%s] from file cache.", blob_path)
+                        continue
+                    blobs.append((blob_used, blob_stat.st_size, blob_path))
+                    total += blob_stat.st_size
+        if total <= self.max_size:
+            return
+        recent = time.time() - FILE_CACHE_EVICT_GRACE
+        for blob_used, blob_size, blob_path in sorted(blobs):
+            if total <= self.max_size:
+                break
+            if blob_path == keep or blob_used > recent:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                self._remove(blob_path)
+                total -= blob_size
+                LOGGER.debug("Evicted [%s] from file cache.", blob_path)
+
+    def _remove(self, blob_path):
+        # type: (str) -> None
+        os.remove(blob_path)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._stamp_path(os.path.basename(blob_path)))
+
+
+_FILE_CACHES = {}  # type: Dict[Tuple[str, int, Optional[Number]], FileCache]
+_FILE_CACHES_LOCK = threading.Lock()
+
+
+def get_file_cache(path, max_size, max_age=None):
+    # type: (Optional[Path], int, Optional[Number]) -> Optional[FileCache]
+    """
+    Obtain the file cache located under the directory, or ``None`` if caching is disabled.
+    """
+    if not path or max_size <= 0:
+        return None
+    with _FILE_CACHES_LOCK:
+        key = (os.path.abspath(path), max_size, max_age)
+        if key not in _FILE_CACHES:
+            _FILE_CACHES[key] = FileCache(path, max_size, max_age=max_age)
+        return _FILE_CACHES[key]
@@ -0,0 +1,30 @@
+import logging
+from typing import TYPE_CHECKING
+
+from pyramid.settings import asbool
+
+if TYPE_CHECKING:
+    from pyramid.config import Configurator
+
+LOGGER = logging.getLogger(__name__)
+
+
+def includeme(config):
+    # type: (Configurator) -> None
+    settings = config.registry.settings  # avoid 'weaver.utils' import, which uses 'weaver.metrics.utils'
+    if not asbool(settings.get("weaver.metrics", False)):
+        LOGGER.info("Skipping runtime metrics [weaver.metrics=false].")
+        return
+    from weaver.metrics.utils import prometheus_client  # pylint: disable=C0415
+
+    if prometheus_client is None:
+        LOGGER.warning("Skipping runtime metrics, package 'prometheus_client' is not installed [weaver.metrics=true].")
+        return
+    if asbool(settings.get("weaver.celery", False)):
+        LOGGER.info("Adding worker runtime metrics exporter...")
+        from weaver.metrics.views import start_worker_metrics_exporter  # pylint: disable=C0415
+
+        start_worker_metrics_exporter(settings)
+    else:
+        LOGGER.info("Adding runtime metrics views...")
+        config.include("weaver.metrics.views")
@@ -0,0 +1,281 @@
+"""
+Runtime metrics definitions shared by the :term:`API` and the :term:`Celery` workers.
+
+Metrics are collected with :mod:`prometheus_client`. When multiple processes produce metrics (e.g.: ``gunicorn``
+workers or ``celery`` prefork pool), the ``PROMETHEUS_MULTIPROC_DIR`` environment variable must be set to a shared
+directory *before* the application starts, such that values from every process are aggregated when exported.
+
+The :mod:`prometheus_client` package is optional. When it is not installed, metrics are defined as no-op
+placeholders such that instrumented code can run regardless, and the metrics feature cannot be enabled.
+
+.. warning::
+    This module must remain importable by :mod:`weaver.utils` without circular references.
+    Therefore, it should not import any other :mod:`weaver` module at the top level.
+"""
+import functools
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING
+
+from beaker.cache import cache_region as beaker_cache_region
+
+try:
+    import prometheus_client
+    from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram, multiprocess
+    from prometheus_client.core import GaugeMetricFamily
+except ImportError:  # pragma: no cover  # optional dependency
+    prometheus_client = None
+    Counter = Histogram = None
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+    from prometheus_client.metrics_core import Metric
+    from prometheus_client.registry import Collector
+
+    from weaver.typedefs import AnyCallable, Number
+
+LOGGER = logging.getLogger(__name__)
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_NAMESPACE = "weaver"
+
+
+class NoOpMetric(object):
+    """
+    Placeholder of a metric ignoring all observations, employed when :mod:`prometheus_client` is not installed.
+    """
+
+    def __init__(self, *_, **__):
+        # type: (*Any, **Any) -> None
+        pass
+
+    def labels(self, *_, **__):
+        # type: (*Any, **Any) -> NoOpMetric
+        return self
+
+    def inc(self, *_, **__):
+        # type: (*Any, **Any) -> None
+        pass
+
+    def observe(self, *_, **__):
+        # type: (*Any, **Any) -> None
+        pass
+
+
+if prometheus_client is None:  # pragma: no cover
+    Counter = Histogram = NoOpMetric
+
+# buckets adjusted to cover both short API requests and long-running jobs
+REQUEST_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+JOB_DURATION_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0, 7200.0, 21600.0, 86400.0)
+
+REQUEST_LATENCY = Histogram(
+    "request_duration_seconds",
+    "Latency of API requests by service (route), method and response status code.",
+    labelnames=["service", "method", "status"],
+    namespace=METRICS_NAMESPACE,
+    buckets=REQUEST_LATENCY_BUCKETS,
+)
+JOB_QUEUE_WAIT = Histogram(
+    "job_queue_wait_seconds",
+    "Delay between job creation and its execution start by a worker.",
+    labelnames=["process"],
+    namespace=METRICS_NAMESPACE,
+    buckets=JOB_DURATION_BUCKETS,
+)
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "Execution duration of jobs by process and final status.",
+    labelnames=["process", "status"],
+    namespace=METRICS_NAMESPACE,
+    buckets=JOB_DURATION_BUCKETS,
+)
+REQUEST_RETRIES = Counter(
+    "request_retries",
+    "Amount of retried outgoing requests performed by 'weaver.utils.request_extra'.",
+    labelnames=["method", "host"],
+    namespace=METRICS_NAMESPACE,
+)
+FETCHED_BYTES = Counter(
+    "fetched_bytes",
+    "Amount of bytes retrieved from remote file references (e.g.: job inputs) by scheme.",
+    labelnames=["scheme"],
+    namespace=METRICS_NAMESPACE,
+)
+STAGED_BYTES = Counter(
+    "staged_bytes",
+    "Amount of bytes of local files staged (e.g.: job inputs and outputs) by method (reflink, copy, etc.).",
+    labelnames=["method"],
+    namespace=METRICS_NAMESPACE,
+)
+CACHE_HITS = Counter(
+    "cache_hits",
+    "Amount of cache lookups resolved from cached values by cache region.",
+    labelnames=["region"],
+    namespace=METRICS_NAMESPACE,
+)
+CACHE_MISSES = Counter(
+    "cache_misses",
+    "Amount of cache lookups that required generating the value by cache region.",
+    labelnames=["region"],
+    namespace=METRICS_NAMESPACE,
+)
+_CACHE_LOOKUP = threading.local()
+
+
+def cache_region(region, *deco_args):
+    # type: (str, *Any) -> Callable[[AnyCallable], AnyCallable]
+    """
+    Drop-in replacement of :func:`beaker.cache.cache_region` that also counts cache hits and misses for the region.
+
+    The returned function preserves the attributes set by :mod:`beaker` on the cached function
+    (``_arg_region``, ``_arg_namespace``) to allow region invalidation using the decorated function.
+    """
+    def decorator(func):
+        # type: (AnyCallable) -> AnyCallable
+        @functools.wraps(func)
+        def generate(*args, **kwargs):
+            # type: (*Any, **Any) -> Any
+            _CACHE_LOOKUP.generated = True
+            return func(*args, **kwargs)
+
+        cached = beaker_cache_region(region, *deco_args)(generate)
+
+        @functools.wraps(cached)
+        def lookup(*args, **kwargs):
+            # type: (*Any, **Any) -> Any
+            generated = getattr(_CACHE_LOOKUP, "generated", False)  # preserve in case of nested cached calls
+            _CACHE_LOOKUP.generated = False
+            try:
+                return cached(*args, **kwargs)
+            finally:
+                counter = CACHE_MISSES if _CACHE_LOOKUP.generated else CACHE_HITS
+                counter.labels(region=region).inc()
+                _CACHE_LOOKUP.generated = generated
+
+        return lookup
+    return decorator
+
+
+def observe_request(service, method, status, duration):
+    # type: (str, str, Union[int, str], Number) -> None
+    REQUEST_LATENCY.labels(service=service, method=method, status=str(status)).observe(duration)
+
+
+def observe_request_retry(method, host):
+    # type: (str, Optional[str]) -> None
+    REQUEST_RETRIES.labels(method=str(method).upper(), host=host or "").inc()
+
+
+def observe_fetched_bytes(scheme, size):
+    # type: (str, int) -> None
+    if size:
+        FETCHED_BYTES.labels(scheme=scheme).inc(size)
+
+
+def observe_staged_bytes(method, size):
+    # type: (str, int) -> None
+    STAGED_BYTES.labels(method=method).inc(size or 0)
+
+
+def observe_job_started(process, created, started):
+    # type: (str, Optional[datetime], Optional[datetime]) -> None
+    if created and started:
+        JOB_QUEUE_WAIT.labels(process=process).observe(max((started - created).total_seconds(), 0))
+
+
+def observe_job_finished(process, status, started, finished):
+    # type: (str, str, Optional[datetime], Optional[datetime]) -> None
+    if started and finished:
+        JOB_DURATION.labels(process=process, status=status).observe(max((finished - started).total_seconds(), 0))
+
+
+class JobStatusCollector(object):
+    """
+    Collector reporting the current amount of jobs by status from the database.
+
+    Counts are resolved on each collection to provide values consistent across all running :term:`API` instances,
+    which could not be achieved with per-process gauges.
+    """
+
+    def __init__(self, count_jobs):
+        # type: (Callable[[], Dict[str, int]]) -> None
+        self.count_jobs = count_jobs
+
+    def collect(self):
+        # type: () -> Iterator[Metric]
+        metric = GaugeMetricFamily(
+            f"{METRICS_NAMESPACE}_jobs",
+            "Current amount of jobs by status.",
+            labels=["status"],
+        )
+        try:
+            for status, count in sorted(self.count_jobs().items()):
+                metric.add_metric([status], count)
+        except Exception as exc:  # pragma: no cover
+            LOGGER.warning("Failed collecting job status metrics [%s]", exc, exc_info=exc)
+        yield metric
+
+
+class MetricsCollection(object):
+    """
+    Combines multiple collectors and derives cache hit ratios from the collected cache counters.
+    """
+
+    def __init__(self, *collectors):
+        # type: (*Collector) -> None
+        self.collectors = collectors
+
+    def collect(self):
+        # type: () -> Iterator[Metric]
+        cache_counts = {}  # type: Dict[str, Dict[str, Number]]
+        for collector in self.collectors:
+            for metric in collector.collect():
+                if metric.name in [f"{METRICS_NAMESPACE}_cache_hits", f"{METRICS_NAMESPACE}_cache_misses"]:
+                    for sample in metric.samples:
+                        if sample.name.endswith("_total"):
+                            region = sample.labels.get("region", "")
+                            cache_counts.setdefault(region, {}).setdefault(metric.name, 0)
+                            cache_counts[region][metric.name] += sample.value
+                yield metric
+        yield from self._collect_cache_ratio(cache_counts)
+
+    @staticmethod
+    def _collect_cache_ratio(cache_counts):
+        # type: (Dict[str, Dict[str, Number]]) -> Iterable[Metric]
+        ratio = GaugeMetricFamily(
+            f"{METRICS_NAMESPACE}_cache_hit_ratio",
+            "Ratio of cache lookups resolved from cached values by cache region.",
+            labels=["region"],
+        )
+        for region, counts in sorted(cache_counts.items()):
+            hits = counts.get(f"{METRICS_NAMESPACE}_cache_hits", 0)
+            total = hits + counts.get(f"{METRICS_NAMESPACE}_cache_misses", 0)
+            ratio.add_metric([region], hits / total if total else 0.0)
+        yield ratio
+
+
+def is_multiprocess():
+    # type: () -> bool
+    return bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def get_metrics_collector(*collectors):
+    # type: (*Collector) -> MetricsCollection
+    """
+    Obtain the collector of all metrics applicable for the current process configuration.
+
+    When running in multiprocess mode, metrics are aggregated from files written by every process.
+    Otherwise, only the metrics of the current process are reported.
+
+    :param collectors: Additional collectors to combine with the process metrics.
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return MetricsCollection(registry, *collectors)
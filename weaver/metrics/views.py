@@ -0,0 +1,89 @@
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from prometheus_client import generate_latest, start_http_server
+from pyramid.httpexceptions import HTTPOk
+from pyramid.tweens import INGRESS
+
+from weaver.database import get_db
+from weaver.formats import ContentType
+from weaver.metrics.utils import METRICS_CONTENT_TYPE, JobStatusCollector, get_metrics_collector, observe_request
+from weaver.store.base import StoreJobs
+from weaver.tweens import OWS_RESPONSE_INGRESS
+from weaver.utils import as_int, fully_qualified_name
+from weaver.wps_restapi import swagger_definitions as sd
+
+if TYPE_CHECKING:
+    from pyramid.config import Configurator
+    from pyramid.registry import Registry
+
+    from weaver.typedefs import AnyViewResponse, PyramidRequest, SettingsType, ViewHandler
+
+LOGGER = logging.getLogger(__name__)
+
+
+@sd.metrics_service.get(
+    tags=[sd.TAG_API, sd.TAG_METRICS],
+    schema=sd.MetricsEndpoint(),
+    accept=ContentType.TEXT_PLAIN,
+    response_schemas=sd.get_api_metrics_responses,
+)
+def get_metrics(request):
+    # type: (PyramidRequest) -> AnyViewResponse
+    """
+    Runtime metrics of the API and workers in Prometheus text exposition format.
+    """
+    store = get_db(request).get_store(StoreJobs)
+    collector = get_metrics_collector(JobStatusCollector(store.count_jobs_by_status))
+    data = generate_latest(collector)
+    return HTTPOk(body=data, headers={"Content-Type": METRICS_CONTENT_TYPE})
+
+
+def request_metrics_tween_factory(handler, registry):  # noqa: F811
+    # type: (ViewHandler, Registry) -> ViewHandler
+    """
+    Tween factory that measures the latency of requests by :mod:`cornice` service (route name).
+
+    Requests that do not match any route are grouped together to avoid unbounded metric labels.
+    """
+    def measure_request(request):
+        # type: (PyramidRequest) -> AnyViewResponse
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = handler(request)
+            status = getattr(response, "status_code", status)
+            return response
+        finally:
+            route = getattr(request, "matched_route", None)
+            service = route.name if route else "<unmatched>"
+            observe_request(service, request.method, status, time.perf_counter() - start)
+    return measure_request
+
+
+def start_worker_metrics_exporter(settings):
+    # type: (SettingsType) -> None
+    """
+    Starts the HTTP server that exports the worker metrics if a port is configured.
+
+    .. note::
+        With the ``prefork`` pool of :term:`Celery`, tasks run in child processes. The ``PROMETHEUS_MULTIPROC_DIR``
+        environment variable must therefore be set to report their metrics from the exporter of the main process.
+    """
+    port = as_int(settings.get("weaver.metrics_worker_port"), default=0)
+    if port <= 0:
+        LOGGER.info("Skipping worker metrics exporter [weaver.metrics_worker_port] not configured.")
+        return
+    addr = settings.get("weaver.metrics_worker_host") or "0.0.0.0"  # nosec: B104
+    LOGGER.info("Starting worker metrics exporter on [%s:%s]", addr, port)
+    start_http_server(port, addr=addr, registry=get_metrics_collector())
+
+
+REQUEST_METRICS = fully_qualified_name(request_metrics_tween_factory)
+
+
+def includeme(config):
+    # type: (Configurator) -> None
+    config.add_cornice_service(sd.metrics_service)
+    config.add_tween(REQUEST_METRICS, under=INGRESS, over=OWS_RESPONSE_INGRESS)
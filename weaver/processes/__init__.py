@@ -1,9 +1,19 @@
+import logging
 from typing import TYPE_CHECKING
 
+from pyramid.settings import asbool
+
 if TYPE_CHECKING:
     from pyramid.config import Configurator
 
+LOGGER = logging.getLogger(__name__)
+
 
 def includeme(config):  # noqa: E811
     # type: (Configurator) -> None
-    pass
+    settings = config.registry.settings
+    if asbool(settings.get("weaver.cwl_schemas_preload", False)):
+        LOGGER.info("Preloading CWL schemas...")
+        from weaver.processes.wps_package import _load_supported_schemas  # pylint: disable=C0415  # heavy imports
+
+        _load_supported_schemas(preload=True)
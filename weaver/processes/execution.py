@@ -24,6 +24,7 @@ from pyramid.httpexceptions import (
     HTTPUnprocessableEntity,
     HTTPUnsupportedMediaType
 )
+from pyramid.settings import asbool
 from pyramid_celery import celery_app as app
 from werkzeug.wrappers.request import Request as WerkzeugRequest
 
@@ -48,6 +49,7 @@ from weaver.formats import (
     map_cwl_media_type,
     repr_json
 )
+from weaver.metrics.utils import cache_region, observe_job_finished, observe_job_started
 from weaver.notify import map_job_subscribers, notify_job_subscribers
 from weaver.owsexceptions import OWSInvalidParameterValue, OWSNoApplicableCode
 from weaver.processes import wps_package
@@ -60,6 +62,7 @@ from weaver.processes.convert import (
     ows2json_output_data
 )
 from weaver.processes.ogc_api_process import OGCAPIRemoteProcess
+from weaver.processes.profiling import start_job_profiling, stop_job_profiling
 from weaver.processes.types import ProcessType
 from weaver.processes.utils import get_process, map_progress
 from weaver.status import JOB_STATUS_CATEGORIES, Status, StatusCategory, map_status
@@ -71,6 +74,7 @@ from weaver.utils import (
     fully_qualified_name,
     get_any_id,
     get_any_value,
+    get_file_digest_multibase,
     get_header,
     get_path_kvp,
     get_registry,
@@ -82,7 +86,7 @@ from weaver.utils import (
     wait_secs
 )
 from weaver.visibility import Visibility
-from weaver.wps.service import get_pywps_service
+from weaver.wps.service import WorkerRequest, get_pywps_service
 from weaver.wps.utils import (
     check_wps_status,
     get_wps_client,
@@ -92,10 +96,16 @@ from weaver.wps.utils import (
     get_wps_output_path,
     get_wps_output_url,
     get_wps_path,
-    load_pywps_config
+    load_pywps_config,
+    map_wps_output_location
 )
 from weaver.wps_restapi import swagger_definitions as sd
-from weaver.wps_restapi.jobs.utils import get_job_results_response, get_job_return, get_job_submission_response
+from weaver.wps_restapi.jobs.utils import (
+    get_job_results_response,
+    get_job_return,
+    get_job_submission_response,
+    precompute_job_results_formats
+)
 from weaver.wps_restapi.processes.utils import resolve_process_tag
 
 LOGGER = logging.getLogger(__name__)
@@ -110,6 +120,7 @@ if TYPE_CHECKING:
     from weaver.datatype import Job
     from weaver.execute import AnyExecuteControlOption, AnyExecuteMode
     from weaver.processes.convert import OWS_Input_Type, ProcessOWS
+    from weaver.processes.profiling import AnyProfiler
     from weaver.status import AnyStatusType, StatusType
     from weaver.typedefs import (
         AnyAcceptLanguageHeader,
@@ -171,6 +182,7 @@ def execute_process(task, job_id, wps_url, headers=None):
     store = db.get_store(StoreJobs)
     job = store.fetch_by_id(job_id)
     job.started = now()
+    observe_job_started(job.process, job.created, job.started)
     job.status = Status.STARTED  # will be mapped to 'RUNNING'
     job.status_message = f"Job {Status.STARTED}."  # will preserve detail of STARTED vs RUNNING
     job.save_log(message=job.status_message)
@@ -184,6 +196,13 @@ def execute_process(task, job_id, wps_url, headers=None):
     job.save_log(logger=task_logger, message="Job task setup completed.")
     job = store.update_job(job)
 
+    # NOTE:
+    #   Package execution ('WpsPackage._handler') runs synchronously within this task thread (see 'execute_job').
+    #   Therefore, the profile also covers the full process execution, including inputs staging and outputs collection.
+    profiler = start_job_profiling(headers, settings)
+    if profiler:
+        job.save_log(logger=task_logger, message="Job profiling enabled.")
+
     # Flag to keep track if job is running in background (remote-WPS, CWL app, etc.).
     # If terminate signal is sent to worker task via API dismiss request while still running in background,
     # the raised exception within the task will switch the job to Status.FAILED, but this will not raise an
@@ -283,6 +302,7 @@ def execute_process(task, job_id, wps_url, headers=None):
                             ows2json_output_data(output, process, settings)
                             for output in execution.processOutputs
                         ]
+                        job_results = make_results_digest(job_results, settings)
                         job.results = make_results_relative(job_results, settings)
                     else:
                         task_logger.debug("Job failed.")
@@ -329,6 +349,7 @@ def execute_process(task, job_id, wps_url, headers=None):
         #   don't update the progress and status here except for 'success' to preserve last error that was set
         #   it is more relevant to return the latest step that worked properly to understand where it failed
         job = store.fetch_by_id(job.id)
+        save_job_profiling(profiler, job, settings, task_logger)
         # if task worker terminated, local 'job' is out of date compared to remote/background runner last update
         if task_terminated and map_status(job.status) == Status.FAILED:
             job.status = Status.DISMISSED
@@ -347,14 +368,68 @@ def execute_process(task, job_id, wps_url, headers=None):
             job.status = Status.SUCCEEDED
         job.status_message = f"Job {job.status}."
         job.mark_finished()
+        observe_job_finished(job.process, job.status, job.started, job.finished)
         if task_success:
             job.progress = JobProgress.DONE
         job.save_log(logger=task_logger, message="Job task complete.")
         job = store.update_job(job)
 
+    # dispatched once the job is finalized, such that its completion and notification are not delayed by conversions
+    if task_success and asbool(settings.get("weaver.transform_precompute", False)):
+        precompute_job_results.delay(job_id=job.id)
     return job.status
 
 
+@app.task(bind=True)
+def precompute_job_results(task, job_id):  # pylint: disable=W0613
+    # type: (Task, UUID) -> int
+    """
+    Celery task that generates the alternate representations of the results of a completed :term:`Job`.
+
+    .. seealso::
+        :func:`weaver.wps_restapi.jobs.utils.precompute_job_results_formats`
+    """
+    registry = get_registry(app)
+    settings = get_settings(registry)
+    db = get_db(registry, reset_connection=True)
+    store = db.get_store(StoreJobs)
+    job = store.fetch_by_id(job_id)
+    task_logger = get_task_logger(__name__)
+    logs_count = len(job.logs)
+    count = 0
+    try:
+        count = precompute_job_results_formats(job, settings, task_logger)
+    except Exception as exc:  # pragma: no cover
+        LOGGER.warning("Ignoring error that occurred during results precompute [%s]", str(exc), exc_info=exc)
+    # only add the logs, since the job could have been modified during conversions
+    store.append_job_logs(job.id, job.logs[logs_count:])
+    return count
+
+
+def save_job_profiling(profiler, job, settings, logger=LOGGER):
+    # type: (Optional[AnyProfiler], Job, SettingsType, Optional[logging.Logger]) -> Optional[str]
+    """
+    Stops the :term:`Job` profiling if it was enabled and saves the artifact alongside its logs and outputs.
+
+    The artifact is stored in the :term:`WPS` output directory such that it can be downloaded from the corresponding
+    :term:`WPS` output URL. Its location is reported in the :term:`Job` logs.
+    """
+    if profiler is None:
+        return None
+    try:
+        prof_path = os.path.join(get_wps_output_dir(settings), f"{job.result_path()}-profile")
+        prof_path = stop_job_profiling(profiler, prof_path)
+        prof_name = os.path.basename(prof_path)
+        prof_dir = os.path.dirname(job.result_path())
+        prof_url = "/".join(filter(None, [get_wps_output_url(settings), prof_dir, prof_name]))
+        job.save_log(logger=logger, message=f"Job profiling saved: [{prof_url}]")
+        return prof_path
+    except Exception as exc:  # pragma: no cover
+        LOGGER.warning("Ignoring error that occurred during job profiling [%s]", str(exc), exc_info=exc)
+        job.save_log(logger=logger, message=f"Job profiling could not be saved: [{exc!s}]", level=logging.WARNING)
+    return None
+
+
 def collect_statistics(process, settings=None, job=None, rss_start=None):
     # type: (Optional[psutil.Process], Optional[SettingsType], Optional[Job], Optional[int]) -> Optional[Statistics]
     """
@@ -435,15 +510,44 @@ def fetch_wps_process(job, wps_url, headers, settings):
     # type: (Job, str, HeadersType, SettingsType) -> ProcessOWS
     """
     Retrieves the WPS process description from the local or remote WPS reference URL.
+
+    For a local :term:`Process`, the description is reused by the worker across executions for as long as the
+    :term:`Process` revision remains the same, to avoid repeating the :term:`WPS` requests on each :term:`Job`.
+    The cached description is specific to the credentials that were employed to retrieve it.
+    """
+    try:
+        if job.is_local:
+            store = get_db(settings).get_store(StoreProcesses)
+            process = store.fetch_by_id(job.process, revision=True)
+            auth_headers = tuple(sorted(WorkerRequest.parse_auth_headers(headers).items()))
+            return _fetch_wps_process_cached(
+                process.revision_hash, wps_url, job.process, job.accept_language, auth_headers
+            )
+        return _fetch_wps_process(wps_url, job.process, job.accept_language, headers, settings)
+    except OWSNoApplicableCode as ex:
+        job.save_log(errors=ex, message=f"Failed WPS process description retrieval for process [{job.process!s}]")
+        raise
+
+
+@cache_region("process")
+def _fetch_wps_process_cached(process_revision, wps_url, process_id, language, auth_headers):
+    # type: (str, str, str, Optional[str], Tuple[Tuple[str, str], ...]) -> ProcessOWS
     """
+    Cached :term:`WPS` process description of a local :term:`Process` revision employed by :func:`fetch_wps_process`.
+    """
+    LOGGER.debug("Fetching WPS process description for process [%s] revision [%s].", process_id, process_revision)
+    return _fetch_wps_process(wps_url, process_id, language, dict(auth_headers), get_settings())
+
+
+def _fetch_wps_process(wps_url, process_id, language, headers, settings):
+    # type: (str, str, Optional[str], HeadersType, SettingsType) -> ProcessOWS
     try:
-        wps = get_wps_client(wps_url, settings, headers=headers, language=job.accept_language)
+        wps = get_wps_client(wps_url, settings, headers=headers, language=language)
         raise_on_xml_exception(wps._capabilities)  # noqa: W0212
     except Exception as ex:
-        job.save_log(errors=ex, message=f"Failed WPS client creation for process [{job.process!s}]")
         raise OWSNoApplicableCode(f"Failed to retrieve WPS capabilities. Error: [{ex!s}].")
     try:
-        wps_process = wps.describeprocess(job.process)
+        wps_process = wps.describeprocess(process_id)
     except Exception as ex:  # pragma: no cover
         raise OWSNoApplicableCode(f"Failed to retrieve WPS process description. Error: [{ex!s}].")
     return wps_process
@@ -732,6 +836,40 @@ def parse_wps_inputs(wps_process, job, container=None):
     return wps_inputs
 
 
+def make_results_digest(results, settings):
+    # type: (List[JSON], SettingsType) -> List[JSON]
+    """
+    Adds the ``digestMultibase`` of file references stored in the WPS output directory to the results.
+
+    Digests memorized while the files were staged are reused, such that files are only read if their digest is unknown.
+    Saving them in the database job results avoids computing them again for every request of the results, and
+    discards them along with the job.
+
+    :param results: JSON mapping of data results as ``{"<id>": <definition>}`` entries where a reference can be found.
+    :param settings: container to retrieve current application settings.
+    """
+    wps_url = get_wps_output_url(settings)
+    wps_dir = get_wps_output_dir(settings)
+    for res in results:
+        if not isinstance(res, dict):
+            continue
+        ref = res.get("reference")
+        if isinstance(ref, str) and ref:
+            if ref.startswith("file://"):
+                ref = ref[7:]
+            if ref.startswith(wps_url):
+                ref = map_wps_output_location(ref, settings, exists=True, url=False)
+            if ref and ref.startswith(wps_dir) and os.path.isfile(ref):
+                try:
+                    res["digestMultibase"] = get_file_digest_multibase(ref)
+                except (OSError, ValueError, ImportError) as exc:
+                    LOGGER.warning("Could not compute digestMultibase for output file [%s]: %s", ref, exc)
+        data = res.get("data")
+        if isinstance(data, list):
+            make_results_digest(data, settings)
+    return results
+
+
 def make_results_relative(results, settings):
     # type: (List[JSON], SettingsType) -> List[JSON]
     """
@@ -0,0 +1,152 @@
+"""
+Utilities to capture the profile of a :term:`Job` execution performed by a :term:`Celery` worker.
+
+Profiling is disabled by default. It can be enabled for all jobs using the ``weaver.job_profiling`` setting,
+or requested for specific jobs using the :data:`JOB_PROFILING_HEADER` if ``weaver.job_profiling_header`` allows it.
+"""
+import cProfile
+import logging
+import os
+import sys
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from weaver.base import Constants
+from weaver.utils import asbool, get_header
+
+if TYPE_CHECKING:
+    from typing import Optional, Union
+
+    from weaver.typedefs import AnyHeadersContainer, AnySettingsContainer, Number
+
+    AnyProfiler = Union[cProfile.Profile, "SamplingProfiler"]
+
+LOGGER = logging.getLogger(__name__)
+
+JOB_PROFILING_HEADER = "X-Weaver-Profiling"
+
+
+class ProfilingFormat(Constants):
+    """
+    Supported formats of the profiling artifact produced for a :term:`Job`.
+    """
+    PSTATS = "pstats"
+    """
+    Deterministic profile of every function call, loadable with :mod:`pstats` or tools such as ``snakeviz``.
+    """
+
+    COLLAPSED = "collapsed"
+    """
+    Sampled call stacks in *collapsed* format (``frame;frame;frame count``), compatible with flame graph tools.
+    """
+
+
+class SamplingProfiler(object):
+    """
+    Statistical profiler that periodically samples the call stack of the profiled thread.
+
+    Provides the same methods as :class:`cProfile.Profile` employed by the :term:`Job` execution to allow using
+    either of them interchangeably. Because the profiled code is only interrupted at each sampling interval,
+    its overhead is much lower than the deterministic profiler, which makes it more appropriate for long jobs.
+    """
+
+    def __init__(self, interval=0.01):
+        # type: (Number) -> None
+        self.interval = interval
+        self.stacks = Counter()  # type: Counter[str]
+        self._thread_id = None  # type: Optional[int]
+        self._sampler = None  # type: Optional[threading.Thread]
+        self._stopped = threading.Event()
+
+    def enable(self):
+        # type: () -> None
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._sampler = threading.Thread(target=self._sample, name="job-profiling-sampler", daemon=True)
+        self._sampler.start()
+
+    def disable(self):
+        # type: () -> None
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample(self):
+        # type: () -> None
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)  # noqa: W0212
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def dump_stats(self, file):
+        # type: (str) -> None
+        with open(file, mode="w", encoding="utf-8") as prof_file:
+            for stack, count in self.stacks.most_common():
+                prof_file.write(f"{stack} {count}\n")
+
+
+def get_job_profiling_format(headers, settings):
+    # type: (Optional[AnyHeadersContainer], AnySettingsContainer) -> Optional[ProfilingFormat]
+    """
+    Obtain the profiling format to apply for the :term:`Job`, or ``None`` if profiling should not be applied.
+
+    When permitted by the settings, the :data:`JOB_PROFILING_HEADER` can either enable profiling using the default
+    format with a boolean-like value, request a specific :class:`ProfilingFormat`, or disable profiling with a
+    ``false`` value even if it was globally enabled.
+    """
+    enabled = asbool(settings.get("weaver.job_profiling", False))
+    prof_fmt = ProfilingFormat.get(settings.get("weaver.job_profiling_format"), default=ProfilingFormat.PSTATS)
+    if asbool(settings.get("weaver.job_profiling_header", False)):
+        header = str(get_header(JOB_PROFILING_HEADER, headers) or "").strip()
+        if header:
+            header_fmt = ProfilingFormat.get(header)
+            enabled = bool(header_fmt) or asbool(header)
+            prof_fmt = header_fmt or prof_fmt
+    return prof_fmt if enabled else None
+
+
+def start_job_profiling(headers, settings):
+    # type: (Optional[AnyHeadersContainer], AnySettingsContainer) -> Optional[AnyProfiler]
+    """
+    Start the profiler of the current thread if profiling is applicable for the :term:`Job`.
+    """
+    prof_fmt = get_job_profiling_format(headers, settings)
+    if not prof_fmt:
+        return None
+    if prof_fmt == ProfilingFormat.COLLAPSED:
+        interval = float(settings.get("weaver.job_profiling_interval") or 0.01)
+        profiler = SamplingProfiler(interval=max(interval, 0.001))
+    else:
+        profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as exc:  # another profiler is already active in this thread
+        LOGGER.warning("Cannot start job profiling [%s]", exc)
+        return None
+    return profiler
+
+
+def stop_job_profiling(profiler, path):
+    # type: (Optional[AnyProfiler], str) -> Optional[str]
+    """
+    Stop the profiler and save the profiling artifact.
+
+    :param profiler: Profiler returned by :func:`start_job_profiling`.
+    :param path: Location of the profiling artifact, without the file extension.
+    :returns: Location of the saved profiling artifact, or ``None`` if profiling was not applied.
+    """
+    if profiler is None:
+        return None
+    profiler.disable()
+    ext = ProfilingFormat.COLLAPSED if isinstance(profiler, SamplingProfiler) else ProfilingFormat.PSTATS
+    path = f"{path}.{ext}"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    profiler.dump_stats(path)
+    return path
@@ -12,14 +12,18 @@ generate :term:`ADES`/:term:`EMS` deployable :term:`Application Package`.
     - :mod:`weaver.wps_restapi.api` conformance details
 """
 import copy
+import hashlib
 import json
 import logging
 import os
 import shutil
 import sys
 import tempfile
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from functools import cache
 from typing import TYPE_CHECKING, cast, overload
 from urllib.parse import parse_qsl, urlparse
@@ -31,10 +35,11 @@ import cwltool.process
 import yaml
 from cwltool.context import LoadingContext, RuntimeContext
 from cwltool.cwlprov.writablebagfile import close_ro, packed_workflow
-from cwltool.factory import Factory as CWLFactory, WorkflowStatus as CWLException
+from cwltool.factory import Callable as CWLFactoryCallable, Factory as CWLFactory, WorkflowStatus as CWLException
 from cwltool.pathmapper import PathMapper
 from cwltool.process import shortname, use_custom_schema
 from cwltool.secrets import SecretStore
+from cwltool.workflow import default_make_tool as cwl_default_make_tool
 from pyramid.httpexceptions import HTTPOk, HTTPServiceUnavailable
 from pyramid.settings import asbool
 from pywps import Process
@@ -43,8 +48,8 @@ from pywps.inout.formats import Format
 from pywps.inout.inputs import BoundingBoxInput, ComplexInput, LiteralInput
 from pywps.inout.outputs import BoundingBoxOutput, ComplexOutput
 from pywps.inout.storage import STORE_TYPE, CachedStorage
-from pywps.inout.storage.file import FileStorage, FileStorageBuilder
-from pywps.inout.storage.s3 import S3Storage, S3StorageBuilder
+from pywps.inout.storage.file import FileStorage
+from pywps.inout.storage.s3 import S3Storage
 from pywps.validator import get_validator
 from pywps.validator.base import emptyvalidator
 from pywps.validator.mode import MODE
@@ -140,6 +145,7 @@ from weaver.utils import (
     OutputMethod,
     adjust_directory_local,
     adjust_file_local,
+    as_int,
     bytes2str,
     fetch_directory,
     fetch_file,
@@ -151,6 +157,7 @@ from weaver.utils import (
     get_job_log_msg,
     get_log_date_fmt,
     get_log_fmt,
+    get_s3_transfer_max_files,
     get_sane_name,
     get_secure_directory_name,
     get_settings,
@@ -167,14 +174,13 @@ from weaver.vault.utils import (
     map_vault_location,
     parse_vault_token
 )
-from weaver.wps.storage import ReferenceStatusLocationStorage
+from weaver.wps.storage import DigestFileStorage, ReferenceStatusLocationStorage, S3TransferStorage
 from weaver.wps.utils import get_wps_output_dir, get_wps_output_url, map_wps_output_location
 from weaver.wps_restapi import swagger_definitions as sd
 
 if TYPE_CHECKING:
     from typing import Any, AnyStr, Callable, Deque, Dict, List, Optional, Tuple, Type, Union
 
-    from cwltool.factory import Callable as CWLFactoryCallable
     from cwltool.process import Process as ProcessCWL
     from cwltool.utils import CWLObjectType
     from owslib.wps import WPSExecution
@@ -224,6 +230,8 @@ if TYPE_CHECKING:
     )
     from weaver.wps.service import WorkerRequest
 
+    WPS_InputLocation = Union[ComplexInput, BoundingBoxInput]
+
 
 # NOTE:
 #   Only use this logger for 'utility' methods (not residing under WpsPackage).
@@ -248,6 +256,11 @@ PACKAGE_PROGRESS_PREP_OUT = 98
 PACKAGE_PROGRESS_DONE = 100
 
 PACKAGE_SCHEMA_CACHE = {}  # type: Dict[str, Tuple[str, str]]
+PACKAGE_TOOL_CACHE = OrderedDict()  # type: OrderedDict[str, Tuple[ProcessCWL, str, CWL_WorkflowStepPackageMap]]
+PACKAGE_TOOL_CACHE_LOCK = threading.Lock()
+PACKAGE_TOOL_CACHE_SIZE = 32
+PACKAGE_INPUTS_FETCH_MAX_WORKERS = 8
+PACKAGE_INPUTS_FETCH_MAX_HOST_WORKERS = 4
 
 
 def get_status_location_log_path(status_location, out_dir=None):
@@ -528,8 +541,8 @@ def _load_weaver_extensions_schema():
     return weaver_schema
 
 
-def _load_supported_schemas():
-    # type: () -> None
+def _load_supported_schemas(preload=False):
+    # type: (bool) -> None
     """
     Loads :term:`CWL` schemas supported by `Weaver` to avoid validation errors when provided in requirements.
 
@@ -538,6 +551,13 @@ def _load_supported_schemas():
     functionalities when other :term:`Process` types than :term:`CWL`-based :term:`Application Package` are used.
 
     This operation must be called before the :class:`CWLFactory` attempts loading and validating a :term:`CWL` document.
+    Schema definitions are generated only once per process. Following calls only register them again with
+    :mod:`cwltool` if they were replaced in the meantime, to preserve the compiled schemas it already holds.
+
+    :param preload:
+        Compile the schemas immediately instead of waiting for the first :term:`CWL` document that requires them.
+        This allows to move the compilation overhead at application or worker startup
+        (see ``weaver.cwl_schemas_preload``).
     """
     # explicitly omit dev versions, only released versions allowed
     extension_resources = {
@@ -548,8 +568,12 @@ def _load_supported_schemas():
     for version, ext_version_file in extension_resources.items():
         # use our own cache on top of cwltool cache to distinguish between 'v1.x' names
         # pointing at "CWL standard", "cwltool-flavored extensions" or "weaver-flavored extensions"
-        if version in PACKAGE_SCHEMA_CACHE:
-            LOGGER.debug("Reusing cached CWL %s schema extensions.", version)
+        schema_cached = PACKAGE_SCHEMA_CACHE.get(version)
+        if schema_cached:
+            # avoid 'use_custom_schema' when already registered, since it drops the compiled schema in cwltool cache
+            if cwltool.process.custom_schemas.get(version) != schema_cached:
+                LOGGER.debug("Registering cached CWL %s schema extensions.", version)
+                use_custom_schema(version, *schema_cached)
             continue
         LOGGER.debug("Loading CWL %s schema extensions...", version)
         with open_module_resource_file(cwltool, ext_version_file) as r_file:
@@ -588,8 +612,17 @@ def _load_supported_schemas():
         use_custom_schema(version, schema_base, schema_data)
         PACKAGE_SCHEMA_CACHE[version] = (schema_base, schema_data)
 
+    if preload:
+        for version in extension_resources:
+            LOGGER.debug("Compiling CWL %s schema extensions...", version)
+            cwltool.process.get_schema(version)
+
     # ensure that any weaver-namespaced requirement can be loaded by cwltool
-    cwltool.process.supportedProcessRequirements.extend(set(CWL_REQUIREMENT_APP_WEAVER_DEFINITION.values()))
+    # (only once, to avoid growing the list each time a package is loaded)
+    requirements_missing = sorted(
+        set(CWL_REQUIREMENT_APP_WEAVER_DEFINITION.values()) - set(cwltool.process.supportedProcessRequirements)
+    )
+    cwltool.process.supportedProcessRequirements.extend(requirements_missing)
 
 
 @overload
@@ -666,6 +699,14 @@ def _load_package_content(package_dict,                             # type: CWL
 
     .. warning::
         Specified :paramref:`tmp_dir` will be deleted on exit.
+
+    .. note::
+        When the loaded :term:`CWL` tool object does not depend on the execution contexts (see
+        :func:`_is_package_tool_cacheable`), it is reused from :data:`PACKAGE_TOOL_CACHE` for following calls with
+        the same package definition, skipping the document loading and validation by :mod:`cwltool` entirely.
+        The :paramref:`runtime_context` remains specific to each call, and each call obtains its own shallow copy of
+        the cached tool object, such that references attached by :mod:`cwltool` during an execution (e.g.: provenance
+        of the research object) are never shared with other executions.
     """
 
     tmp_dir = tmp_dir or tempfile.mkdtemp()
@@ -706,13 +747,81 @@ def _load_package_content(package_dict,                             # type: CWL
     if only_dump_file:
         return
 
-    _load_supported_schemas()
     factory = CWLFactory(loading_context=loading_context, runtime_context=runtime_context)
+    tool_cache_key = None
+    if _is_package_tool_cacheable(package_type, loading_context):
+        tool_cache_key = _get_package_tool_cache_key(package_name, package_dict, step_packages)
+        tool_cached = _get_package_tool_cached(tool_cache_key)
+        if tool_cached:
+            LOGGER.debug("Reusing cached CWL tool object for package [%s].", package_name)
+            shutil.rmtree(tmp_dir)
+            tool, package_type, step_packages = tool_cached
+            return CWLFactoryCallable(copy.copy(tool), factory), package_type, dict(step_packages)
+
+    _load_supported_schemas()
     package = factory.make(tmp_json_cwl)  # type: CWLFactoryCallable
     shutil.rmtree(tmp_dir)
+    if tool_cache_key:
+        settings = get_settings(container) or {}
+        cache_size = as_int(settings.get("weaver.cwl_tool_cache_size"), default=PACKAGE_TOOL_CACHE_SIZE)
+        tool_cached = (copy.copy(package.t), package_type, dict(step_packages))
+        _set_package_tool_cached(tool_cache_key, tool_cached, cache_size)
     return package, package_type, step_packages
 
 
+def _is_package_tool_cacheable(package_type, loading_context=None):
+    # type: (str, Optional[LoadingContext]) -> bool
+    """
+    Determines if the :term:`CWL` tool object loaded from a package can be reused across executions.
+
+    A tool object cannot be reused if it was constructed with references specific to an execution. This is the case
+    of tools constructed by :meth:`WpsPackage.make_tool` (remote dispatch of steps bound to the executed job), which
+    includes every :term:`Workflow` since their steps are always dispatched this way. Construction of a
+    :term:`Workflow` by :mod:`cwltool` also binds the provenance of the execution to the tool and its steps.
+
+    Other tool objects are reused regardless of provenance being enabled, since :mod:`cwltool` attaches the
+    research object of the execution to the tool only when running it (applied to a copy of the cached tool object).
+    """
+    if package_type == ProcessType.WORKFLOW:
+        return False
+    if loading_context is None:
+        return True
+    return loading_context.construct_tool_object is cwl_default_make_tool
+
+
+def _get_package_tool_cache_key(package_name, package_dict, step_packages):
+    # type: (str, CWL, CWL_WorkflowStepPackageMap) -> str
+    """
+    Generates the digest of the complete package definition, including its :term:`Workflow` step packages.
+    """
+    package_data = json.dumps([package_name, package_dict, step_packages], sort_keys=True, default=str)
+    return hashlib.sha256(package_data.encode("utf-8")).hexdigest()
+
+
+def _get_package_tool_cached(cache_key):
+    # type: (str) -> Optional[Tuple[ProcessCWL, str, CWL_WorkflowStepPackageMap]]
+    with PACKAGE_TOOL_CACHE_LOCK:
+        tool_cached = PACKAGE_TOOL_CACHE.get(cache_key)
+        if tool_cached:
+            PACKAGE_TOOL_CACHE.move_to_end(cache_key)
+        return tool_cached
+
+
+def _set_package_tool_cached(cache_key, tool_cached, cache_size=PACKAGE_TOOL_CACHE_SIZE):
+    # type: (str, Tuple[ProcessCWL, str, CWL_WorkflowStepPackageMap], int) -> None
+    """
+    Stores the loaded :term:`CWL` tool object, evicting the least recently used ones above the cache size.
+    """
+    with PACKAGE_TOOL_CACHE_LOCK:
+        if cache_size <= 0:
+            PACKAGE_TOOL_CACHE.clear()
+            return
+        PACKAGE_TOOL_CACHE[cache_key] = tool_cached
+        PACKAGE_TOOL_CACHE.move_to_end(cache_key)
+        while len(PACKAGE_TOOL_CACHE) > cache_size:
+            PACKAGE_TOOL_CACHE.popitem(last=False)
+
+
 def _merge_package_inputs_outputs(wps_inputs_defs,      # type: Union[List[ANY_IO_Type], Dict[str, ANY_IO_Type]]
                                   cwl_inputs_list,      # type: List[WPS_Input_Type]
                                   wps_outputs_defs,     # type: Union[List[ANY_IO_Type], Dict[str, ANY_IO_Type]]
@@ -1446,15 +1555,17 @@ class DirectoryNestedStorage(CachedStorage):
         loc_path = f"{self.location(output.identifier)}/"  # local directory or S3 location
         url_path = f"{self.url(output.identifier)}/"       # HTTP output or same S3 location
         default_support = [DEFAULT_FORMAT] + [get_format(ctype) for ctype in [ContentType.ANY, ContentType.TEXT_PLAIN]]
-        for file in files:
-            out_file_path_rel = file.split(root, 1)[-1]
+
+        def _store_file(_file):
+            # type: (Path) -> Tuple[str, Tuple[STORE_TYPE, Path, str]]
+            out_file_path_rel = _file.split(root, 1)[-1]
             out_cache_key = self._patch_destination(os.path.join(str(output.uuid), out_file_path_rel))
             out_ext = os.path.splitext(out_file_path_rel)[-1]
             out_ctype = get_content_type(out_ext)  # attempt guessing more specific format
             out_fmt = get_format(out_ctype)
             out_fmts = default_support + ([out_fmt] if out_fmt else [])
             out_file = ComplexOutput(out_cache_key, title=output.title, data_format=out_fmt, supported_formats=out_fmts)
-            out_file.file = file
+            out_file.file = _file
             out_file.uuid = output.uuid  # forward base directory auto-generated when storing file
             # create a copy in case the storage is used by many dirs, avoid concurrent read/write of distinct prefixes
             dir_storage = copy.copy(self.storage)
@@ -1464,7 +1575,16 @@ class DirectoryNestedStorage(CachedStorage):
                 # to preserve the nested output dir definition, it must be pushed as prefix
                 dir_storage.prefix = os.path.dirname(out_cache_key)
             out_file.storage = dir_storage
-            out_type, out_path, out_url = dir_storage.store(out_file)
+            return out_cache_key, dir_storage.store(out_file)
+
+        if isinstance(self.storage, S3Storage):
+            # upload files concurrently, since each transfer is mostly waiting after the network
+            settings = getattr(self.storage, "settings", None)
+            with ThreadPoolExecutor(max_workers=get_s3_transfer_max_files(settings)) as executor:
+                stored = list(executor.map(_store_file, files))
+        else:
+            stored = [_store_file(file) for file in files]
+        for out_cache_key, (out_type, out_path, out_url) in stored:
             self._cache[out_cache_key] = (out_type, out_path, out_url)  # propagate up for direct reference as needed
             LOGGER.debug("Stored file [%s] for reference [%s] under [%s] directory located in [%s] for reference [%s].",
                          out_path, out_url, output.uuid, loc_path, url_path)
@@ -2352,7 +2472,8 @@ class WpsPackage(Process):
                                                                             # no data source for local package
                                                                             data_source=None,
                                                                             loading_context=loading_context,
-                                                                            runtime_context=runtime_context)
+                                                                            runtime_context=runtime_context,
+                                                                            container=self.settings)
             except Exception as ex:
                 raise PackageRegistrationError(f"Exception occurred on package instantiation: '{ex!r}'")
             self.update_status("Loading package content done.", PACKAGE_PROGRESS_LOADING, Status.RUNNING)
@@ -2475,6 +2596,7 @@ class WpsPackage(Process):
         :return: :term:`CWL` input values.
         """
         cwl_inputs = {}
+        staging_inputs = []  # type: List[Tuple[str, Optional[int], CWLIODefinition, WPS_InputLocation]]
         for input_id in wps_inputs:
             # skip empty inputs (if that is even possible...)
             input_occurs = wps_inputs[input_id]
@@ -2485,15 +2607,16 @@ class WpsPackage(Process):
             # handle as reference/data
             io_def = get_cwl_io_type(cwl_inputs_info[input_id], cwl_schema_names=cwl_schema_names)
             if isinstance(input_i, (ComplexInput, BoundingBoxInput)) or io_def.type in PACKAGE_COMPLEX_TYPES:
-                # extend array data that allow max_occur > 1
-                # drop invalid inputs returned as None
+                # locations are resolved afterward all at once to stage them concurrently
+                # placeholders preserve the input ordering, and array items are resolved with their index
                 if io_def.array:
-                    input_href = [self.make_location_input(io_def, input_def) for input_def in input_occurs]
-                    input_href = [cwl_input for cwl_input in input_href if cwl_input is not None]
+                    cwl_inputs[input_id] = [None] * len(input_occurs)
+                    staging_inputs.extend(
+                        (input_id, idx, io_def, input_def) for idx, input_def in enumerate(input_occurs)
+                    )
                 else:
-                    input_href = self.make_location_input(io_def, input_i)
-                if input_href:
-                    cwl_inputs[input_id] = input_href
+                    cwl_inputs[input_id] = None
+                    staging_inputs.append((input_id, None, io_def, input_i))
             elif isinstance(input_i, LiteralInput):
                 # extend array data that allow max_occur > 1
                 if io_def.array:
@@ -2503,8 +2626,125 @@ class WpsPackage(Process):
                 cwl_inputs[input_id] = input_data
             else:
                 raise PackageTypeError(f"Undefined package input for execution: {type(input_i)}.")
+
+        staged_inputs = self.make_location_inputs([(io_def, input_def) for _, _, io_def, input_def in staging_inputs])
+        for (input_id, index, _, _), input_href in zip(staging_inputs, staged_inputs):
+            if index is None:
+                cwl_inputs[input_id] = input_href
+            else:
+                cwl_inputs[input_id][index] = input_href
+        for input_id in {input_id for input_id, _, _, _ in staging_inputs}:
+            # extend array data that allow max_occur > 1
+            # drop invalid inputs returned as None
+            input_href = cwl_inputs[input_id]
+            if isinstance(input_href, list):
+                input_href = [cwl_input for cwl_input in input_href if cwl_input is not None]
+                cwl_inputs[input_id] = input_href
+            if not input_href:
+                cwl_inputs.pop(input_id)
         return cwl_inputs
 
+    def make_location_inputs(self, staging_inputs):
+        # type: (List[Tuple[CWLIODefinition, WPS_InputLocation]]) -> List[Optional[JSON]]
+        """
+        Resolves the locations of all specified inputs, staging them concurrently when they must be fetched.
+
+        The amount of concurrent staging operations is limited by ``weaver.inputs_fetch_max_workers`` in total,
+        and by ``weaver.inputs_fetch_max_host_workers`` for references pointing at the same host to avoid flooding
+        a single remote server. References that would be staged under the same name in the working directory are
+        staged one after another, in the order of the inputs, to avoid concurrent writes to the same location.
+        As soon as any input fails to be staged, other fetch operations in progress are aborted and pending ones
+        are cancelled, and the original error is raised.
+
+        :param staging_inputs: Expected CWL input definitions and corresponding WPS inputs to resolve.
+        :return: Resolved :term:`CWL` input locations, in the same order as the provided inputs.
+
+        .. seealso::
+            :meth:`make_location_input`
+        """
+        total = len(staging_inputs)
+        max_workers = as_int(self.settings.get("weaver.inputs_fetch_max_workers"),
+                             default=PACKAGE_INPUTS_FETCH_MAX_WORKERS)
+        max_workers = min(max_workers, total)
+        if max_workers <= 1:
+            return [self.make_location_input(io_def, input_def) for io_def, input_def in staging_inputs]
+
+        max_host_workers = as_int(self.settings.get("weaver.inputs_fetch_max_host_workers"),
+                                  default=PACKAGE_INPUTS_FETCH_MAX_HOST_WORKERS)
+        max_host_workers = max(max_host_workers, 1)
+        input_hosts = [urlparse(str(getattr(input_def, "url", None) or "")).hostname or ""
+                       for _, input_def in staging_inputs]
+        host_limits = {host: threading.BoundedSemaphore(max_host_workers) for host in set(input_hosts)}
+        # references staged under the same name are grouped to stage them sequentially in a single task
+        input_groups = {}  # type: Dict[Union[int, Tuple[str, str]], List[int]]
+        for idx, (io_def, input_def) in enumerate(staging_inputs):
+            input_name = os.path.basename(urlparse(str(getattr(input_def, "url", None) or "")).path.rstrip("/"))
+            # directories are staged under their input ID, files directly in the working directory
+            input_dir = input_def.identifier if io_def.type == PACKAGE_DIRECTORY_TYPE else ""
+            input_groups.setdefault((input_dir, input_name) if input_name else idx, []).append(idx)
+        task_kill_event = threading.Event()  # abort remaining tasks if set
+        task_progress_lock = threading.Lock()
+        task_completed = []  # type: List[str]
+        task_errors = []  # type: List[Exception]
+
+        def _abort_callback(_chunk):  # called progressively with downloaded chunks
+            # type: (AnyStr) -> None
+            if task_kill_event.is_set():
+                raise CancelledError("Other failed input staging task triggered abort event.")
+
+        def _stage_input(_input_host, _io_def, _input_def):
+            # type: (str, CWLIODefinition, WPS_InputLocation) -> Optional[JSON]
+            try:
+                with host_limits[_input_host]:
+                    _abort_callback(None)
+                    _location = self.make_location_input(_io_def, _input_def, fetch_callback=_abort_callback)
+            except Exception as _exc:
+                # abort immediately to avoid the worker picking a pending task
+                # keep only the first error, others are most probably caused by the abort itself
+                with task_progress_lock:
+                    if not task_kill_event.is_set():
+                        task_kill_event.set()
+                        task_errors.append(_exc)
+                raise
+            with task_progress_lock:
+                task_completed.append(_input_def.identifier)
+                _done = len(task_completed)
+                self.log_message(
+                    f"Staged inputs [{_done}/{total}] (last: {_input_def.identifier})",
+                    progress=map_progress(
+                        100 * _done / total, PACKAGE_PROGRESS_ADD_EO_IMAGES, PACKAGE_PROGRESS_CONVERT_INPUT
+                    ),
+                )
+            return _location
+
+        def _stage_group(_indexes):
+            # type: (List[int]) -> List[Optional[JSON]]
+            return [_stage_input(input_hosts[_idx], *staging_inputs[_idx]) for _idx in _indexes]
+
+        self.log_message(
+            f"Staging {total} inputs using {max_workers} workers "
+            f"(maximum {max_host_workers} per host across {len(host_limits)} hosts)."
+        )
+        timer = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="weaver-inputs") as executor:
+            futures = [executor.submit(_stage_group, indexes) for indexes in input_groups.values()]
+            try:
+                for future in as_completed(futures):
+                    future.result()  # raise immediately on first error
+            except Exception as exc:
+                task_kill_event.set()
+                executor.shutdown(wait=True, cancel_futures=True)
+                error = task_errors[0] if task_errors else exc
+                self.log_message(f"Aborted staging of remaining inputs following error: [{error!s}]",
+                                 level=logging.ERROR)
+                raise error
+        self.log_message(f"Staged {total} inputs in {time.perf_counter() - timer:.3f}s.")
+        locations = [None] * total  # type: List[Optional[JSON]]
+        for indexes, future in zip(input_groups.values(), futures):
+            for idx, location in zip(indexes, future.result()):
+                locations[idx] = location
+        return locations
+
     @staticmethod
     def make_literal_input(input_definition):
         # type: (LiteralInput) -> JSON
@@ -2591,8 +2831,8 @@ class WpsPackage(Process):
                     input_location = input_local_ref
         return input_location
 
-    def make_location_input(self, cwl_input_def, input_definition):
-        # type: (CWLIODefinition, Union[ComplexInput, BoundingBoxInput]) -> Optional[JSON]
+    def make_location_input(self, cwl_input_def, input_definition, fetch_callback=None):
+        # type: (CWLIODefinition, WPS_InputLocation, Optional[Callable[[AnyStr], None]]) -> Optional[JSON]
         """
         Generates the JSON content required to specify a `CWL` ``File`` or ``Directory`` input from a location.
 
@@ -2611,6 +2851,10 @@ class WpsPackage(Process):
         applicable by the relevant scheme of the reference. It is up to the remote location to provide listing
         capabilities accordingly to view available files.
 
+        :param cwl_input_def: Expected CWL input definition.
+        :param input_definition: WPS input to resolve.
+        :param fetch_callback: Function called with downloaded chunks when the input is fetched from a remote location.
+
         .. seealso::
             Documentation details of resolution based on schemes defined in :ref:`file_ref_types` section.
         """
@@ -2697,14 +2941,14 @@ class WpsPackage(Process):
         if self.must_fetch(input_location, cwl_input_def.type):
             self.log_message(f"{cwl_input_def.type} input ({input_id}) ATTEMPT fetch: [{input_location}]")
             if cwl_input_def.type == PACKAGE_FILE_TYPE:
-                input_location = fetch_file(input_location, input_definition.workdir,
+                input_location = fetch_file(input_location, input_definition.workdir, callback=fetch_callback,
                                             settings=self.settings, headers=self.auth)
             elif cwl_input_def.type == PACKAGE_DIRECTORY_TYPE:
                 # Because a directory reference can contain multiple sub-dir definitions,
                 # avoid possible conflicts with other inputs by nesting them under the ID.
                 # This also ensures that each directory input can work with a clean staging directory.
                 out_dir = cast(str, os.path.join(input_definition.workdir, input_definition.identifier))
-                locations = fetch_directory(input_location, out_dir,
+                locations = fetch_directory(input_location, out_dir, callback=fetch_callback,
                                             settings=self.settings, headers=self.auth)
                 if not locations:
                     raise PackageExecutionError(
@@ -3001,13 +3245,13 @@ class WpsPackage(Process):
         :return: Storage implementation.
         """
         if location_type == PACKAGE_FILE_TYPE and storage_type == STORE_TYPE.PATH:
-            storage = FileStorageBuilder().build()
+            storage = DigestFileStorage.build()
         elif location_type == PACKAGE_FILE_TYPE and storage_type == STORE_TYPE.S3:
-            storage = S3StorageBuilder().build()
+            storage = S3TransferStorage.build(self.settings)
         elif location_type == PACKAGE_DIRECTORY_TYPE and storage_type == STORE_TYPE.PATH:
-            storage = DirectoryNestedStorage(FileStorageBuilder().build())
+            storage = DirectoryNestedStorage(DigestFileStorage.build())
         elif location_type == PACKAGE_DIRECTORY_TYPE and storage_type == STORE_TYPE.S3:
-            storage = DirectoryNestedStorage(S3StorageBuilder().build())
+            storage = DirectoryNestedStorage(S3TransferStorage.build(self.settings))
         else:
             raise PackageExecutionError(
                 "Cannot resolve unknown location storage for "
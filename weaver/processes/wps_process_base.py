@@ -387,7 +387,7 @@ class WpsProcessInterface(abc.ABC):
                 #   Because CWL expects the file to be in specified 'out_dir', make a link for it to be found
                 #   even though the file is stored in the full job output location instead (already staged by step).
                 map_path = map_wps_output_location(value, self.settings)
-                out_method = OutputMethod.COPY
+                out_method = OutputMethod.AUTO  # clone local files without copying their contents if possible
                 if map_path:
                     LOGGER.info("Detected result [%s] from [%s] as local reference to this instance. "
                                 "Skipping fetch and using local copy in output destination: [%s]",
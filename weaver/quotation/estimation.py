@@ -9,7 +9,6 @@ import colander
 import requests
 import simplejson
 import yaml
-from beaker.cache import cache_region
 from bs4 import BeautifulSoup
 from pyramid_celery import celery_app as app
 
@@ -17,6 +16,7 @@ from weaver.database import get_db
 from weaver.datatype import DockerAuthentication
 from weaver.exceptions import QuoteConversionError, QuoteEstimationError, QuoteException
 from weaver.formats import ContentType, OutputFormat
+from weaver.metrics.utils import cache_region
 from weaver.owsexceptions import OWSInvalidParameterValue
 from weaver.processes.constants import WPS_COMPLEX, WPS_LITERAL, JobInputsOutputsSchema
 from weaver.processes.convert import convert_input_values_schema
@@ -0,0 +1,102 @@
+"""
+Renderers employed to serialize the responses of the :term:`API`.
+
+When enabled with ``weaver.json_renderer = orjson``, the default :term:`JSON` renderer of :mod:`pyramid` is replaced
+by one employing :mod:`orjson` which serializes large bodies (e.g.: detailed listing of :term:`Job` and
+:term:`Process` descriptions, :term:`OpenAPI` document) considerably faster than :mod:`json`. Objects that are
+not natively supported are resolved using the same handlers as the default renderer, or by
+:func:`weaver.formats.json_default_handler`. Values that :mod:`orjson` refuses (e.g.: integers above 64 bits)
+are serialized by :mod:`json` instead, such that the fast renderer never fails where the default one succeeds.
+
+.. warning::
+    This module must remain importable by :mod:`weaver` without loading the :term:`API` definitions.
+    Therefore, it should not import :mod:`weaver.wps_restapi` modules.
+"""
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from pyramid.renderers import JSON
+
+from weaver.formats import OutputFormat, json_default_handler
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover  # optional dependency
+    orjson = None
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Optional
+
+    from pyramid.config import Configurator
+
+    from weaver.typedefs import AnySettingsContainer, JSON as AnyJSON
+
+LOGGER = logging.getLogger(__name__)
+
+JSON_RENDERER_DEFAULT = "json"
+JSON_RENDERER_FAST = "orjson"
+
+
+def get_json_renderer(container):
+    # type: (AnySettingsContainer) -> str
+    """
+    Obtain the :term:`JSON` renderer that is effectively employed according to the configured settings.
+
+    If the fast renderer is requested, but its package is not installed, the default renderer is returned.
+    """
+    from weaver.utils import get_settings  # pylint: disable=C0415  # avoid circular import
+
+    settings = get_settings(container)
+    renderer = str(settings.get("weaver.json_renderer") or JSON_RENDERER_DEFAULT).strip().lower()
+    if renderer == JSON_RENDERER_FAST and orjson is not None:
+        return JSON_RENDERER_FAST
+    return JSON_RENDERER_DEFAULT
+
+
+def json_dumps_fast(value, default=None, **__):
+    # type: (AnyJSON, Optional[Callable[[Any], Any]], **Any) -> bytes
+    """
+    Serialize the value to :term:`JSON` using :mod:`orjson`, falling back to :mod:`json` for unsupported values.
+
+    Compatible with the ``serializer`` of :class:`pyramid.renderers.JSON`, which provides the ``default`` handler
+    resolving objects with a ``__json__`` method or registered adapters. Objects not resolved by it are passed
+    to :func:`weaver.formats.json_default_handler`. Date and time objects are serialized natively by :mod:`orjson`,
+    with the same ISO-8601 representation as the one obtained with the default renderer.
+
+    :param value: Data to serialize.
+    :param default: Handler of objects that cannot be serialized natively.
+    :returns: Serialized :term:`JSON` as UTF-8 encoded bytes.
+    """
+    def default_handler(obj):
+        # type: (Any) -> Any
+        if default is not None:
+            try:
+                return default(obj)
+            except TypeError:
+                pass
+        return json_default_handler(obj)
+
+    try:
+        return orjson.dumps(
+            value,
+            default=default_handler,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+    except TypeError:  # 'orjson.JSONEncodeError' is a subclass
+        return json.dumps(value, default=default_handler).encode("utf-8")
+
+
+def includeme(config):
+    # type: (Configurator) -> None
+    settings = config.registry.settings
+    renderer = str(settings.get("weaver.json_renderer") or JSON_RENDERER_DEFAULT).strip().lower()
+    if renderer not in [JSON_RENDERER_DEFAULT, JSON_RENDERER_FAST]:
+        LOGGER.warning("Unknown JSON renderer [weaver.json_renderer=%s]. Using default renderer.", renderer)
+        return
+    if get_json_renderer(settings) != JSON_RENDERER_FAST:
+        if renderer == JSON_RENDERER_FAST:
+            LOGGER.warning("Package 'orjson' is not installed [weaver.json_renderer=orjson]. Using default renderer.")
+        return
+    LOGGER.info("Adding fast JSON renderer [weaver.json_renderer=orjson].")
+    config.add_renderer(OutputFormat.JSON, JSON(serializer=json_dumps_fast))
@@ -202,6 +202,11 @@ class StoreJobs(StoreInterface):
         # type: (Job) -> Job
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def append_job_logs(self, job_id, logs):
+        # type: (AnyUUID, List[str]) -> bool
+        raise NotImplementedError
+
     @abc.abstractmethod
     def delete_job(self, job_id):
         # type: (AnyUUID) -> bool
@@ -236,6 +241,11 @@ class StoreJobs(StoreInterface):
                   ):                        # type: (...) -> JobSearchResult
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def count_jobs_by_status(self):
+        # type: () -> Dict[str, int]
+        raise NotImplementedError
+
     @abc.abstractmethod
     def clear_jobs(self):
         # type: () -> bool
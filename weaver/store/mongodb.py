@@ -979,6 +979,25 @@ class MongodbJobStore(StoreJobs, MongodbStore, ListingMixin):
             raise JobUpdateError(f"Error occurred during job update: [{ex!r}]")
         raise JobUpdateError(f"Failed to update specified job: '{job!s}'")
 
+    def append_job_logs(self, job_id, logs):
+        # type: (AnyUUID, List[str]) -> bool
+        """
+        Appends log entries to a job in `MongoDB` storage, without modifying any other field.
+
+        :param job_id: Job to update.
+        :param logs: Log entries to add after the existing ones.
+        :return: Whether the job was updated.
+        """
+        if isinstance(job_id, str):
+            job_id = uuid.UUID(job_id)
+        if not logs:
+            return False
+        result = self.collection.update_one(
+            {"id": job_id},
+            {"$push": {"logs": {"$each": list(logs)}}, "$set": {"updated": now()}},
+        )
+        return result.modified_count == 1
+
     def delete_job(self, job_id):
         # type: (AnyUUID) -> bool
         """
@@ -1302,6 +1321,14 @@ class MongodbJobStore(StoreJobs, MongodbStore, ListingMixin):
             pipeline[1]["$match"].update({"duration": duration_filter})
         return pipeline
 
+    def count_jobs_by_status(self):
+        # type: () -> Dict[str, int]
+        """
+        Counts all jobs in `MongoDB` storage by their status, without loading the job details.
+        """
+        pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+        return {str(group["_id"]): group["count"] for group in self.collection.aggregate(pipeline)}
+
     def clear_jobs(self):
         # type: () -> bool
         """
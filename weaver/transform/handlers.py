@@ -1,10 +1,12 @@
 import base64
+import contextlib
 import csv
+import math
 import os.path
 import shutil
 import tarfile
 import tempfile
-from typing import List
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import xmltodict
 import yaml
@@ -18,13 +20,25 @@ from PIL import Image
 from pyramid.httpexceptions import HTTPUnprocessableEntity
 from pyramid.response import FileResponse
 
+from weaver.file_cache import FileCache, get_file_cache
 from weaver.formats import OutputFormat, get_extension
 from weaver.transform.png2svg import rgba_image_to_svg_contiguous
+from weaver.transform.streaming import StreamUnsupportedError, stream_convert
 from weaver.transform.tiff import Tiff
 from weaver.transform.utils import get_content, is_gif, is_image, is_png, is_svg, is_tiff, write_content
+from weaver.utils import as_int, get_settings, parse_number_with_unit
+
+if TYPE_CHECKING:
+    from weaver.typedefs import AnySettingsContainer
 
 LOGGER = get_task_logger(__name__)
 
+TRANSFORM_CACHE_DIR_NAME = "weaver-transforms"
+TRANSFORM_CACHE_DEFAULT_SIZE = "1GiB"
+TRANSFORM_CACHE_DEFAULT_EXPIRE = 86400
+TRANSFORM_STREAM_DEFAULT_THRESHOLD = "64MiB"
+SVG_BASE_WIDTH = 300  # images are resized to this width for conversion to SVG, since each pixel generates shapes
+
 HTML_CONTENT = """<html>
     <head></head>
     <body><p>%CONTENT%</p></body>
@@ -50,13 +64,76 @@ def exception_handler(func):
     return inner_function
 
 
+def get_transform_cache(settings: Optional["AnySettingsContainer"]) -> Optional[FileCache]:
+    """
+    Obtain the cache of files transformed to alternate media-types, or ``None`` if caching is disabled.
+
+    .. seealso::
+        Settings ``weaver.transform_cache_dir``, ``weaver.transform_cache_size`` and ``weaver.transform_cache_expire``.
+
+    :param settings: Application settings.
+    :return: The cache of transformed files.
+    """
+    settings = get_settings(settings) if settings else {}
+    cache_size = settings.get("weaver.transform_cache_size", TRANSFORM_CACHE_DEFAULT_SIZE)
+    try:
+        cache_size = int(parse_number_with_unit(str(cache_size), binary=True))
+    except ValueError:
+        LOGGER.warning("Invalid [weaver.transform_cache_size = %s]. Using default [%s].",
+                       cache_size, TRANSFORM_CACHE_DEFAULT_SIZE)
+        cache_size = int(parse_number_with_unit(TRANSFORM_CACHE_DEFAULT_SIZE, binary=True))
+    cache_age = as_int(settings.get("weaver.transform_cache_expire"), default=TRANSFORM_CACHE_DEFAULT_EXPIRE)
+    cache_dir = settings.get("weaver.transform_cache_dir")
+    if not cache_dir:
+        # never under the served WPS output directory, since cached files of any job would be exposed
+        work_dir = settings.get("weaver.wps_workdir") or tempfile.gettempdir()
+        cache_dir = os.path.join(work_dir, TRANSFORM_CACHE_DIR_NAME)
+    return get_file_cache(cache_dir, cache_size, max_age=cache_age if cache_age > 0 else None)
+
+
+def get_transform_stream_threshold(settings: Optional["AnySettingsContainer"]) -> int:
+    """
+    Obtain the file size above which structured text files are converted by streaming their contents.
+
+    .. seealso::
+        Setting ``weaver.transform_stream_threshold``.
+
+    :param settings: Application settings.
+    :return: The file size threshold in bytes.
+    """
+    settings = get_settings(settings) if settings else {}
+    threshold = settings.get("weaver.transform_stream_threshold", TRANSFORM_STREAM_DEFAULT_THRESHOLD)
+    try:
+        return int(parse_number_with_unit(str(threshold), binary=True))
+    except ValueError:
+        LOGGER.warning("Invalid [weaver.transform_stream_threshold = %s]. Using default [%s].",
+                       threshold, TRANSFORM_STREAM_DEFAULT_THRESHOLD)
+        return int(parse_number_with_unit(TRANSFORM_STREAM_DEFAULT_THRESHOLD, binary=True))
+
+
+def get_transform_image_max_size(settings: Optional["AnySettingsContainer"]) -> Optional[int]:
+    """
+    Obtain the maximum width or height of images generated from GeoTIFF files.
+
+    .. seealso::
+        Setting ``weaver.transform_image_max_size``.
+
+    :param settings: Application settings.
+    :return: The maximum image size in pixels, or ``None`` to generate images at full resolution.
+    """
+    settings = get_settings(settings) if settings else {}
+    max_size = as_int(settings.get("weaver.transform_image_max_size"), default=0)
+    return max_size if max_size > 0 else None
+
+
 @exception_handler
-def image_to_any(image: str, out: str) -> None:
+def image_to_any(image: str, out: str, max_size: Optional[int] = None) -> None:
     """
     Converts image files to a specified output format. If no conversion is needed, it copies the file.
 
     :param image: Input image file path.
     :param out: Output file path.
+    :param max_size: Maximum width or height of images generated from a GeoTIFF, using a decimated preview.
     """
     # exit if no transformation needed
     if os.path.splitext(image)[1] == os.path.splitext(out)[1]:
@@ -66,7 +143,11 @@ def image_to_any(image: str, out: str) -> None:
 
     if is_tiff(image):
         tif = Tiff(image)
-        return images_to_any(tif.get_images(), out)
+        preview_size = max_size
+        if is_svg(out) and tif.is_geotiff:
+            # only read the resolution needed for the resized SVG, using overviews or decimated reads as available
+            preview_size = math.ceil(SVG_BASE_WIDTH * max(tif.width, tif.height) / tif.width)
+        return images_to_any(tif.iter_images(max_size=preview_size), out)
 
     if is_gif(image):
         return images_to_any([Image.open(image).convert("RGB")], out)
@@ -82,24 +163,28 @@ def image_to_any(image: str, out: str) -> None:
     return images_to_any([Image.open(image)], out)
 
 
-def images_to_any(images: List[Image.Image], out: str) -> None:
+def images_to_any(images: Iterable[Image.Image], out: str) -> None:
     """
-    Processes a list of images and converts them to the desired format, saving them in the specified output path.
+    Processes images and converts them to the desired format, saving them in the specified output path.
+
+    Images are converted one at a time. When more than one image is provided, each converted image is written to
+    a ``.tar.gz`` archive as soon as it is generated, such that only one image is held in memory at once.
 
-    :param images: List of Image objects to process.
+    :param images: Image objects to process, which can be loaded lazily.
     :param out: Output file path.
     """
-    ret = []
-    with tempfile.TemporaryDirectory() as tmp_path:
-        _o = os.path.join(tmp_path, str(len(ret)).zfill(4) + get_extension(out))
-        for img in images:
+    with tempfile.TemporaryDirectory() as tmp_path, contextlib.ExitStack() as stack:
+        tar = None
+        first = None
+        for index, img in enumerate(images):
+            _o = os.path.join(tmp_path, str(index).zfill(4) + get_extension(out))
             clrs = img.getpixel((0, 0))
             if not isinstance(clrs, tuple):
                 img = img.convert("RGB")
                 clrs = img.getpixel((0, 0))
             if is_svg(_o):
                 width, height = img.size
-                basewidth = 300
+                basewidth = SVG_BASE_WIDTH
                 if max(width, height) > basewidth:
                     wpercent = basewidth / float(img.size[0])
                     hsize = int((float(img.size[1]) * float(wpercent)))
@@ -122,18 +207,21 @@ def images_to_any(images: List[Image.Image], out: str) -> None:
                     img.save(_o)
             else:
                 raise RuntimeError(f"Unsupported format: {_o}")
-            ret.append(_o)
+            del img
 
-        if len(ret) == 1:
-            shutil.copy(ret[0], out)
-        else:
-            if not out.endswith(".tar.gz"):
-                out += ".tar.gz"
+            if first is None:
+                first = _o  # single image output is copied directly, defer archive until another one is found
+                continue
+            if tar is None:
+                tar_out = out if out.endswith(".tar.gz") else f"{out}.tar.gz"
+                tar = stack.enter_context(tarfile.open(tar_out, "w:gz"))
+                tar.add(first, arcname=os.path.basename(first))
+                os.remove(first)
+            tar.add(_o, arcname=os.path.basename(_o))
+            os.remove(_o)
 
-            with tarfile.open(out, "w:gz") as tar:
-                for file_name in ret:
-                    path = os.path.join(tmp_path, file_name)
-                    tar.add(path, arcname=file_name)
+        if first is not None and tar is None:
+            shutil.copy(first, out)
 
 
 @exception_handler
@@ -180,7 +268,7 @@ def any_to_pdf(i: str, out: str) -> None:
     else:
         if is_tiff(i):
             tiff = Tiff(i)
-            images = tiff.get_images()  # For TIFF files with multiple pages
+            images = tiff.iter_images()  # For TIFF files with multiple pages, loaded one at a time
         else:
             images = [image.convert("RGB")]
 
@@ -400,6 +488,7 @@ class Transform:
     :param file_path: The path to the input file to be transformed.
     :param current_media_type: The media type of the input file.
     :param wanted_media_type: The desired media type after transformation.
+    :param settings: Application settings to reuse transformed files from the cache, if enabled.
 
     Attributes:
         file_path (str): The path to the input file to be transformed.
@@ -407,33 +496,52 @@ class Transform:
         wanted_media_type (str): The desired media type after transformation.
         output_path (str): The path where the transformed file will be saved.
         ext (str): The extension of the output file based on the wanted media type.
+        cache (FileCache): Cache of transformed files, or ``None`` if not applicable.
+        stream_threshold (int): File size above which structured text files are converted by streaming.
+        image_max_size (int): Maximum width or height of images generated from GeoTIFF files, if limited.
 
     Methods:
         process():
             Initiates the file transformation process based on the input and output media types.
+        process_stream():
+            Converts structured text files by streaming their contents, if supported.
+        process_cached():
+            Obtains the transformed file from the cache, or processes and caches it if not available.
+        pending():
+            Indicates if the transformation is currently being processed by another request or worker.
         get():
             Returns a `FileResponse` with the transformed file for download.
     """
 
-    def __init__(self, file_path: str, current_media_type: str, wanted_media_type: str):
+    def __init__(
+        self,
+        file_path: str,
+        current_media_type: str,
+        wanted_media_type: str,
+        settings: Optional["AnySettingsContainer"] = None,
+    ):
         """
         Initializes the Transform object with file paths and media types.
 
         :param file_path: Path to the file to be transformed.
         :param current_media_type: The media type of the input file.
         :param wanted_media_type: The desired media type for the output file.
+        :param settings: Application settings to reuse transformed files from the cache, if enabled.
         """
         self.file_path = file_path
         self.cmt = current_media_type.lower()
         self.wmt = wanted_media_type.lower()
         self.output_path = self.file_path
+        self.cache = get_transform_cache(settings) if settings is not None else None
+        self.stream_threshold = get_transform_stream_threshold(settings)
+        self.image_max_size = get_transform_image_max_size(settings)
 
         self.ext = get_extension(self.wmt)
 
         if self.cmt != self.wmt:
             base_path, _ = os.path.splitext(self.file_path)
             self.output_path = base_path + self.ext
-            if os.path.exists(self.output_path):
+            if os.path.exists(self.output_path) and self.cache is None:
                 try:
                     os.remove(self.output_path)
                 except OSError as exc:
@@ -447,6 +555,8 @@ class Transform:
         """
         try:
             if self.output_path != self.file_path:
+                if os.path.getsize(self.file_path) > self.stream_threshold and self.process_stream():
+                    return
                 if "text/" in self.cmt:
                     self.process_text()
                 elif "application/" in self.cmt:
@@ -456,6 +566,62 @@ class Transform:
         except Exception as e:
             raise RuntimeError(f"Error processing file {self.file_path}: {str(e)}")
 
+    def process_stream(self) -> bool:
+        """
+        Converts structured text files (e.g., CSV, JSON, YAML, XML) by streaming their contents.
+
+        :returns: Whether the file was converted, or if the in-memory conversion must be used instead.
+        """
+        try:
+            if stream_convert(self.file_path, self.output_path, self.cmt, self.wmt):
+                LOGGER.debug("Converted file [%s] by streaming (%s -> %s)", self.file_path, self.cmt, self.wmt)
+                return True
+        except StreamUnsupportedError as exc:
+            LOGGER.debug("Cannot stream conversion of [%s] (%s -> %s): %s", self.file_path, self.cmt, self.wmt, exc)
+        return False
+
+    def _cache_key(self) -> str:
+        file_stat = os.stat(self.file_path)
+        file_ref = f"{os.path.realpath(self.file_path)}:{file_stat.st_size}:{file_stat.st_mtime_ns}"
+        return f"transform:{file_ref}:{self.wmt}"
+
+    def pending(self) -> bool:
+        """
+        Indicates if the transformation is currently being precomputed by a worker.
+
+        Transformations processed by other requests are not considered pending, since concurrent requests of the
+        same transformation wait for a single processing instead.
+
+        :returns: Whether the transformed file is pending, which is only known if the cache is enabled.
+        """
+        if self.cache is None or self.output_path == self.file_path or not os.path.isfile(self.file_path):
+            return False
+        return self.cache.locked(self._cache_key(), marker=True)
+
+    def process_cached(self, precompute: bool = False) -> None:
+        """
+        Obtains the transformed file from the cache, or processes and caches it if not available.
+
+        Cached files are identified by the location, size and modification time of the input file, and the wanted
+        media type. Concurrent requests of the same transformation wait for a single processing. A transformed file
+        already generated from the cache by a previous request is left unmodified, such that it is served directly.
+
+        :param precompute: Indicates that the transformation is generated ahead of requests (see :meth:`pending`).
+        """
+        cache_key = self._cache_key()
+        out_dir = os.path.dirname(self.output_path)
+        with self.cache.lock(cache_key, marker=precompute):
+            entry = self.cache.get(cache_key, touch=False)
+            out_path = self.cache.link(entry, out_dir) if entry else None
+            if not out_path:
+                if os.path.exists(self.output_path):
+                    os.remove(self.output_path)
+                self.process()
+                entry = self.cache.store_file(cache_key, os.path.basename(self.output_path), self.output_path)
+                out_path = self.cache.link(entry, out_dir)
+                LOGGER.debug("Cached transformed file [%s] (%s -> %s)", out_path, self.cmt, self.wmt)
+            self.output_path = out_path
+
     def process_text(self) -> None:
         """
         Handles the transformation of text-based files (e.g., plain text, HTML, CSV).
@@ -553,7 +719,7 @@ class Transform:
         :raises RuntimeError: If a conversion type is unsupported.
         """
         if "image/" in self.wmt:
-            image_to_any(self.file_path, self.output_path)
+            image_to_any(self.file_path, self.output_path, max_size=self.image_max_size)
             if not os.path.exists(self.output_path) and os.path.exists(f"{self.output_path}.tar.gz"):
                 self.output_path += ".tar.gz"
         elif "pdf" in self.wmt:
@@ -569,7 +735,9 @@ class Transform:
         :raises HTTPUnprocessableEntity: If an error occurs during file transformation.
         """
         try:
-            if not os.path.exists(self.output_path):
+            if self.cache is not None and self.output_path != self.file_path:
+                self.process_cached()
+            elif not os.path.exists(self.output_path):
                 self.process()
             response = FileResponse(self.output_path)
             response.headers["Content-Disposition"] = f"attachment;  filename={os.path.basename(self.output_path)}"
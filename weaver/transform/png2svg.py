@@ -10,6 +10,7 @@ from collections import deque
 from io import StringIO
 from typing import List, Optional, Tuple
 
+import numpy as np
 from PIL import Image
 
 
@@ -88,106 +89,185 @@ def joined_edges(
     return pieces
 
 
+# clockwise order of edge directions, used to select the next edge when tracing the boundary of pixel groups
+EDGE_DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+
+def label_contiguous_pixels(colors: np.ndarray, included: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Labels groups of horizontally or vertically adjacent pixels of identical color.
+
+    Pixels are linked by union-find using vectorized operations on all adjacent pairs at once, followed by pointer
+    jumping until every pixel refers directly to the root of its group. The root of a group is its first pixel in
+    flattened order, which is used as label.
+
+    :param colors: 2D array of packed pixel colors.
+    :param included: Optional 2D mask of pixels to consider. Excluded pixels are never linked to any other pixel.
+    :returns: Flattened array of group labels.
+    """
+    index = np.arange(colors.size).reshape(colors.shape)
+    linked = [
+        (colors[1:, :] == colors[:-1, :], index[1:, :], index[:-1, :]),
+        (colors[:, 1:] == colors[:, :-1], index[:, 1:], index[:, :-1]),
+    ]
+    if included is not None:
+        linked = [
+            (same & inc_a & inc_b, idx_a, idx_b)
+            for (same, idx_a, idx_b), inc_a, inc_b in zip(
+                linked,
+                [included[1:, :], included[:, 1:]],
+                [included[:-1, :], included[:, :-1]],
+            )
+        ]
+    pair_a = np.concatenate([idx_a[same] for same, idx_a, _ in linked])
+    pair_b = np.concatenate([idx_b[same] for same, _, idx_b in linked])
+    labels = index.ravel().copy()
+    while pair_a.size:
+        root_a = labels[pair_a]
+        root_b = labels[pair_b]
+        diff = root_a != root_b
+        if not diff.any():
+            break
+        pair_a, pair_b, root_a, root_b = pair_a[diff], pair_b[diff], root_a[diff], root_b[diff]
+        np.minimum.at(labels, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+    return labels
+
+
+def _cycle_order(successor: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Obtains the cycle and position of every item of a permutation, using pointer jumping.
+
+    :returns: Smallest item of the cycle of each item, and distance of each item from the end of its cycle.
+    """
+    count = successor.size
+    first = np.arange(count)
+    jump = successor.copy()
+    span = 1
+    while span < count:
+        first = np.minimum(first, first[jump])
+        jump = jump[jump]
+        span *= 2
+    last = successor == first
+    distance = np.where(last, 0, 1)
+    jump = np.where(last, np.arange(count), successor)
+    span = 1
+    while span < count:
+        distance = distance + distance[jump]
+        jump = jump[jump]
+        span *= 2
+    return first, distance
+
+
 def rgba_image_to_svg_contiguous(
     img: Image.Image,
     opaque: Optional[bool] = None,
     keep_every_point: bool = False,
 ) -> str:
-    # collect contiguous pixel groups
-
-    adjacent = ((1, 0), (0, 1), (-1, 0), (0, -1))
-    visited = Image.new("1", img.size, 0)
-
-    color_pixel_lists = {}
-
+    """
+    Converts an image to SVG with one filled path for every group of contiguous pixels of identical color.
+
+    Pixel groups, their boundary edges and the joining of edges into closed shapes are resolved with vectorized
+    operations over arrays of the image, such that the conversion time is proportional to the amount of pixels.
+    Edges are indexed by their starting vertex and direction, in order to find the following edge of a boundary
+    directly, turning in the same order as :func:`joined_edges`.
+
+    :param img: Image to convert. Converted to ``RGBA`` colors if needed.
+    :param opaque: Omit fully transparent pixels.
+    :param keep_every_point: Keep every pixel vertex of shapes instead of joining aligned edges.
+    :returns: SVG contents.
+    """
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
     width, height = img.size
-    for x in range(width):
-        for y in range(height):
-            here = (x, y)
-            if visited.getpixel(here):
-                continue
-            rgba = img.getpixel((x, y))
-            if opaque and not rgba[3]:
-                continue
-            piece = []
-            queue = [here]
-            visited.putpixel(here, 1)
-            while queue:
-                here = queue.pop()
-                for offset in adjacent:
-                    neighbour = add_tuple(here, offset)
-                    if not 0 <= neighbour[0] < width or not 0 <= neighbour[1] < height:
-                        continue
-                    if visited.getpixel(neighbour):
-                        continue
-                    neighbour_rgba = img.getpixel(neighbour)
-                    if neighbour_rgba != rgba:
-                        continue
-                    queue.append(neighbour)
-                    visited.putpixel(neighbour, 1)
-                piece.append(here)
-
-            if rgba not in color_pixel_lists:
-                color_pixel_lists[rgba] = []
-            color_pixel_lists[rgba].append(piece)
-
-    del adjacent
-    del visited
-
-    # calculate clockwise edges of pixel groups
-
-    edges = {
-        (-1, 0): ((0, 0), (0, 1)),
-        (0, 1): ((0, 1), (1, 1)),
-        (1, 0): ((1, 1), (1, 0)),
-        (0, -1): ((1, 0), (0, 0)),
-    }
-
-    color_edge_lists = {}
-
-    for rgba, pieces in color_pixel_lists.items():
-        for piece_pixel_list in pieces:
-            edge_set = set([])
-            for coord in piece_pixel_list:
-                for offset, (start_offset, end_offset) in edges.items():
-                    neighbour = add_tuple(coord, offset)
-                    start = add_tuple(coord, start_offset)
-                    end = add_tuple(coord, end_offset)
-                    edge = (start, end)
-                    if neighbour in piece_pixel_list:
-                        continue
-                    edge_set.add(edge)
-            if rgba not in color_edge_lists:
-                color_edge_lists[rgba] = []
-            color_edge_lists[rgba].append(edge_set)
-
-    del color_pixel_lists
-    del edges
-
-    # join edges of pixel groups
-
-    color_joined_pieces = {}
-
-    for color, pieces in color_edge_lists.items():
-        color_joined_pieces[color] = []
-        for assorted_edges in pieces:
-            color_joined_pieces[color].append(joined_edges(assorted_edges, keep_every_point))
-
-    str = StringIO()
-    str.write(svg_header(*img.size))
-
-    for color, shapes in color_joined_pieces.items():
-        for shape in shapes:
-            str.write(""" <path d=" """)
-            for sub_shape in shape:
-                here = sub_shape.pop(0)[0]
-                str.write(f" M {here[0]},{here[1]} ")
-                for edge in sub_shape:
-                    here = edge[0]
-                    str.write(f" L {here[0]},{here[1]} ")
-                str.write(" Z ")
-            str.write(
-                f""" " style="fill:rgb{color[0:3]}; fill-opacity:{float(color[3]) / 255:.3f}; stroke:none;" />\n""")
-
-    str.write("""</svg>\n""")
-    return str.getvalue()
+    # transpose to (x, y) such that flattened indices follow the column-major visiting order of pixels
+    rgba = np.ascontiguousarray(np.asarray(img, dtype=np.uint8).transpose(1, 0, 2))
+    colors = rgba.view(np.uint32)[:, :, 0]
+    included = rgba[:, :, 3] > 0 if opaque else None
+    labels = label_contiguous_pixels(colors, included)
+
+    # calculate clockwise edges of pixel groups, where the neighbour is out of bounds or of another color
+    # each edge is defined by its starting vertex index in the (width + 1, height + 1) grid and its direction
+    vert_x, vert_y = np.meshgrid(np.arange(width), np.arange(height), indexing="ij")
+    edge_sides = [
+        # (pixel mask, start vertex offset, direction index)
+        (np.pad(colors[1:, :] != colors[:-1, :], ((1, 0), (0, 0)), constant_values=True), (0, 0), 0),  # left
+        (np.pad(colors[:, :-1] != colors[:, 1:], ((0, 0), (0, 1)), constant_values=True), (0, 1), 1),  # bottom
+        (np.pad(colors[:-1, :] != colors[1:, :], ((0, 1), (0, 0)), constant_values=True), (1, 1), 2),  # right
+        (np.pad(colors[:, 1:] != colors[:, :-1], ((0, 0), (1, 0)), constant_values=True), (1, 0), 3),  # top
+    ]
+    edge_start = []
+    edge_dir = []
+    edge_label = []
+    for mask, (off_x, off_y), dir_idx in edge_sides:
+        if included is not None:
+            mask = mask & included
+        edge_start.append((vert_x[mask] + off_x) * (height + 1) + vert_y[mask] + off_y)
+        edge_dir.append(np.full(edge_start[-1].size, dir_idx))
+        edge_label.append(labels.reshape(colors.shape)[mask])
+    edge_start = np.concatenate(edge_start)
+    edge_dir = np.concatenate(edge_dir)
+    edge_label = np.concatenate(edge_label)
+    edge_count = edge_start.size
+
+    step_x = np.array([step[0] for step in EDGE_DIRECTIONS])
+    step_y = np.array([step[1] for step in EDGE_DIRECTIONS])
+    edge_end = edge_start + step_x[edge_dir] * (height + 1) + step_y[edge_dir]
+    edge_index = np.full((width + 1) * (height + 1) * 4, -1)
+    edge_index[edge_start * 4 + edge_dir] = np.arange(edge_count)
+
+    # join edges of pixel groups, preferring the turn order of the original tracing
+    successor = np.full(edge_count, -1)
+    for turn in (-1, 0, 1):
+        found = edge_index[edge_end * 4 + (edge_dir + turn) % 4]
+        valid = (successor < 0) & (found >= 0)
+        valid[valid] = edge_label[found[valid]] == edge_label[valid]
+        successor[valid] = found[valid]
+    if (successor < 0).any():
+        raise Exception("Failed to find connecting edge")
+    cycle, distance = _cycle_order(successor)
+    predecessor = np.empty(edge_count, dtype=successor.dtype)
+    predecessor[successor] = np.arange(edge_count)
+    if keep_every_point:
+        kept = np.ones(edge_count, dtype=bool)
+    else:
+        kept = edge_dir != edge_dir[predecessor]
+
+    # order shapes by color of first visited pixel, then by their first pixel, and edges along each closed shape
+    roots = np.unique(labels if included is None else labels[included.ravel()])
+    root_colors = colors.ravel()[roots]
+    _, color_first, color_index = np.unique(root_colors, return_index=True, return_inverse=True)
+    color_rank = np.argsort(np.argsort(color_first))[color_index]
+    shape_rank = np.empty(colors.size, dtype=np.int64)
+    shape_rank[roots[np.lexsort((roots, color_rank))]] = np.arange(roots.size)
+    order = np.lexsort((-distance[kept], cycle[kept], shape_rank[edge_label[kept]]))
+    point_shape = shape_rank[edge_label[kept]][order]
+    point_cycle = cycle[kept][order]
+    point_x = (edge_start[kept][order] // (height + 1)).tolist()
+    point_y = (edge_start[kept][order] % (height + 1)).tolist()
+    shape_starts = np.flatnonzero(np.diff(point_shape, prepend=-1)).tolist() + [len(point_x)]
+    cycle_starts = set(np.flatnonzero(np.diff(point_cycle, prepend=-1)).tolist())
+    shape_colors = rgba.reshape(-1, 4)[roots[np.lexsort((roots, color_rank))]].tolist()
+
+    svg = StringIO()
+    svg.write(svg_header(width, height))
+    for shape, (shape_start, shape_end) in enumerate(zip(shape_starts[:-1], shape_starts[1:])):
+        svg.write(""" <path d=" """)
+        for idx in range(shape_start, shape_end):
+            if idx in cycle_starts:
+                if idx != shape_start:
+                    svg.write(" Z ")
+                svg.write(f" M {point_x[idx]},{point_y[idx]} ")
+            else:
+                svg.write(f" L {point_x[idx]},{point_y[idx]} ")
+        svg.write(" Z ")
+        color = tuple(shape_colors[shape])
+        svg.write(
+            f""" " style="fill:rgb{color[0:3]}; fill-opacity:{float(color[3]) / 255:.3f}; stroke:none;" />\n""")
+
+    svg.write("""</svg>\n""")
+    return svg.getvalue()
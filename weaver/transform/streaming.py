@@ -0,0 +1,506 @@
+"""
+Streaming conversions of structured text files between CSV, JSON, YAML and XML representations.
+
+Contents are read incrementally from the input file and pushed as events to a writer of the output representation,
+such that only one item of the top-level container (or of a container nested within it) is held in memory at once.
+The generated contents correspond to the in-memory conversions performed by :mod:`weaver.transform.handlers`.
+
+Documents with a structure that cannot be streamed (e.g.: single literal value, non-contiguous :term:`XML` elements,
+non-tabular data to represent as CSV) raise :class:`StreamUnsupportedError`, to let the caller employ the in-memory
+conversion instead.
+"""
+import abc
+import csv
+import json
+import math
+from typing import Any, Callable, Dict, IO, List, Optional, Set, Tuple, Type
+
+import xmltodict
+import yaml
+
+from weaver.formats import OutputFormat
+
+STREAM_CHUNK_SIZE = 64 * 1024
+XML_HEADER = "<?xml version=\"1.0\" encoding=\"UTF-8\" ?><item>"
+XML_FOOTER = "</item>"
+YAML_OPTIONS = {"indent": 2, "sort_keys": False, "width": float("inf")}
+CSV_INTEGER_RANGE = (-2 ** 63, 2 ** 64)  # integers represented by numeric columns of 'pandas'
+
+
+class StreamUnsupportedError(ValueError):
+    """
+    Indicates that the document structure cannot be converted by streaming.
+    """
+
+
+class StreamWriter(abc.ABC):
+    """
+    Receives the events of the top-level container of a document, and of containers nested in it, to write them.
+    """
+
+    def __init__(self, file: IO[str]) -> None:
+        self.file = file
+        self.stack = []  # type: List[Dict[str, Any]]
+
+    @abc.abstractmethod
+    def start(self, kind: str, key: Optional[Any] = None) -> None:
+        """
+        Starts a ``list`` or ``dict`` container, under the given key if nested in a ``dict`` container.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def member(self, key: Any, value: Any) -> None:
+        """
+        Writes a member of the current ``dict`` container.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def item(self, value: Any) -> None:
+        """
+        Writes an item of the current ``list`` container.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def end(self) -> None:
+        """
+        Ends the current container.
+        """
+        raise NotImplementedError
+
+
+class JSONStreamWriter(StreamWriter):
+    def _next(self) -> None:
+        if self.stack:
+            if self.stack[-1]["count"]:
+                self.file.write(", ")
+            self.stack[-1]["count"] += 1
+
+    @staticmethod
+    def _key(key: Any) -> str:
+        return json.dumps({key: 0})[1:-4]  # same coercion of non-string keys as dumped objects
+
+    def start(self, kind: str, key: Optional[Any] = None) -> None:
+        self._next()
+        if key is not None:
+            self.file.write(f"{self._key(key)}: ")
+        self.file.write("[" if kind == "list" else "{")
+        self.stack.append({"kind": kind, "count": 0})
+
+    def member(self, key: Any, value: Any) -> None:
+        self._next()
+        self.file.write(f"{self._key(key)}: {json.dumps(value)}")
+
+    def item(self, value: Any) -> None:
+        self._next()
+        self.file.write(json.dumps(value))
+
+    def end(self) -> None:
+        entry = self.stack.pop()
+        self.file.write("]" if entry["kind"] == "list" else "}")
+
+
+class YAMLStreamWriter(StreamWriter):
+    def _next(self) -> None:
+        entry = self.stack[-1]
+        if not entry["count"] and entry["header"]:
+            self.file.write(f"{entry['header']}\n")
+        entry["count"] += 1
+
+    def _write(self, data: Any, indent: str) -> None:
+        content = yaml.safe_dump(data, **YAML_OPTIONS)
+        self.file.write("".join(f"{indent}{line}" for line in content.splitlines(True)))
+
+    def start(self, kind: str, key: Optional[Any] = None) -> None:
+        header = None
+        indent = ""
+        if self.stack:
+            parent = self.stack[-1]
+            if parent["kind"] != "dict":
+                raise StreamUnsupportedError("Nested containers in lists cannot be streamed to YAML.")
+            key_repr = yaml.safe_dump({key: 0}, **YAML_OPTIONS)
+            if not key_repr.endswith(": 0\n") or key_repr.count("\n") > 1:
+                raise StreamUnsupportedError("Complex mapping keys cannot be streamed to YAML.")
+            self._next()
+            header = f"{parent['indent']}{key_repr[:-4]}:"
+            # sequences nested in mappings are not indented, contrary to nested mappings
+            indent = parent["indent"] if kind == "list" else f"{parent['indent']}  "
+        self.stack.append({"kind": kind, "count": 0, "header": header, "indent": indent})
+
+    def member(self, key: Any, value: Any) -> None:
+        self._next()
+        self._write({key: value}, self.stack[-1]["indent"])
+
+    def item(self, value: Any) -> None:
+        self._next()
+        self._write([value], self.stack[-1]["indent"])
+
+    def end(self) -> None:
+        entry = self.stack.pop()
+        if not entry["count"]:
+            empty = "[]" if entry["kind"] == "list" else "{}"
+            self.file.write(f"{entry['header']} {empty}\n" if entry["header"] else f"{empty}\n")
+
+
+class XMLStreamWriter(StreamWriter):
+    @staticmethod
+    def _convert(data: Any) -> str:
+        xml = OutputFormat.convert(data, OutputFormat.XML_RAW)
+        return xml[len(XML_HEADER):-len(XML_FOOTER)]
+
+    def start(self, kind: str, key: Optional[Any] = None) -> None:
+        if not self.stack:
+            self.file.write(XML_HEADER)
+            self.stack.append({"kind": kind, "close": XML_FOOTER})
+            return
+        if self.stack[-1]["kind"] != "dict":
+            raise StreamUnsupportedError("Nested containers in lists cannot be streamed to XML.")
+        empty = self._convert({key: [] if kind == "list" else {}})
+        split = empty.index("></") + 1
+        self.file.write(empty[:split])
+        self.stack.append({"kind": kind, "close": empty[split:]})
+
+    def member(self, key: Any, value: Any) -> None:
+        self.file.write(self._convert({key: value}))
+
+    def item(self, value: Any) -> None:
+        self.file.write(self._convert([value]))
+
+    def end(self) -> None:
+        self.file.write(self.stack.pop()["close"])
+
+
+def is_csv_null(value: Any) -> bool:
+    """
+    Indicates if the value is represented as an empty CSV field.
+    """
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def is_csv_number(value: Any) -> bool:
+    """
+    Indicates if the value can be part of a numeric CSV column.
+    """
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return CSV_INTEGER_RANGE[0] <= value < CSV_INTEGER_RANGE[1]
+    return isinstance(value, float)
+
+
+class CSVColumnsCollector(StreamWriter):
+    """
+    Collects the columns of a list of objects represented as CSV, in order of appearance, and their value types.
+
+    Columns are represented with the same types that :mod:`pandas` infers for the in-memory conversion. Notably,
+    numeric columns with missing values or mixing integers and floating point values are represented as floats.
+    """
+
+    def __init__(self, file: Optional[IO[str]] = None) -> None:
+        super().__init__(file)
+        self.columns = {}  # type: Dict[Any, None]
+        self.rows = 0
+        self.counts = {}  # type: Dict[Any, int]
+        self.numbers = {}  # type: Dict[Any, bool]
+        self.floats = set()  # type: Set[Any]
+
+    def get_float_columns(self) -> Set[Any]:
+        """
+        Obtain the columns that are represented with floating point values.
+        """
+        return {
+            col for col, count in self.counts.items()
+            if self.numbers[col] and (col in self.floats or count < self.rows)
+        }
+
+    def start(self, kind: str, key: Optional[Any] = None) -> None:
+        if self.stack or kind != "list":
+            raise StreamUnsupportedError("Only a list of objects can be streamed to CSV.")
+        self.stack.append(kind)
+
+    def member(self, key: Any, value: Any) -> None:
+        raise StreamUnsupportedError("Only a list of objects can be streamed to CSV.")
+
+    def item(self, value: Any) -> None:
+        if not isinstance(value, dict):
+            raise StreamUnsupportedError("Only a list of objects can be streamed to CSV.")
+        self.columns.update(dict.fromkeys(value))
+        self.rows += 1
+        for col, val in value.items():
+            if is_csv_null(val):
+                continue
+            self.counts[col] = self.counts.get(col, 0) + 1
+            self.numbers[col] = self.numbers.get(col, True) and is_csv_number(val)
+            if isinstance(val, float):
+                self.floats.add(col)
+
+    def end(self) -> None:
+        self.stack.pop()
+
+
+class CSVStreamWriter(CSVColumnsCollector):
+    def __init__(self, file: IO[str], columns: List[Any], float_columns: Optional[Set[Any]] = None) -> None:
+        super().__init__(file)
+        self.columns = columns
+        self.float_columns = float_columns or set()
+        self.writer = csv.writer(file, lineterminator="\n")
+
+    def start(self, kind: str, key: Optional[Any] = None) -> None:
+        super().start(kind, key)
+        self.writer.writerow(self.columns)
+
+    def item(self, value: Any) -> None:
+        row = []
+        for col in self.columns:
+            val = value.get(col)
+            if is_csv_null(val):
+                val = ""
+            elif col in self.float_columns:
+                val = float(val)
+            row.append(val)
+        self.writer.writerow(row)
+
+
+def read_csv_stream(file_path: str, writer: StreamWriter) -> None:
+    """
+    Reads CSV rows one at a time, represented as ``{"datas": [{"data": <row>}, ...]}``.
+    """
+    with open(file_path, mode="r", encoding="utf-8", newline="") as csv_file:
+        csv_reader = csv.DictReader(csv_file)
+        for idx, fieldname in enumerate(csv_reader.fieldnames or []):
+            if fieldname == "":
+                csv_reader.fieldnames[idx] = f"unknown_{idx}"
+        writer.start("dict")
+        writer.start("list", key="datas")
+        for row in csv_reader:
+            writer.item({"data": row})
+        writer.end()
+        writer.end()
+
+
+class _JSONBuffer:
+    """
+    Decodes consecutive :term:`JSON` values from a file, reading it by chunks as needed.
+    """
+
+    def __init__(self, file: IO[str]) -> None:
+        self.file = file
+        self.decoder = json.JSONDecoder()
+        self.data = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read(self, size: int) -> None:
+        chunk = self.file.read(size)
+        self.eof = not chunk
+        self.data = self.data[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.data) and self.data[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.data) or self.eof:
+                return self.data[self.pos:self.pos + 1]
+            self._read(STREAM_CHUNK_SIZE)
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expecting '{char}' at position {self.pos} of JSON chunk.")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        size = STREAM_CHUNK_SIZE
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.data, self.pos)
+                # value ending with the buffer could be incomplete (e.g.: number split across chunks)
+                if end < len(self.data) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._read(size)
+            size *= 2  # avoid decoding a large value repeatedly for each small chunk
+
+
+def read_json_stream(file_path: str, writer: StreamWriter) -> None:
+    """
+    Reads the items of a top-level :term:`JSON` array, or the members of a top-level object, one at a time.
+    """
+    with open(file_path, mode="r", encoding="utf-8") as json_file:
+        buffer = _JSONBuffer(json_file)
+        kind = {"[": "list", "{": "dict"}.get(buffer.peek())
+        if not kind:
+            raise StreamUnsupportedError("Only JSON array or object can be streamed.")
+        close = "]" if kind == "list" else "}"
+        buffer.expect(buffer.peek())
+        writer.start(kind)
+        first = True
+        while buffer.peek() != close:
+            if not first:
+                buffer.expect(",")
+            first = False
+            if kind == "list":
+                writer.item(buffer.value())
+            else:
+                key = buffer.value()
+                buffer.expect(":")
+                writer.member(key, buffer.value())
+        buffer.expect(close)
+        if buffer.peek():
+            raise ValueError("Extra data after JSON contents.")
+        writer.end()
+
+
+def read_yaml_stream(file_path: str, writer: StreamWriter) -> None:
+    """
+    Reads the items of a top-level YAML sequence, or the members of a top-level mapping, one at a time.
+    """
+    with open(file_path, mode="r", encoding="utf-8") as yaml_file:
+        loader = yaml.SafeLoader(yaml_file)
+        try:
+            loader.get_event()  # stream start
+            if not loader.check_event(yaml.DocumentStartEvent):
+                raise StreamUnsupportedError("Empty YAML document cannot be streamed.")
+            loader.get_event()
+            event = loader.peek_event()
+            if event.anchor or not event.implicit or not isinstance(
+                event, (yaml.SequenceStartEvent, yaml.MappingStartEvent)
+            ):
+                raise StreamUnsupportedError("Only untagged YAML sequence or mapping can be streamed.")
+            loader.get_event()
+            kind = "list" if isinstance(event, yaml.SequenceStartEvent) else "dict"
+            close = yaml.SequenceEndEvent if kind == "list" else yaml.MappingEndEvent
+
+            def construct() -> Any:
+                return loader.construct_document(loader.compose_node(None, None))
+
+            writer.start(kind)
+            while not loader.check_event(close):
+                if kind == "list":
+                    writer.item(construct())
+                else:
+                    writer.member(construct(), construct())
+            loader.get_event()
+            loader.get_event()  # document end
+            if not loader.check_event(yaml.StreamEndEvent):
+                raise ValueError("Expected a single document in the YAML stream.")
+            writer.end()
+        finally:
+            loader.dispose()
+
+
+def read_xml_stream(file_path: str, writer: StreamWriter) -> None:
+    """
+    Reads the child elements of the :term:`XML` root element one at a time, represented as by :mod:`xmltodict`.
+
+    A first pass over the document validates that elements of a given name are contiguous, in order to know if they
+    should be represented as a list or a single object before writing them. Text directly within the root element
+    (mixed with child elements) is ignored.
+    """
+    runs = []  # type: List[List[Any]]
+    root = []  # type: List[Tuple[str, Optional[Dict[str, str]]]]
+
+    def collect(path: List[Tuple[str, Any]], _: Any) -> bool:
+        if not root:
+            root.append(path[0])
+        if runs and runs[-1][0] == path[1][0]:
+            runs[-1][1] += 1
+        else:
+            runs.append([path[1][0], 1])
+        return True
+
+    with open(file_path, mode="rb") as xml_file:
+        xmltodict.parse(xml_file, item_depth=2, item_callback=collect)
+    if not runs or len({name for name, _ in runs}) != len(runs):
+        raise StreamUnsupportedError("Only XML with contiguous child elements of the root element can be streamed.")
+
+    counts = [count for _, count in runs]
+    current = []  # type: List[Optional[str]]
+
+    def write(path: List[Tuple[str, Any]], item: Any) -> bool:
+        name = path[1][0]
+        if not current or current[-1] != name:
+            if current and counts[len(current) - 1] > 1:
+                writer.end()
+            current.append(name)
+            if counts[len(current) - 1] > 1:
+                writer.start("list", key=name)
+        if counts[len(current) - 1] > 1:
+            writer.item(item)
+        else:
+            writer.member(name, item)
+        return True
+
+    root_name, root_attrs = root[0]
+    writer.start("dict")
+    writer.start("dict", key=root_name)
+    for attr, value in (root_attrs or {}).items():
+        writer.member(f"@{attr}", value)
+    with open(file_path, mode="rb") as xml_file:
+        xmltodict.parse(xml_file, item_depth=2, item_callback=write)
+    if counts[-1] > 1:
+        writer.end()
+    writer.end()
+    writer.end()
+
+
+STREAM_READERS = {
+    "csv": read_csv_stream,
+    "json": read_json_stream,
+    "yaml": read_yaml_stream,
+    "xml": read_xml_stream,
+}  # type: Dict[str, Callable[[str, StreamWriter], None]]
+STREAM_WRITERS = {
+    "json": JSONStreamWriter,
+    "yaml": YAMLStreamWriter,
+    "xml": XMLStreamWriter,
+    "csv": CSVStreamWriter,
+}  # type: Dict[str, Type[StreamWriter]]
+
+
+def get_stream_format(media_type: str) -> Optional[str]:
+    """
+    Obtain the streamed representation matching the media-type, if supported.
+    """
+    if not media_type.startswith(("text/", "application/")):
+        return None
+    for fmt in STREAM_READERS:
+        if fmt in media_type:
+            return fmt
+    return None
+
+
+def stream_convert(file_path: str, output_path: str, current_media_type: str, wanted_media_type: str) -> bool:
+    """
+    Converts a file between structured text representations by streaming its contents.
+
+    :param file_path: Input file path.
+    :param output_path: Output file path.
+    :param current_media_type: Media-type of the input file.
+    :param wanted_media_type: Media-type of the output file.
+    :return: Whether the conversion between the media-types is supported by streaming.
+    :raises StreamUnsupportedError: If the document structure cannot be streamed to the wanted representation.
+    """
+    in_fmt = get_stream_format(current_media_type)
+    out_fmt = get_stream_format(wanted_media_type)
+    if not in_fmt or not out_fmt or in_fmt == out_fmt or (in_fmt, out_fmt) == ("xml", "csv"):
+        return False
+    reader = STREAM_READERS[in_fmt]
+    if out_fmt == "csv":
+        collector = CSVColumnsCollector()
+        reader(file_path, collector)
+        columns = list(collector.columns)
+        float_columns = collector.get_float_columns()
+    with open(output_path, mode="w", encoding="utf-8", newline="") as out_file:
+        if out_fmt == "csv":
+            writer = CSVStreamWriter(out_file, columns, float_columns)
+        else:
+            writer = STREAM_WRITERS[out_fmt](out_file)
+        reader(file_path, writer)
+    return True
@@ -1,19 +1,32 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 import multipagetiff as mtif
 import numpy as np
 import rasterio
-from PIL import Image, UnidentifiedImageError
+from PIL import Image, ImageSequence, UnidentifiedImageError
+from rasterio.windows import Window
 
+# maximum amount of pixels per band read at once when converting a GeoTIFF at full resolution
+TIFF_WINDOW_PIXELS = 2 ** 20
 
-def normalize_band(image_band: np.ndarray) -> np.ndarray:
+
+def normalize_band(
+    image_band: np.ndarray,
+    band_min: Optional[float] = None,
+    band_max: Optional[float] = None,
+) -> np.ndarray:
     """
     Normalize a single band of an image to the range [0, 1].
 
     :param image_band: The image band to normalize.
+    :param band_min: Minimum value of the band, if known from statistics of the complete band.
+    :param band_max: Maximum value of the band, if known from statistics of the complete band.
     :return: The normalized image band.
     """
-    band_min, band_max = image_band.min(), image_band.max()  # type: ignore  # IDE type stub error
+    if band_min is None:
+        band_min = image_band.min()  # type: ignore  # IDE type stub error
+    if band_max is None:
+        band_max = image_band.max()  # type: ignore  # IDE type stub error
     return (image_band - band_min) / (band_max - band_min)
 
 
@@ -27,10 +40,8 @@ class Tiff:
     :vartype dataset: rasterio.Dataset
     :ivar is_geotiff: A flag indicating whether the image is a GeoTIFF.
     :vartype is_geotiff: bool
-    :ivar images: The list of image arrays for multi-page TIFFs.
-    :vartype images: List[np.ndarray]
-    :ivar _images: A copy of the list of image arrays.
-    :vartype _images: List[np.ndarray]
+    :ivar nb_pages: The number of pages for multi-page TIFFs.
+    :vartype nb_pages: int
     :ivar nb_bands: The number of bands in the GeoTIFF.
     :vartype nb_bands: int
     :ivar width: The width of the image.
@@ -56,10 +67,12 @@ class Tiff:
 
         self.is_geotiff = self.dataset.crs is not None
 
+        self._stack = None
+
         if not self.is_geotiff:
             try:
-                self.images = mtif.read_stack(self.file_path)
-                self._images = self.images.copy()
+                with Image.open(self.file_path) as img:
+                    self.nb_pages = getattr(img, "n_frames", 1)
             except Exception as ex:
                 if isinstance(ex, UnidentifiedImageError):
                     self.is_geotiff = True
@@ -76,6 +89,19 @@ class Tiff:
 
             self.crs = self.dataset.crs
 
+    @property
+    def images(self) -> mtif.Stack:
+        """
+        Get the stack of all pages of a multi-page TIFF, loaded in memory on first access.
+
+        Prefer :meth:`iter_images` to convert pages one at a time.
+
+        :return: The stack of image arrays.
+        """
+        if self._stack is None:
+            self._stack = mtif.read_stack(self.file_path)
+        return self._stack
+
     @property
     def range(self) -> range:
         """
@@ -97,27 +123,158 @@ class Tiff:
             return self.dataset.read(index)
         return None
 
-    def get_images(self, red_band: int = 1, green_band: int = 2, blue_band: int = 3) -> List[Image.Image]:
+    def windows(self) -> List[Window]:
         """
-        Retrieve RGB images by combining bands from a GeoTIFF or multi-page TIFF.
+        Split the GeoTIFF into windows of complete rows aligned on its internal blocks, with bounded amount of pixels.
+
+        :return: Windows covering the complete image.
+        """
+        block_height = self.dataset.block_shapes[0][0] if self.dataset.block_shapes else 1
+        rows = max(block_height, TIFF_WINDOW_PIXELS // max(self.width, 1) // block_height * block_height)
+        return [
+            Window(0, row, self.width, min(rows, self.height - row))
+            for row in range(0, self.height, rows)
+        ]
+
+    def get_statistics(self, indexes: List[int]) -> List[Tuple[float, float]]:
+        """
+        Obtain the minimum and maximum values of bands.
+
+        Statistics stored in the GeoTIFF metadata are employed when available for all bands. Otherwise, they are
+        computed by reading the bands by windows, which requires an additional pass over the full resolution data.
+
+        :param indexes: The band indexes for which to compute statistics.
+        :return: Minimum and maximum values of each band.
+        """
+        try:
+            tags = [self.dataset.tags(index) for index in indexes]
+            return [(float(tag["STATISTICS_MINIMUM"]), float(tag["STATISTICS_MAXIMUM"])) for tag in tags]
+        except (KeyError, ValueError):
+            pass
+        stats = [(np.inf, -np.inf)] * len(indexes)
+        for window in self.windows():
+            data = self.dataset.read(indexes, window=window)
+            stats = [
+                (min(band_min, data[i].min()), max(band_max, data[i].max()))
+                for i, (band_min, band_max) in enumerate(stats)
+            ]
+        return stats
+
+    def get_preview(self, indexes: List[int], max_size: int) -> np.ndarray:
+        """
+        Retrieve normalized bands of a GeoTIFF decimated such that the largest dimension does not exceed the size.
+
+        Internal overviews of the GeoTIFF are employed when available for the decimated read, avoiding to read the
+        full resolution data. Normalization statistics are computed from the decimated bands.
+
+        :param indexes: The band indexes to retrieve.
+        :param max_size: The maximum width or height of the preview.
+        :return: Array of normalized bands stacked along the last dimension, scaled to ``uint8``.
+        """
+        scale = max_size / max(self.width, self.height)
+        shape = (len(indexes), max(1, round(self.height * scale)), max(1, round(self.width * scale)))
+        data = self.dataset.read(indexes, out_shape=shape)
+        return (np.dstack([normalize_band(band) for band in data]) * 255).astype(np.uint8)
+
+    def iter_arrays(self, indexes: List[int]) -> Iterator[Tuple[Window, np.ndarray]]:
+        """
+        Iterate over windows of normalized bands of a GeoTIFF at full resolution.
+
+        Bands are normalized using the statistics of their complete data (see :meth:`get_statistics`).
+
+        :param indexes: The band indexes to retrieve.
+        :return: Windows and their array of normalized bands stacked along the last dimension, scaled to ``uint8``.
+        """
+        stats = self.get_statistics(indexes)
+        for window in self.windows():
+            data = self.dataset.read(indexes, window=window)
+            bands = [np.clip(normalize_band(band, *band_stats), 0, 1) for band, band_stats in zip(data, stats)]
+            yield window, (np.dstack(bands) * 255).astype(np.uint8)
+
+    def get_array(self, indexes: List[int]) -> np.ndarray:
+        """
+        Retrieve normalized bands of a GeoTIFF at full resolution, as a single array.
+
+        Prefer :meth:`get_image` to avoid holding both the array and the resulting image in memory.
+
+        :param indexes: The band indexes to retrieve.
+        :return: Array of normalized bands stacked along the last dimension, scaled to ``uint8``.
+        """
+        array = np.empty((self.height, self.width, len(indexes)), dtype=np.uint8)
+        for window, data in self.iter_arrays(indexes):
+            array[window.row_off:window.row_off + window.height] = data
+        return array
+
+    def get_image(self, indexes: List[int]) -> Image.Image:
+        """
+        Retrieve an image combining normalized bands of a GeoTIFF at full resolution.
+
+        Windows of the bands are written directly into the image, such that only the image and a single window of
+        the bands are held in memory at once.
+
+        :param indexes: The band indexes to combine. A single band generates a grayscale image.
+        :return: The image of the combined bands.
+        """
+        image = None
+        for window, data in self.iter_arrays(indexes):
+            if len(indexes) == 1:
+                data = np.squeeze(data, axis=2)
+            tile = Image.fromarray(data)
+            if image is None:
+                image = Image.new(tile.mode, (self.width, self.height))
+            image.paste(tile, (0, window.row_off))
+        return image
+
+    def iter_images(
+        self,
+        red_band: int = 1,
+        green_band: int = 2,
+        blue_band: int = 3,
+        max_size: Optional[int] = None,
+    ) -> Iterator[Image.Image]:
+        """
+        Iterate over RGB images combining bands from a GeoTIFF, or over pages of a multi-page TIFF loaded one at a time.
 
         :param red_band: The band index for the red channel.
         :param green_band: The band index for the green channel.
         :param blue_band: The band index for the blue channel.
-        :return: A list of PIL Image objects representing the RGB image(s).
+        :param max_size:
+            Maximum width or height of a preview image of a GeoTIFF, using overviews or decimated reads.
+            The full resolution image is returned if not specified or larger than the image.
+        :return: An iterator of PIL Image objects representing the RGB image(s).
         """
         if self.is_geotiff:
             indexes = [i for i in [red_band, green_band, blue_band] if i in self.range]
-            array = (
-                np.dstack([normalize_band(self.get_band(idx)) for idx in indexes])
-                * 255
-            ).astype(np.uint8)
+            if not max_size or max_size >= max(self.width, self.height):
+                yield self.get_image(indexes)
+                return
+            array = self.get_preview(indexes, max_size)
             if len(indexes) < 3:
                 array = np.squeeze(array, axis=2)
-
-            return [Image.fromarray(array)]
+            yield Image.fromarray(array)
         else:
-            imlist = []
-            for page in self.images.pages:
-                imlist.append(Image.fromarray(page))
-            return imlist
+            with Image.open(self.file_path) as img:
+                for page in ImageSequence.Iterator(img):
+                    yield Image.fromarray(np.array(page))
+
+    def get_images(
+        self,
+        red_band: int = 1,
+        green_band: int = 2,
+        blue_band: int = 3,
+        max_size: Optional[int] = None,
+    ) -> List[Image.Image]:
+        """
+        Retrieve RGB images by combining bands from a GeoTIFF or multi-page TIFF.
+
+        All pages of a multi-page TIFF are loaded in memory. Prefer :meth:`iter_images` to process them one at a time.
+
+        :param red_band: The band index for the red channel.
+        :param green_band: The band index for the green channel.
+        :param blue_band: The band index for the blue channel.
+        :param max_size:
+            Maximum width or height of a preview image of a GeoTIFF, using overviews or decimated reads.
+            The full resolution image is returned if not specified or larger than the image.
+        :return: A list of PIL Image objects representing the RGB image(s).
+        """
+        return list(self.iter_images(red_band, green_band, blue_band, max_size=max_size))
@@ -1,3 +1,4 @@
+import contextlib
 import difflib
 import errno
 import fnmatch
@@ -17,7 +18,15 @@ import threading
 import time
 import uuid
 import warnings
-from concurrent.futures import ALL_COMPLETED, CancelledError, ThreadPoolExecutor, as_completed, wait as wait_until
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait as wait_until
+)
 from copy import deepcopy
 from datetime import datetime
 from types import MappingProxyType
@@ -29,9 +38,10 @@ import colander
 import pytz
 import requests
 import yaml
-from beaker.cache import Cache, cache_managers, cache_region, cache_regions, region_invalidate
+from beaker.cache import Cache, cache_managers, cache_regions, region_invalidate
 from beaker.container import MemoryNamespaceManager
 from beaker.exceptions import BeakerException
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as S3Config
 from botocore.exceptions import ClientError, HTTPClientError
 from bs4 import BeautifulSoup
@@ -57,9 +67,10 @@ from pyramid_celery import celery_app as app
 from pywps.inout.basic import UrlHandler
 from pywps.inout.outputs import MetaFile, MetaLink, MetaLink4
 from requests import HTTPError as RequestsHTTPError, Response
+from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
 from requests_file import FileAdapter
-from urlmatch import urlmatch
+from urlmatch.urlmatch import parse_match_pattern
 from webob.headers import EnvironHeaders, ResponseHeaders
 from werkzeug.utils import secure_filename
 from werkzeug.wrappers import Request as WerkzeugRequest
@@ -68,7 +79,9 @@ from yaml.scanner import ScannerError
 from weaver.base import Constants, ExtendedEnum
 from weaver.compat import Version
 from weaver.exceptions import WeaverException
+from weaver.file_cache import clone_file, get_file_cache
 from weaver.formats import ContentType, get_content_type, get_extension, get_format, repr_json
+from weaver.metrics.utils import cache_region, observe_fetched_bytes, observe_request_retry, observe_staged_bytes
 from weaver.status import map_status
 from weaver.warning import TimeZoneInfoAlreadySetWarning, UndefinedContainerWarning
 from weaver.xml_util import HTML_TREE_BUILDER, XML
@@ -85,6 +98,7 @@ if TYPE_CHECKING:
         AnyStr,
         Callable,
         Dict,
+        FrozenSet,
         Generator,
         IO,
         Iterator,
@@ -92,6 +106,7 @@ if TYPE_CHECKING:
         MutableMapping,
         NoReturn,
         Optional,
+        Pattern,
         Sequence,
         Tuple,
         Type,
@@ -102,6 +117,7 @@ if TYPE_CHECKING:
 
     from mypy_boto3_s3.client import S3Client
 
+    from weaver.file_cache import FileCache, FileCacheEntry
     from weaver.status import Status
     from weaver.typedefs import (
         AnyCallable,
@@ -157,6 +173,9 @@ if TYPE_CHECKING:
         "stream": NotRequired[bool],
         "cache": NotRequired[bool],
         "cache_enabled": NotRequired[bool],
+        "download_resume_retries": NotRequired[int],
+        "download_segments": NotRequired[int],
+        "download_segment_size": NotRequired[Union[int, str]],
     }, total=False)
     RequestOptionsConfigMatcher = TypedDict("RequestOptionsConfigMatcher", {
         "url": Required[Union[str, List[str]]],
@@ -167,7 +186,14 @@ if TYPE_CHECKING:
         "requests": List[RequestOptionsConfigEntry],
     }, total=True)
     RequestCachingKeywords = Dict[str, AnyValueType]
+    DownloadOptions = TypedDict("DownloadOptions", {
+        "download_resume_retries": int,
+        "download_segments": int,
+        "download_segment_size": int,
+    }, total=True)
     RequestCachingFunction = Callable[[AnyRequestMethod, str, RequestCachingKeywords], Response]
+    RequestSessionKey = Tuple[str, str, str, str, Tuple[Tuple[str, str], ...]]
+    RequestOptionsMatcherEntry = Tuple[Optional[FrozenSet[str]], Pattern[str], RequestOptions, bool]
 
     MetadataResult = TypedDict("MetadataResult", {
         "Date": str,
@@ -233,6 +259,39 @@ SUPPORTED_FILE_SCHEMES = frozenset([
     "vault"
 ])
 
+FETCH_CACHE_DEFAULT_SIZE = "10GiB"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_RESUME_RETRIES = 3
+DOWNLOAD_SEGMENT_SIZE = "64MiB"
+DOWNLOAD_PARTIAL_SUFFIX = ".part"
+REQUEST_SESSION_POOL_SIZE = 10
+REQUEST_SESSION_IDLE_TIMEOUT = 60
+REQUEST_OPTIONS_CACHE_SIZE = 1024
+FETCH_FILES_MAX_WORKERS = 16
+FETCH_FILES_MAX_HOST_WORKERS = 8
+FETCH_FILES_ADAPTIVE_START = 2
+FETCH_FILES_ADAPTIVE_TOLERANCE = 2.0
+FETCH_FILES_ADAPTIVE_MIN_DELAY = 0.05
+FETCH_META_CACHE_EXPIRE = 30
+FETCH_META_CACHE_SIZE = 4096
+S3_TRANSFER_MULTIPART_THRESHOLD = "8MiB"
+S3_TRANSFER_MULTIPART_CHUNKSIZE = "8MiB"
+S3_TRANSFER_MAX_CONCURRENCY = 10
+S3_TRANSFER_MAX_FILES = 8
+S3_CLIENTS_CACHE_SIZE = 16
+S3_CLIENT_OPTIONS = frozenset([  # request options relevant for the S3 client connection (see 'resolve_s3_http_options')
+    "timeout",
+    "connect_timeout",
+    "read_timeout",
+    "cert",
+    "verify",
+    "retries",
+    "retry",
+    "max_retries",
+])
+FILE_DIGEST_CHUNK_SIZE = 1024 * 1024
+FILE_DIGEST_CACHE_SIZE = 4096
+
 # note: word characters also match unicode in this case
 FILE_NAME_LOOSE_PATTERN = re.compile(
     r"^"
@@ -1392,16 +1451,49 @@ def compute_file_digest_multibase(file_path, hash_algorithm="sha256", multibase_
         raise ValueError(f"File not found or not accessible: [{file_path}]")
 
     # Compute the file hash
+    hash_obj = get_hash_function(hash_algorithm)
+    with open(file_path, "rb") as f:
+        while chunk := f.read(8192):
+            hash_obj.update(chunk)
+    return encode_digest_multibase(hash_obj.digest(), hash_algorithm, multibase_encoding)
+
+
+def get_hash_function(hash_algorithm="sha256"):
+    # type: (str) -> hashlib._Hash
+    """
+    Obtain a new hash object of the algorithm to progressively compute a digest.
+
+    :raises ValueError: If the hash algorithm is not supported.
+    """
     hash_func = getattr(hashlib, hash_algorithm, None)
     if not hash_func:
         raise ValueError(f"Unsupported hash algorithm: [{hash_algorithm}]")
+    return hash_func()
 
-    hash_obj = hash_func()
-    with open(file_path, "rb") as f:
-        while chunk := f.read(8192):
+
+def compute_file_digest(file_path, hash_algorithm="sha256"):
+    # type: (Path, str) -> bytes
+    """
+    Computes the raw digest of the file contents.
+
+    .. seealso::
+        :func:`get_file_digest_multibase` to reuse the digest memorized during the transfer of the file.
+    """
+    hash_obj = get_hash_function(hash_algorithm)
+    with open(file_path, "rb") as file:
+        while chunk := file.read(FILE_DIGEST_CHUNK_SIZE):
             hash_obj.update(chunk)
-    digest = hash_obj.digest()
+    return hash_obj.digest()
+
 
+def encode_digest_multibase(digest, hash_algorithm="sha256", multibase_encoding="base64"):
+    # type: (bytes, str, str) -> str
+    """
+    Encodes a raw digest as multibase-encoded multihash.
+
+    .. seealso::
+        :func:`compute_file_digest_multibase`
+    """
     # Create multihash (includes hash algorithm identifier)
     # Map common hash algorithms to multihash codes
     # See: `multicodec table <https://github.com/multiformats/multicodec/blob/master/table.csv>`_
@@ -1424,6 +1516,115 @@ def compute_file_digest_multibase(file_path, hash_algorithm="sha256", multibase_
     return digest_multibase
 
 
+FILE_DIGEST_CACHE = OrderedDict()  # type: OrderedDict[str, Tuple[int, int, str, bytes]]
+FILE_DIGEST_CACHE_LOCK = threading.Lock()
+
+
+def store_file_digest(file_path, digest, hash_algorithm="sha256"):
+    # type: (Path, bytes, str) -> None
+    """
+    Memorizes the digest of a file computed while it was transferred, to avoid reading it again later on.
+
+    The digest is associated to the real path of the file, along with its size and modification time such that any
+    later modification of the file invalidates it. Digests are only kept in memory for a limited amount of recently
+    transferred files (:data:`FILE_DIGEST_CACHE_SIZE`), since they are only needed until the :term:`Job` results
+    that report them are stored. Losing a digest is not critical, since it can always be computed again.
+
+    :param file_path: Path of the file for which the digest was computed.
+    :param digest: Raw digest of the complete file contents.
+    :param hash_algorithm: Hash algorithm employed to compute the digest.
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except OSError as exc:
+        LOGGER.debug("Could not memorize digest of file [%s] (%s)", file_path, exc)
+        return
+    file_path = os.path.realpath(file_path)
+    with FILE_DIGEST_CACHE_LOCK:
+        FILE_DIGEST_CACHE[file_path] = (file_stat.st_size, file_stat.st_mtime_ns, hash_algorithm, digest)
+        FILE_DIGEST_CACHE.move_to_end(file_path)
+        while len(FILE_DIGEST_CACHE) > FILE_DIGEST_CACHE_SIZE:
+            FILE_DIGEST_CACHE.popitem(last=False)
+
+
+def get_file_digest(file_path, hash_algorithm="sha256"):
+    # type: (Path, str) -> Optional[bytes]
+    """
+    Obtain the memorized digest of a file if it is still valid for its current contents.
+
+    :returns: Raw digest, or ``None`` if unavailable or if the file was modified since it was computed.
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    with FILE_DIGEST_CACHE_LOCK:
+        entry = FILE_DIGEST_CACHE.get(os.path.realpath(file_path))
+    if entry and entry[:3] == (file_stat.st_size, file_stat.st_mtime_ns, hash_algorithm):
+        return entry[3]
+    return None
+
+
+def get_file_digest_multibase(file_path, hash_algorithm="sha256", multibase_encoding="base64"):
+    # type: (Path, str, str) -> str
+    """
+    Obtain the multibase-encoded multihash digest of a file, preferably from the digest memorized during its transfer.
+
+    If no valid digest was memorized, it is computed from the file contents and memorized for following calls.
+
+    .. seealso::
+        - :func:`compute_file_digest_multibase`
+        - :func:`store_file_digest`
+
+    :raises ValueError: If the file does not exist or cannot be read.
+    """
+    digest = get_file_digest(file_path, hash_algorithm)
+    if digest is None:
+        if not os.path.isfile(file_path):
+            raise ValueError(f"File not found or not accessible: [{file_path}]")
+        digest = compute_file_digest(file_path, hash_algorithm)
+        store_file_digest(file_path, digest, hash_algorithm)
+    return encode_digest_multibase(digest, hash_algorithm, multibase_encoding)
+
+
+def copy_file_digest(src_path, dst_path, copy_function=shutil.copy2):
+    # type: (Path, Path, Callable[[Path, Path], Any]) -> None
+    """
+    Copies a file while computing its digest, which is then memorized for the destination.
+
+    If the source file already has a valid memorized digest, it is reused and the file is copied as usual with the
+    provided function (e.g.: to preserve a move or a link), since its contents do not need to be read for the digest.
+
+    :param src_path: File to copy.
+    :param dst_path: Destination of the copied file.
+    :param copy_function: Operation to copy the file when its digest is already known.
+    """
+    digest = get_file_digest(src_path)
+    if digest is not None or copy_function is not shutil.copy2:
+        copy_function(src_path, dst_path)
+        digest = digest or get_file_digest(dst_path)
+        if digest is None:  # moved or linked file without known digest, only requires to read it once
+            get_file_digest_multibase(dst_path)
+            return
+    else:
+        hash_obj = get_hash_function()
+        with open(src_path, "rb") as src_file, open(dst_path, "wb") as dst_file:
+            while chunk := src_file.read(FILE_DIGEST_CHUNK_SIZE):
+                hash_obj.update(chunk)
+                dst_file.write(chunk)
+        shutil.copystat(src_path, dst_path)
+        digest = hash_obj.digest()
+    store_file_digest(dst_path, digest)
+
+
+def get_file_etag(stat):
+    # type: (os.stat_result) -> str
+    """
+    Generate the entity tag of a local file from its status, such that it changes whenever the file is modified.
+    """
+    return f"\"{stat.st_mtime_ns:x}-{stat.st_size:x}\""
+
+
 def get_href_headers(
     path,                                   # type: str
     download_headers=False,                 # type: bool
@@ -1434,6 +1635,7 @@ def get_href_headers(
     content_location=None,                  # type: Optional[str]
     content_name=None,                      # type: Optional[str]
     content_id=None,                        # type: Optional[str]
+    etag_header=False,                      # type: bool
     missing_ok=False,                       # type: bool
     settings=None,                          # type: Optional[SettingsType]
     **option_kwargs,                        # type: Unpack[Union[SchemeOptions, RequestOptions]]
@@ -1469,6 +1671,10 @@ def get_href_headers(
         This should be a uniquely identifiable reference *across the server* (not just within a specific response),
         which can be used for cross-referencing by ``{cid:<>}`` within and between multipart document contents.
         For a generic ID or field name, employ :paramref:`content_name` instead.
+    :param etag_header:
+        If enabled, add the ``ETag`` header reported by the remote location, or generated from the modification time
+        and size of a local file, such that it changes whenever the file is modified.
+        Ignored for directories.
     :param missing_ok:
         If the referenced resource does not exist (locally or remotely as applicable), and that content information
         to describe it cannot be retrieved, either raise an error (default) or resume with the minimal information
@@ -1484,6 +1690,7 @@ def get_href_headers(
     f_size = None
     f_type = None
     f_modified = None
+    f_etag = None
 
     # handle directory
     if path.endswith("/"):
@@ -1516,14 +1723,14 @@ def get_href_headers(
                 s3_region = None
                 if path.startswith("https://s3."):
                     path, s3_region = resolve_s3_from_http(path)
-                s3_params = resolve_s3_http_options(**options["http"], **kwargs)
                 s3_region = cast("RegionName", s3_region or options["s3"].pop("region_name", None))
-                s3_client = boto3.client("s3", region_name=s3_region, **s3_params)
+                s3_client = get_s3_client(s3_region, settings=settings, **options["http"], **kwargs)
                 s3_bucket, file_key = path[5:].split("/", 1)
                 s3_file = s3_client.head_object(Bucket=s3_bucket, Key=file_key)
                 f_type = content_type or s3_file["ContentType"]
                 f_size = s3_file["ContentLength"]
                 f_modified = s3_file["LastModified"]
+                f_etag = s3_file.get("ETag")
             except (ClientError, HTTPClientError):
                 if not missing_ok:
                     raise
@@ -1537,6 +1744,7 @@ def get_href_headers(
                 f_type = content_type or resp.content_type
                 f_size = resp.content_length
                 f_enc = resp.content_encoding
+                f_etag = resp.headers.get("ETag")
 
         else:
             try:
@@ -1545,6 +1753,7 @@ def get_href_headers(
                 f_type = content_type
                 f_size = stat.st_size
                 f_modified = datetime.fromtimestamp(stat.st_mtime)
+                f_etag = get_file_etag(stat)
             except OSError:
                 if not missing_ok:
                     raise
@@ -1580,9 +1789,24 @@ def get_href_headers(
             headers["Content-Disposition"] = f"{content_disposition_type}; {content_disposition_params}"
     f_current = get_file_header_datetime(now())
     headers["Date"] = f_current
-    if f_modified:
-        f_modified = get_file_header_datetime(f_modified)
-        headers["Last-Modified"] = f_modified
+    headers.update(get_validator_headers(f_modified, f_etag if etag_header else None))
+    return headers
+
+
+def get_validator_headers(modified=None, etag=None):
+    # type: (Optional[datetime], Optional[str]) -> HeadersType
+    """
+    Obtain the HTTP validator headers of a file reference, used to evaluate conditional requests.
+
+    :param modified: Last modification time of the file.
+    :param etag: Entity tag of the file.
+    :return: ``Last-Modified`` and ``ETag`` headers, for the available validators.
+    """
+    headers = {}
+    if modified:
+        headers["Last-Modified"] = get_file_header_datetime(modified)
+    if etag:
+        headers["ETag"] = etag
     return headers
 
 
@@ -2021,7 +2245,7 @@ def setup_cache(settings, reset=True):
     if reset:
         reset_cache()
     # apply defaults to avoid missing items during runtime
-    settings["cache.regions"] = "doc, request, result, quotation"
+    settings["cache.regions"] = "doc, request, result, quotation, process"
     settings.setdefault("cache.type", "memory")
     settings.setdefault("cache.doc.enable", "false")
     settings.setdefault("cache.doc.expired", "3600")
@@ -2031,6 +2255,10 @@ def setup_cache(settings, reset=True):
     settings.setdefault("cache.result.expire", "3600")
     settings.setdefault("cache.quotation.enabled", "true")
     settings.setdefault("cache.quotation.expire", "3600")  # consider API limits and rate-limiting, caching for 1h
+    # loaded process instances are only reusable within the same worker, they must not be pickled to a shared backend
+    settings.setdefault("cache.process.enabled", "true")
+    settings.setdefault("cache.process.expire", "3600")
+    settings["cache.process.type"] = "memory"
     set_cache_regions_from_settings(settings)
 
 
@@ -2119,6 +2347,133 @@ def get_no_cache_option(request_headers, **cache_options):
     return no_cache
 
 
+class RequestOptionsMatcher(object):
+    """
+    Precompiled :term:`Request Options` specification for efficient lookup of options applicable to requests.
+
+    URL patterns of every entry are compiled once, and entries are indexed by the host they apply to, such that only
+    the few entries that could match a request are evaluated, followed by patterns that apply to any host. Results of
+    recent lookups are memorized since the same locations tend to be requested repeatedly (e.g.: status monitoring).
+    The first matching entry by order of the specification is returned, as when evaluating all of them sequentially.
+
+    .. note::
+        The specification is expected to remain unmodified once compiled.
+        Any update of the options must provide a new specification.
+    """
+
+    def __init__(self, specification):
+        # type: (RequestOptionsSpecification) -> None
+        self.specification = specification
+        self.requests = specification.get("requests", []) or []
+        self._count = len(self.requests)
+        self._entries = []  # type: List[RequestOptionsMatcherEntry]
+        self._hosts = {}    # type: Dict[str, List[int]]
+        self._domains = {}  # type: Dict[str, List[int]]
+        self._generic = []  # type: List[int]
+        for index, req_opts in enumerate(self.requests):
+            req_meth = req_opts.get("method", "")
+            methods = None
+            if req_meth:
+                methods = req_meth if isinstance(req_meth, list) else req_meth.split(",")
+                methods = frozenset(meth.strip().upper() for meth in methods)
+                if "*" in methods:
+                    methods = None
+            req_urls = req_opts.get("url")
+            req_urls = [req_urls] if not isinstance(req_urls, list) else req_urls
+            req_patterns = [pattern.strip() for req_url in req_urls for pattern in ",".join(aslist(req_url)).split(",")]
+            req_regex = "|".join(parse_match_pattern(pattern, path_required=False) for pattern in req_patterns)
+            options = {opt: val for opt, val in req_opts.items() if opt not in ["url", "method"]}
+            nested = any(isinstance(val, (dict, list, set)) for val in options.values())
+            self._entries.append((methods, re.compile(f"({req_regex})"), cast("RequestOptions", options), nested))
+            for pattern in req_patterns:
+                index_list = self._get_pattern_index(pattern)
+                if not index_list or index_list[-1] != index:
+                    index_list.append(index)
+        self.match = functools.lru_cache(maxsize=REQUEST_OPTIONS_CACHE_SIZE)(self._match)
+
+    def _get_pattern_index(self, pattern):
+        # type: (str) -> List[int]
+        """
+        Obtain the index list where the entry of the pattern must be registered according to its host definition.
+        """
+        scheme = re.match(r"^(\*|https?)://", pattern)
+        location = pattern[len(scheme.group(0)):]
+        domain = re.match(r"^(?:\*|(\*\.)?([^/*]+))", location)
+        remain = location[len(domain.group(0)):]
+        if domain.group(0) == "*" or (remain and not remain.startswith("/")):
+            return self._generic  # host is not fully defined, must be evaluated for any request
+        if domain.group(1):
+            return self._domains.setdefault(domain.group(2), [])
+        return self._hosts.setdefault(domain.group(2), [])
+
+    def is_compiled(self, specification):
+        # type: (RequestOptionsSpecification) -> bool
+        """
+        Verify that the specification is the one that was compiled.
+        """
+        requests_entries = specification.get("requests", []) or []
+        return (
+            specification is self.specification
+            and (requests_entries is self.requests or not requests_entries and not self.requests)
+            and len(requests_entries) == self._count
+        )
+
+    def _match(self, method, url):
+        # type: (str, str) -> Optional[int]
+        host = urlparse(url).netloc.rsplit("@", 1)[-1]
+        candidates = set(self._hosts.get(host, []))
+        candidates.update(self._generic)
+        domain = host
+        while True:
+            candidates.update(self._domains.get(domain, []))
+            if "." not in domain:
+                break
+            domain = domain.split(".", 1)[-1]
+        for index in sorted(candidates):
+            methods, regex, _, _ = self._entries[index]
+            if methods is not None and method not in methods:
+                continue
+            if regex.search(url):
+                return index
+        return None
+
+    def get_options(self, method, url):
+        # type: (str, str) -> RequestOptions
+        """
+        Obtain a copy of the options of the first entry matching the request, or empty options if none matched.
+        """
+        if not url.endswith("/"):
+            url = f"{url}/"  # allow 'domain.com' match since 'urlmatch' requires slash in 'domain.com/*'
+        index = self.match(method.upper(), url)
+        if index is None:
+            return cast("RequestOptions", {})
+        _, _, options, nested = self._entries[index]
+        return deepcopy(options) if nested else cast("RequestOptions", dict(options))
+
+
+_REQUEST_OPTIONS_MATCHERS = {}  # type: Dict[int, RequestOptionsMatcher]
+_REQUEST_OPTIONS_MATCHERS_LOCK = threading.Lock()
+_REQUEST_OPTIONS_MATCHERS_LIMIT = 16
+
+
+def get_request_options_matcher(specification):
+    # type: (RequestOptionsSpecification) -> RequestOptionsMatcher
+    """
+    Obtain the compiled :term:`Request Options` specification, compiling it only if not already done.
+    """
+    key = id(specification)
+    matcher = _REQUEST_OPTIONS_MATCHERS.get(key)
+    if matcher is not None and matcher.is_compiled(specification):
+        return matcher
+    matcher = RequestOptionsMatcher(specification)
+    with _REQUEST_OPTIONS_MATCHERS_LOCK:
+        _REQUEST_OPTIONS_MATCHERS.pop(key, None)
+        while len(_REQUEST_OPTIONS_MATCHERS) >= _REQUEST_OPTIONS_MATCHERS_LIMIT:
+            _REQUEST_OPTIONS_MATCHERS.pop(next(iter(_REQUEST_OPTIONS_MATCHERS)))
+        _REQUEST_OPTIONS_MATCHERS[key] = matcher
+    return matcher
+
+
 def get_request_options(method, url, settings):
     # type: (str, str, Optional[AnySettingsContainer]) -> RequestOptions
     """
@@ -2129,6 +2484,7 @@ def get_request_options(method, url, settings):
 
     .. seealso::
         - :func:`get_ssl_verify_option`
+        - :class:`RequestOptionsMatcher`
         - `config/request_options.yml.example <../../../config/request_options.yml.example>`_
 
     :param method: request method (GET, POST, etc.).
@@ -2150,30 +2506,9 @@ def get_request_options(method, url, settings):
         LOGGER.warning("Settings container provided by [%s] missing request options specification. "
                        "Request might not be executed with expected configuration.", get_caller_name(skip=2))
         return {}
-    request_options = cast("RequestOptions", {})
-    request_entries = req_opts_specs.get("requests", []) or []
-    for req_opts in request_entries:
-        req_meth = req_opts.get("method", "")
-        if req_meth:
-            methods = req_meth if isinstance(req_meth, list) else req_meth.split(",")
-            methods = [meth.upper() for meth in methods]
-            if method.upper() not in methods and "*" not in methods:
-                continue
-        req_urls = req_opts.get("url")
-        req_urls = [req_urls] if not isinstance(req_urls, list) else req_urls
-        req_regex = []
-        for req_url in req_urls:
-            req_regex.extend(aslist(req_url))
-        req_regex = ",".join(req_regex)
-        if not url.endswith("/"):
-            url = f"{url}/"  # allow 'domain.com' match since 'urlmatch' requires slash in 'domain.com/*'
-        if not urlmatch(req_regex, url, path_required=False):
-            continue
-        req_opts = deepcopy(req_opts)
-        req_opts.pop("url", None)
-        req_opts.pop("method", None)
-        return req_opts
-    return request_options
+    if not req_opts_specs.get("requests"):
+        return cast("RequestOptions", {})
+    return get_request_options_matcher(req_opts_specs).get_options(method, url)
 
 
 def retry_on_condition(operation,               # type: AnyCallableAnyArgs
@@ -2263,15 +2598,166 @@ def retry_on_cache_error(func):
     return wrapped
 
 
+class RequestSessionPool(object):
+    """
+    Thread-safe pool of :class:`requests.Session` that keeps connections alive between requests to the same host.
+
+    Sessions are distinguished by scheme, host and request options that affect the established connection
+    (``verify``, ``cert``, ``proxies``) to avoid reusing a connection negotiated with different security parameters.
+    Each session is employed by a single request at a time, and its cookies are cleared when returned to the pool
+    such that no state is shared between unrelated requests. Sessions that remained unused for longer than the idle
+    timeout are closed, as well as any session returned while the pool of its host is already full.
+
+    .. seealso::
+        Settings ``weaver.request_session_pool``, ``weaver.request_session_pool_size`` and
+        ``weaver.request_session_idle_timeout`` configure the pool employed by :func:`request_extra`.
+    """
+
+    def __init__(self, enabled=True, pool_size=REQUEST_SESSION_POOL_SIZE, idle_timeout=REQUEST_SESSION_IDLE_TIMEOUT):
+        # type: (bool, int, Number) -> None
+        self.enabled = enabled
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._idle = {}  # type: Dict[RequestSessionKey, List[Tuple[float, requests.Session]]]
+        self._pid = os.getpid()
+
+    def configure(self, settings):
+        # type: (AnySettingsContainer) -> None
+        """
+        Applies the pool configuration from the settings, closing idle sessions if it was modified.
+        """
+        settings = get_settings(settings) or {}
+        enabled = asbool(settings.get("weaver.request_session_pool", True))
+        pool_size = max(as_int(settings.get("weaver.request_session_pool_size"), REQUEST_SESSION_POOL_SIZE), 1)
+        idle_timeout = as_int(settings.get("weaver.request_session_idle_timeout"), REQUEST_SESSION_IDLE_TIMEOUT)
+        if (enabled, pool_size, idle_timeout) != (self.enabled, self.pool_size, self.idle_timeout):
+            self.enabled = enabled
+            self.pool_size = pool_size
+            self.idle_timeout = idle_timeout
+            self.clear()
+
+    @staticmethod
+    def get_key(url, kwargs):
+        # type: (str, RequestCachingKeywords) -> RequestSessionKey
+        """
+        Obtain the key identifying sessions that can be reused for the request.
+        """
+        url_parts = urlparse(url)
+        proxies = kwargs.get("proxies") or {}
+        proxies = tuple(sorted((str(scheme), str(proxy)) for scheme, proxy in proxies.items()))
+        return (
+            url_parts.scheme.lower(),
+            url_parts.netloc.lower(),
+            str(kwargs.get("verify", True)),
+            str(kwargs.get("cert")),
+            proxies,
+        )
+
+    def _create(self):
+        # type: () -> requests.Session
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_maxsize=self.pool_size))
+        session.mount("https://", HTTPAdapter(pool_maxsize=self.pool_size))
+        session.mount("file://", FileAdapter())
+        return session
+
+    def _prune(self, timestamp):
+        # type: (float) -> List[requests.Session]
+        """
+        Removes expired idle sessions. Must be called with the lock acquired.
+
+        :returns: Removed sessions, to be closed once the lock is released.
+        """
+        expired = []
+        for key in list(self._idle):
+            sessions = self._idle[key]
+            active = [(used, session) for used, session in sessions if timestamp - used <= self.idle_timeout]
+            expired.extend(session for used, session in sessions if timestamp - used > self.idle_timeout)
+            if active:
+                self._idle[key] = active
+            else:
+                self._idle.pop(key)
+        return expired
+
+    def acquire(self, key):
+        # type: (RequestSessionKey) -> requests.Session
+        """
+        Obtain an idle session matching the key, or a new one if none is available.
+        """
+        with self._lock:
+            if self._pid != os.getpid():  # forked worker process, connections of the parent must not be shared
+                self._idle = {}
+                self._pid = os.getpid()
+            expired = self._prune(time.monotonic())
+            sessions = self._idle.get(key)
+            session = sessions.pop()[1] if sessions else None
+        for expired_session in expired:
+            expired_session.close()
+        return session or self._create()
+
+    def release(self, key, session):
+        # type: (RequestSessionKey, requests.Session) -> None
+        """
+        Returns the session to the pool to be reused by following requests, or closes it if the pool is full.
+        """
+        session.cookies.clear()
+        with self._lock:
+            sessions = self._idle.setdefault(key, [])
+            if self._pid == os.getpid() and len(sessions) < self.pool_size:
+                sessions.append((time.monotonic(), session))
+                session = None
+        if session is not None:
+            session.close()
+
+    def clear(self):
+        # type: () -> None
+        """
+        Closes all idle sessions.
+        """
+        with self._lock:
+            sessions = [session for idle in self._idle.values() for _, session in idle]
+            self._idle = {}
+        for session in sessions:
+            session.close()
+
+    @contextlib.contextmanager
+    def session(self, url, kwargs):
+        # type: (str, RequestCachingKeywords) -> Iterator[requests.Session]
+        """
+        Provides a session for the request, which is returned to the pool once completed.
+
+        If an error occurs, the session is discarded since its connections could be in an invalid state.
+        If the pool is disabled, a new session is created and closed for every request.
+        """
+        if not self.enabled:
+            with requests.Session() as session:
+                session.mount("file://", FileAdapter())
+                yield session
+            return
+        key = self.get_key(url, kwargs)
+        session = self.acquire(key)
+        try:
+            yield session
+        except BaseException:
+            session.close()
+            raise
+        self.release(key, session)
+
+
+REQUEST_SESSION_POOL = RequestSessionPool()
+
+
 def _request_call(method, url, kwargs):
     # type: (AnyRequestMethod, str, RequestCachingKeywords) -> Response
     """
     Request operation employed by :func:`request_extra` without caching.
+
+    Connections are reused across requests by means of the :data:`REQUEST_SESSION_POOL`.
     """
-    with requests.Session() as request_session:
-        if urlparse(url).scheme in ["", "file"]:
-            url = f"file://{os.path.abspath(url)}" if not url.startswith("file://") else url
-            request_session.mount("file://", FileAdapter())
+    if urlparse(url).scheme in ["", "file"]:
+        url = f"file://{os.path.abspath(url)}" if not url.startswith("file://") else url
+    with REQUEST_SESSION_POOL.session(url, kwargs) as request_session:
         resp = request_session.request(method, url, **kwargs)
     return resp
 
@@ -2424,6 +2910,7 @@ def request_extra(method,                           # type: AnyRequestMethod
     """
     # obtain file request-options arguments, then override any explicitly provided source-code keywords
     settings = get_settings(settings) or {}
+    REQUEST_SESSION_POOL.configure(settings)
     request_options = get_request_options(method, url, settings)
     request_options.update(request_kwargs)
     request_kwargs = request_options  # update ref to ensure following modifications consider all parameters
@@ -2469,6 +2956,7 @@ def request_extra(method,                           # type: AnyRequestMethod
                 LOGGER.debug("Received header [Retry-After=%ss] (code=%s) for [%s %s]", after, code, method, url)
             LOGGER.debug("Retrying failed request after delay=%ss (code=%s) for [%s %s]", delay, code, method, url)
             time.sleep(delay)
+            observe_request_retry(method, urlparse(url).hostname)
         try:
             if no_cache:
                 resp = _request_call(*request_args)
@@ -2561,6 +3049,28 @@ def get_secure_path(location):
     return secure_loc
 
 
+def get_fetch_file_cache(settings):
+    # type: (Optional[AnySettingsContainer]) -> Optional[FileCache]
+    """
+    Obtain the cache of files downloaded from remote references shared by jobs on this host, if enabled.
+
+    .. seealso::
+        Settings ``weaver.fetch_cache_dir`` and ``weaver.fetch_cache_size``.
+    """
+    settings = get_settings(settings) if settings else {}
+    cache_dir = settings.get("weaver.fetch_cache_dir")
+    if not cache_dir:
+        return None
+    cache_size = settings.get("weaver.fetch_cache_size") or FETCH_CACHE_DEFAULT_SIZE
+    try:
+        cache_size = int(parse_number_with_unit(str(cache_size), binary=True))
+    except ValueError:
+        LOGGER.warning("Invalid [weaver.fetch_cache_size = %s]. Using default [%s].",
+                       cache_size, FETCH_CACHE_DEFAULT_SIZE)
+        cache_size = int(parse_number_with_unit(FETCH_CACHE_DEFAULT_SIZE, binary=True))
+    return get_file_cache(cache_dir, cache_size)
+
+
 def download_file_http(file_reference, file_outdir, settings=None, callback=None, **request_kwargs):
     # type: (str, str, Optional[AnySettingsContainer], Optional[Callable[[str], None]], **Any) -> str
     """
@@ -2584,7 +3094,43 @@ def download_file_http(file_reference, file_outdir, settings=None, callback=None
 
     LOGGER.debug("Fetch file resolved as remote URL reference.")
     request_kwargs.pop("stream", None)
-    resp = request_extra("GET", file_reference, stream=True, retries=3, settings=settings, **request_kwargs)
+    file_cache = get_fetch_file_cache(settings)
+    if file_cache:
+        # concurrent jobs wait for a single download and reuse the cached file afterward
+        with file_cache.lock(file_reference):
+            return _download_file_http(file_reference, file_outdir, settings, callback, file_cache, **request_kwargs)
+    return _download_file_http(file_reference, file_outdir, settings, callback, None, **request_kwargs)
+
+
+def _download_file_http(file_reference,    # type: str
+                        file_outdir,       # type: str
+                        settings,          # type: Optional[AnySettingsContainer]
+                        callback,          # type: Optional[Callable[[str], None]]
+                        file_cache,        # type: Optional[FileCache]
+                        **request_kwargs,  # type: Any
+                        ):                 # type: (...) -> str
+    """
+    Downloads the file referenced by an HTTP URL location, reusing the cached file when still valid.
+
+    .. seealso::
+        :func:`download_file_http`
+    """
+    resp = None
+    cache_entry = file_cache.get(file_reference) if file_cache else None
+    if cache_entry:
+        # always revalidate to ensure the file did not change and that the requester is allowed to access it
+        headers = CaseInsensitiveDict(request_kwargs.get("headers") or {})
+        headers.update(file_cache.validators(cache_entry))
+        resp = request_extra("GET", file_reference, stream=True, retries=3, settings=settings,
+                             **dict(request_kwargs, headers=headers))
+        if resp.status_code == 304:
+            file_path = _link_cached_file(file_cache, cache_entry, file_outdir)
+            if file_path:
+                LOGGER.debug("Reusing cached file [%s] for still valid reference [%s].", file_path, file_reference)
+                return file_path
+            resp = None  # file evicted in the meantime, retrieve it again without validators
+    if resp is None:
+        resp = request_extra("GET", file_reference, stream=True, retries=3, settings=settings, **request_kwargs)
     if resp.status_code >= 400:  # pragma: no cover
         # use method since response object does not derive from Exception, therefore cannot be raised directly
         if hasattr(resp, "raise_for_status"):
@@ -2650,17 +3196,318 @@ def download_file_http(file_reference, file_outdir, settings=None, callback=None
 
     file_name = f"{file_name}{file_ext}"
     file_path = os.path.join(file_outdir, file_name)
-    with open(file_path, "wb") as file:  # pylint: disable=W1514
-        # NOTE:
-        #   Setting 'chunk_size=None' lets the request find a suitable size according to
-        #   available memory. Without this, it defaults to 1 which is extremely slow.
-        for chunk in resp.iter_content(chunk_size=None):
-            if callback:
-                callback(chunk)
-            file.write(chunk)
+    cache_control = str(get_header("Cache-Control", resp.headers) or "").lower()
+    cache_etag = get_header("ETag", resp.headers)
+    cache_modified = get_header("Last-Modified", resp.headers)
+    cacheable = file_cache and (cache_etag or cache_modified) and "no-store" not in cache_control
+    download_options = get_download_options(file_reference, settings, **request_kwargs)
+    for option in download_options:
+        request_kwargs.pop(option, None)
+    resume_retries = download_options["download_resume_retries"]
+    segments = _get_download_segments(resp, download_options)
+    if segments > 1:
+        _download_file_http_segments(file_reference, file_path, resp, segments, settings=settings,
+                                     callback=callback, resume_retries=resume_retries, **request_kwargs)
+        # segments are written concurrently at distinct positions, the digest requires the complete file
+        digest = compute_file_digest(file_path)
+        if cacheable:
+            cache_entry = file_cache.store_file(file_reference, file_name, file_path, digest=digest.hex(),
+                                                etag=cache_etag, last_modified=cache_modified)
+            return _link_cached_file(file_cache, cache_entry, file_outdir)
+        store_file_digest(file_path, digest)
+        return file_path
+
+    if cacheable:
+        chunks = _iter_download_chunks(resp, file_reference, settings=settings, callback=callback,
+                                       resume_retries=resume_retries, **request_kwargs)
+        cache_entry = file_cache.store(file_reference, file_name, chunks,
+                                       etag=cache_etag, last_modified=cache_modified)
+        return _link_cached_file(file_cache, cache_entry, file_outdir)
+    _download_file_http_partial(file_reference, file_path, resp, settings=settings,
+                                callback=callback, resume_retries=resume_retries, **request_kwargs)
+    return file_path
+
+
+def _link_cached_file(file_cache, cache_entry, file_outdir):
+    # type: (FileCache, FileCacheEntry, str) -> Optional[str]
+    """
+    Generates the cached file under the output directory and memorizes its digest already known by the cache.
+    """
+    file_path = file_cache.link(cache_entry, file_outdir)
+    if file_path:
+        store_file_digest(file_path, bytes.fromhex(cache_entry["digest"]))
     return file_path
 
 
+def get_download_options(file_reference, settings=None, **request_kwargs):
+    # type: (str, Optional[AnySettingsContainer], **Any) -> DownloadOptions
+    """
+    Obtain the options that control how a file is downloaded from the remote location.
+
+    Options are resolved from the matching ``GET`` entry in the :term:`Request Options` file, unless explicitly
+    provided by keywords. Following options are supported:
+
+    - ``download_resume_retries``: amount of times an interrupted transfer can be resumed from the received position.
+    - ``download_segments``: maximum amount of concurrent connections to retrieve a single file by byte ranges.
+    - ``download_segment_size``: minimum size of each segment (integer bytes, or string with unit such as ``64MiB``).
+
+    .. seealso::
+        - :func:`get_request_options`
+        - `config/request_options.yml.example <../../../config/request_options.yml.example>`_
+    """
+    options = get_request_options("GET", file_reference, settings) if settings else {}
+    options.update(request_kwargs)
+    segment_size = options.get("download_segment_size") or DOWNLOAD_SEGMENT_SIZE
+    try:
+        segment_size = int(parse_number_with_unit(str(segment_size), binary=True))
+    except ValueError:
+        LOGGER.warning("Invalid download segment size [%s] for [%s]. Using default [%s].",
+                       segment_size, file_reference, DOWNLOAD_SEGMENT_SIZE)
+        segment_size = int(parse_number_with_unit(DOWNLOAD_SEGMENT_SIZE, binary=True))
+    return {
+        "download_resume_retries": max(as_int(options.get("download_resume_retries"), DOWNLOAD_RESUME_RETRIES), 0),
+        "download_segments": max(as_int(options.get("download_segments"), 1), 1),
+        "download_segment_size": max(segment_size, 1),
+    }
+
+
+def _get_download_validator(response):
+    # type: (AnyResponseType) -> Optional[str]
+    """
+    Obtain the validator of a downloaded resource if its byte ranges can be requested to resume or split a transfer.
+
+    Byte ranges must be advertised with ``Accept-Ranges``, and a strong ``ETag`` or ``Last-Modified`` value must be
+    available to ensure that all ranges are obtained from the same resource version with ``If-Range``. Encoded contents
+    (e.g.: ``gzip``) are not considered, since decoded chunk sizes do not correspond to the requested ranges.
+    """
+    accept_ranges = str(get_header("Accept-Ranges", response.headers) or "").lower()
+    encoding = str(get_header("Content-Encoding", response.headers) or "identity").lower()
+    if "bytes" not in accept_ranges or encoding != "identity":
+        return None
+    etag = get_header("ETag", response.headers)
+    if etag and not etag.startswith("W/"):  # weak validators are not allowed by 'If-Range'
+        return etag
+    return get_header("Last-Modified", response.headers)
+
+
+def _get_download_segments(response, download_options):
+    # type: (AnyResponseType, DownloadOptions) -> int
+    """
+    Obtain the amount of segments to employ for downloading the contents of the response concurrently.
+    """
+    segments = download_options["download_segments"]
+    if segments <= 1 or not _get_download_validator(response):
+        return 1
+    size = as_int(get_header("Content-Length", response.headers), 0)
+    return max(min(segments, size // download_options["download_segment_size"]), 1)
+
+
+def _request_download_range(file_reference, validator, start, end=None, *, settings=None, **request_kwargs):
+    # type: (str, str, int, Optional[int], Optional[AnySettingsContainer], **Any) -> AnyResponseType
+    """
+    Request the byte range of the remote file, ensuring it corresponds to the same version of the file.
+
+    :raises ValueError: if the server did not return the requested range (e.g.: file modified).
+    """
+    headers = CaseInsensitiveDict(request_kwargs.pop("headers", None) or {})
+    headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+    headers["If-Range"] = validator
+    resp = request_extra("GET", file_reference, stream=True, retries=3, settings=settings,
+                         cache_enabled=False, headers=headers, **request_kwargs)
+    content_range = str(get_header("Content-Range", resp.headers) or "")
+    if resp.status_code != 206 or not content_range.startswith(f"bytes {start}-"):
+        raise ValueError(
+            f"Could not obtain byte range [{headers['Range']}] from [{file_reference}] "
+            f"(status: {resp.status_code}, Content-Range: {content_range or None}). "
+            "The file could have been modified during the transfer."
+        )
+    return resp
+
+
+def _iter_download_chunks(response,             # type: AnyResponseType
+                          file_reference,       # type: str
+                          *,                    # force named keyword arguments after
+                          settings=None,        # type: Optional[AnySettingsContainer]
+                          callback=None,        # type: Optional[Callable[[AnyStr], None]]
+                          resume_retries=0,     # type: int
+                          offset=0,             # type: int
+                          end=None,             # type: Optional[int]
+                          validator=None,       # type: Optional[str]
+                          **request_kwargs,     # type: Any
+                          ):                    # type: (...) -> Iterator[bytes]
+    """
+    Iterates over the downloaded chunks, resuming the transfer from the received position if it gets interrupted.
+
+    Resuming is only attempted if the server supports byte ranges with a validator (see :func:`_get_download_validator`)
+    and while :paramref:`resume_retries` are not exhausted. Otherwise, the original error is raised.
+
+    :param response: Streamed response of the file (or of its range starting at :paramref:`offset`).
+    :param file_reference: HTTP URL where the file is hosted.
+    :param settings: Additional request-related settings from the application configuration (notably request-options).
+    :param callback: Function that gets called progressively with incoming chunks.
+    :param resume_retries: Maximum amount of times the transfer can be resumed.
+    :param offset: Position of the first byte provided by the response.
+    :param end: Position of the last byte to retrieve, or the end of the file if unspecified.
+    :param validator: Value for ``If-Range`` (resolved from the response if unspecified).
+    :param request_kwargs: Additional keywords to forward to request call (if needed).
+    """
+    validator = validator or _get_download_validator(response)
+    position = offset
+    attempts = 0
+    while True:
+        try:
+            # NOTE:
+            #   Explicit 'chunk_size' since it defaults to 1 which is extremely slow.
+            #   Using 'chunk_size=None' would instead load the complete contents at once when the response
+            #   does not employ chunked transfer-encoding, making it impossible to resume from the received position.
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if callback:
+                    callback(chunk)
+                position += len(chunk)
+                yield chunk
+            return
+        except (requests.exceptions.ChunkedEncodingError, requests.ConnectionError, requests.Timeout) as exc:
+            if not validator or attempts >= resume_retries:
+                raise
+            attempts += 1
+            LOGGER.warning("Download of [%s] interrupted at byte %s (%s). Resuming transfer (attempt %s/%s).",
+                           file_reference, position, exc, attempts, resume_retries)
+            response.close()
+            response = _request_download_range(file_reference, validator, position, end,
+                                               settings=settings, **request_kwargs)
+
+
+def _get_partial_download_offset(file_reference, part_path, validator):
+    # type: (str, str, Optional[str]) -> int
+    """
+    Obtain the position from which a partial file left by a previous interrupted download can be resumed.
+
+    :returns: Size of the partial file, or zero if it does not correspond to the same version of the remote file.
+    """
+    if not validator:
+        return 0
+    import json as _json  # avoid shadowing by 'json' parameters of other functions in this module
+    try:
+        with open(f"{part_path}.json", mode="r", encoding="utf-8") as part_meta:
+            meta = _json.load(part_meta)
+        if meta["url"] == file_reference and meta["validator"] == validator:
+            return os.stat(part_path).st_size
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return 0
+
+
+def _download_file_http_partial(file_reference,       # type: str
+                                file_path,            # type: str
+                                response,             # type: AnyResponseType
+                                *,                    # force named keyword arguments after
+                                settings=None,        # type: Optional[AnySettingsContainer]
+                                callback=None,        # type: Optional[Callable[[AnyStr], None]]
+                                resume_retries=0,     # type: int
+                                **request_kwargs,     # type: Any
+                                ):                    # type: (...) -> None
+    """
+    Downloads the file contents into a partial file that is resumed by following attempts if the transfer fails.
+
+    Contents are written to the file with :data:`DOWNLOAD_PARTIAL_SUFFIX`, along with metadata of the remote file
+    version. If a partial file of the same version remains from a previous attempt (e.g.: worker restarted, exhausted
+    retries), only the missing byte range is requested. The partial file is moved to the final location only once
+    complete, and its digest is memorized.
+    """
+    part_path = f"{file_path}{DOWNLOAD_PARTIAL_SUFFIX}"
+    validator = _get_download_validator(response)
+    digest = get_hash_function()
+    offset = _get_partial_download_offset(file_reference, part_path, validator)
+    if offset:
+        try:
+            range_resp = _request_download_range(file_reference, validator, offset,
+                                                 settings=settings, **request_kwargs)
+        except ValueError as exc:  # modified or complete file, range not satisfiable
+            LOGGER.debug("Cannot resume partial file [%s] (%s). Restarting download.", part_path, exc)
+            offset = 0
+        else:
+            LOGGER.debug("Resuming partial file [%s] of [%s] from byte %s.", part_path, file_reference, offset)
+            response.close()
+            response = range_resp
+            with open(part_path, "rb") as part_file:
+                while chunk := part_file.read(FILE_DIGEST_CHUNK_SIZE):
+                    digest.update(chunk)
+    if not offset and validator:
+        import json as _json  # avoid shadowing by 'json' parameters of other functions in this module
+        with open(f"{part_path}.json", mode="w", encoding="utf-8") as part_meta:
+            _json.dump({"url": file_reference, "validator": validator}, part_meta)
+    try:
+        with open(part_path, "ab" if offset else "wb") as file:  # pylint: disable=W1514
+            for chunk in _iter_download_chunks(response, file_reference, settings=settings, callback=callback,
+                                               resume_retries=resume_retries, offset=offset,
+                                               validator=validator, **request_kwargs):
+                digest.update(chunk)
+                file.write(chunk)
+    except BaseException:
+        if not validator:  # cannot be resumed without knowing that the remote file remains the same
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(part_path)
+        raise
+    os.replace(part_path, file_path)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(f"{part_path}.json")
+    store_file_digest(file_path, digest.digest())
+
+
+def _download_file_http_segments(file_reference,       # type: str
+                                 file_path,            # type: str
+                                 response,             # type: AnyResponseType
+                                 segments,             # type: int
+                                 *,                    # force named keyword arguments after
+                                 settings=None,        # type: Optional[AnySettingsContainer]
+                                 callback=None,        # type: Optional[Callable[[AnyStr], None]]
+                                 resume_retries=0,     # type: int
+                                 **request_kwargs,     # type: Any
+                                 ):                    # type: (...) -> None
+    """
+    Downloads the file with multiple concurrent connections, each retrieving a distinct byte range.
+
+    The initial response is only used to obtain the file size and its validator, and is closed without reading it.
+    Each segment is written directly at its position in the file, and can be resumed individually if interrupted.
+    If any segment fails, the others are aborted.
+    """
+    validator = _get_download_validator(response)
+    size = int(get_header("Content-Length", response.headers))
+    response.close()
+    LOGGER.debug("Downloading [%s] (%s bytes) using %s segments.", file_reference, size, segments)
+    with open(file_path, "wb") as file:  # pylint: disable=W1514
+        file.truncate(size)
+    task_kill_event = threading.Event()  # abort remaining tasks if set
+
+    def _segment_callback(_chunk):
+        # type: (AnyStr) -> None
+        if task_kill_event.is_set():
+            raise CancelledError("Other failed download segment triggered abort event.")
+        if callback:
+            callback(_chunk)
+
+    def _download_segment(_start, _end):
+        # type: (int, int) -> None
+        _resp = _request_download_range(file_reference, validator, _start, _end,
+                                        settings=settings, **request_kwargs)
+        with open(file_path, "r+b") as _file:  # pylint: disable=W1514
+            _file.seek(_start)
+            for _chunk in _iter_download_chunks(_resp, file_reference, settings=settings, callback=_segment_callback,
+                                                resume_retries=resume_retries, offset=_start, end=_end,
+                                                validator=validator, **request_kwargs):
+                _file.write(_chunk)
+
+    bounds = [(size * idx // segments, size * (idx + 1) // segments - 1) for idx in range(segments)]
+    with ThreadPoolExecutor(max_workers=segments) as executor:
+        futures = [executor.submit(_download_segment, start, end) for start, end in bounds]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except Exception:
+            task_kill_event.set()
+            raise
+
+
 def validate_s3(*, region, bucket):
     # type: (Any, str, str) -> None
     """
@@ -2858,6 +3705,88 @@ def resolve_s3_http_options(**request_kwargs):
     return params
 
 
+_S3_CLIENTS = OrderedDict()  # type: OrderedDict[Tuple[Any, ...], S3Client]
+_S3_CLIENTS_LOCK = threading.Lock()
+
+
+def get_s3_transfer_config(settings=None):
+    # type: (Optional[AnySettingsContainer]) -> TransferConfig
+    """
+    Obtain the configuration of :term:`AWS` :term:`S3` file transfers from the application settings.
+
+    Files larger than the multipart threshold are transferred in chunks retrieved or sent concurrently.
+    """
+    settings = get_settings(settings) if settings is not None else {}
+    threshold = settings.get("weaver.s3_transfer_multipart_threshold") or S3_TRANSFER_MULTIPART_THRESHOLD
+    chunk_size = settings.get("weaver.s3_transfer_multipart_chunksize") or S3_TRANSFER_MULTIPART_CHUNKSIZE
+    concurrency = as_int(settings.get("weaver.s3_transfer_max_concurrency"), S3_TRANSFER_MAX_CONCURRENCY)
+    return TransferConfig(
+        multipart_threshold=int(parse_number_with_unit(str(threshold), binary=True)),
+        multipart_chunksize=int(parse_number_with_unit(str(chunk_size), binary=True)),
+        max_concurrency=max(concurrency, 1),
+        use_threads=concurrency > 1,
+    )
+
+
+def get_s3_transfer_max_files(settings=None):
+    # type: (Optional[AnySettingsContainer]) -> int
+    """
+    Obtain the maximum amount of :term:`AWS` :term:`S3` files transferred concurrently from the application settings.
+    """
+    settings = get_settings(settings) if settings is not None else {}
+    return max(as_int(settings.get("weaver.s3_transfer_max_files"), S3_TRANSFER_MAX_FILES), 1)
+
+
+def get_s3_client(region_name=None, settings=None, **request_kwargs):
+    # type: (Optional[RegionName], Optional[AnySettingsContainer], **Any) -> S3Client
+    """
+    Obtain an :term:`AWS` :term:`S3` client, reusing any client previously created with the same options.
+
+    Clients are thread-safe and are therefore shared across concurrent transfers. Their connection pool is sized
+    according to the maximum amount of concurrent transfers, such that connections are reused rather than discarded.
+
+    Clients are identified only by the options that affect their connection (region, credentials profile, pool size
+    and parameters resolved by :func:`resolve_s3_http_options`). Other request options, such as headers that could
+    contain tokens, are not retained. The least recently used clients are discarded above
+    :data:`S3_CLIENTS_CACHE_SIZE` distinct combinations.
+
+    :param region_name: Region of the client, or default resolved from the environment if omitted.
+    :param settings: Application settings with S3 transfer configuration.
+    :param request_kwargs: Request options converted to S3 client parameters by :func:`resolve_s3_http_options`.
+    """
+    transfer = get_s3_transfer_config(settings)
+    pool_size = max(transfer.max_request_concurrency * get_s3_transfer_max_files(settings), 10)
+    s3_options = {opt: request_kwargs[opt] for opt in S3_CLIENT_OPTIONS if opt in request_kwargs}
+    s3_options["headers"] = {"User-Agent": get_header("User-Agent", request_kwargs.get("headers"))}
+    key = (
+        os.getpid(),
+        region_name,
+        os.getenv("AWS_PROFILE"),
+        pool_size,
+        repr(sorted(s3_options.items(), key=lambda _opt: _opt[0])),
+    )
+    with _S3_CLIENTS_LOCK:
+        s3_client = _S3_CLIENTS.get(key)
+        if s3_client is None:
+            s3_params = resolve_s3_http_options(**s3_options)
+            s3_params["config"] = s3_params["config"].merge(S3Config(max_pool_connections=pool_size))
+            s3_client = boto3.client("s3", region_name=region_name, **s3_params)
+            _S3_CLIENTS[key] = s3_client
+            while len(_S3_CLIENTS) > S3_CLIENTS_CACHE_SIZE:
+                _S3_CLIENTS.popitem(last=False)
+        _S3_CLIENTS.move_to_end(key)
+    return s3_client
+
+
+def reset_s3_clients():
+    # type: () -> None
+    """
+    Discards previously created :term:`AWS` :term:`S3` clients, such that new ones consider updated credentials.
+    """
+    with _S3_CLIENTS_LOCK:
+        _S3_CLIENTS.clear()
+
+
 def resolve_scheme_options(**kwargs):
     # type: (**Any) -> Tuple[SchemeOptions, RequestOptions]
     """
@@ -2951,15 +3880,16 @@ def fetch_file(file_reference,                      # type: str
         file_path = adjust_file_local(file_href, file_outdir, out_method)
     elif file_href.startswith("s3://"):
         LOGGER.debug("Fetch file resolved as S3 bucket reference.")
-        s3_params = resolve_s3_http_options(**options["http"], **kwargs)
         s3_region = options["s3"].pop("region_name", None)
         s3_bucket, file_key, s3_region_ref = resolve_s3_reference(file_href)
         if s3_region and s3_region_ref and s3_region != s3_region_ref:
             raise ValueError("Invalid AWS S3 reference. "
                              f"Input region name [{s3_region}] mismatches reference region [{s3_region_ref}].")
         s3_region = s3_region_ref or s3_region
-        s3_client = boto3.client("s3", region_name=s3_region, **s3_params)
-        s3_client.download_file(s3_bucket, file_key, file_path, Callback=callback)
+        s3_client = get_s3_client(s3_region, settings=settings, **options["http"], **kwargs)
+        s3_config = get_s3_transfer_config(settings)
+        s3_client.download_file(s3_bucket, file_key, file_path, Callback=callback, Config=s3_config)
+        observe_fetched_bytes("s3", os.stat(file_path).st_size)
     elif file_href.startswith("http"):
         # pseudo-http URL referring to S3 bucket, try to redirect to above S3 handling method if applicable
         if file_href.startswith("https://s3.") or urlparse(file_href).hostname.endswith(".amazonaws.com"):
@@ -2975,6 +3905,7 @@ def fetch_file(file_reference,                      # type: str
             **options["http"],
             **kwargs
         )
+        observe_fetched_bytes(urlparse(file_href).scheme, os.stat(file_path).st_size)
     else:
         scheme = file_reference.split("://", 1)
         scheme = "<none>" if len(scheme) < 2 else scheme[0]
@@ -3015,7 +3946,14 @@ def adjust_file_local(file_reference, file_outdir, out_method):
       Resolve conditionally as follows.
 
       * When the source is a symbolic link itself, the destination will also be a link.
-      * When the source is a direct file reference, the destination will be a hard copy of the file.
+      * When the source is a direct file reference, the destination will be a reflink (copy-on-write clone) of the
+        file when supported by the filesystem, or a hard copy otherwise. Hardlinks are never employed, since the
+        source and the staged file could then be modified through one another.
+
+    The method that was effectively employed to stage the file is reported by the ``weaver_staged_bytes`` metric.
+
+    .. seealso::
+        :func:`weaver.file_cache.clone_file`
 
     :param file_reference: Original location of the file.
     :param file_outdir: Target directory of the file.
@@ -3035,6 +3973,7 @@ def adjust_file_local(file_reference, file_outdir, out_method):
         shutil.move(file_loc, file_outdir)
         if file_loc != file_reference and os.path.islink(file_reference):
             os.remove(file_reference)
+        stage_method = "move"
     # NOTE:
     #   If file is available locally and referenced as a system link, disabling 'follow_symlinks'
     #   creates a copy of the symlink instead of an extra hard-copy of the linked file.
@@ -3043,15 +3982,25 @@ def adjust_file_local(file_reference, file_outdir, out_method):
             os.symlink(os.readlink(file_reference), file_path)
         else:
             shutil.copyfile(file_reference, file_path, follow_symlinks=out_method == OutputMethod.COPY)
+        stage_method = "copy" if out_method == OutputMethod.COPY else "symlink"
     # otherwise copy the file if not already available
     # expand directory of 'file_path' and full 'file_reference' to ensure many symlink don't result in same place
     elif not os.path.isfile(file_path) or os.path.realpath(file_path) != os.path.realpath(file_reference):
         if out_method == OutputMethod.LINK:
             os.symlink(file_reference, file_path)
+            stage_method = "symlink"
+        elif out_method == OutputMethod.AUTO:
+            if os.path.lexists(file_path):
+                os.remove(file_path)  # avoid writing through an existing link or altering contents of a hardlink
+            stage_method = clone_file(file_reference, file_path)
         else:
             shutil.copyfile(file_reference, file_path)
+            stage_method = "copy"
     else:
         LOGGER.debug("File as local reference has no action to take, file already exists: [%s]", file_path)
+        return file_path
+    LOGGER.debug("Staged file [%s] to [%s] using %s.", file_reference, file_path, stage_method)
+    observe_staged_bytes(stage_method, os.stat(file_path).st_size)
     return file_path
 
 
@@ -3151,8 +4100,9 @@ def fetch_files_s3(location,                            # type: str
                    exclude=None,                        # type: Optional[List[str]]
                    matcher=PathMatchingMethod.GLOB,     # type: PathMatchingMethod
                    settings=None,                       # type: Optional[SettingsType]
+                   callback=None,                       # type: Optional[Callable[[AnyStr], None]]
                    **option_kwargs,                     # type: Unpack[Union[SchemeOptions, RequestOptions]]
-                   ):                                   # type: (...) -> List[MetadataResult]
+                   ):                                   # type: (...) -> Iterator[MetadataResult]
     ...
 
 
@@ -3164,8 +4114,9 @@ def fetch_files_s3(location,                            # type: str
                    exclude=None,                        # type: Optional[List[str]]
                    matcher=PathMatchingMethod.GLOB,     # type: PathMatchingMethod
                    settings=None,                       # type: Optional[SettingsType]
+                   callback=None,                       # type: Optional[Callable[[AnyStr], None]]
                    **option_kwargs,                     # type: Unpack[Union[SchemeOptions, RequestOptions]]
-                   ):                                   # type: (...) -> List[DownloadResult]
+                   ):                                   # type: (...) -> Iterator[DownloadResult]
     ...
 
 
@@ -3176,8 +4127,9 @@ def fetch_files_s3(location,                            # type: str
                    exclude=None,                        # type: Optional[List[str]]
                    matcher=PathMatchingMethod.GLOB,     # type: PathMatchingMethod
                    settings=None,                       # type: Optional[SettingsType]
+                   callback=None,                       # type: Optional[Callable[[AnyStr], None]]
                    **option_kwargs,                     # type: Unpack[Union[SchemeOptions, RequestOptions]]
-                   ):                                   # type: (...) -> List[AnyOutputResult]
+                   ):                                   # type: (...) -> Iterator[AnyOutputResult]
     """
     Download all listed S3 files references under the output directory using the provided S3 bucket and client.
 
@@ -3194,6 +4146,8 @@ def fetch_files_s3(location,                            # type: str
     :param exclude: Any matching patterns for files that should be excluded unless included.
     :param matcher: Pattern matching method to evaluate if a file path matches include and exclude definitions.
     :param settings: Additional request-related settings from the application configuration (notably request-options).
+    :param callback:
+        Function called progressively with downloaded chunks of every file. Raising an error in it aborts all downloads.
     :param option_kwargs:
         Additional keywords to forward to the relevant handling method by scheme.
         Keywords should be defined as ``{scheme}_{option}`` with one of the known :data:`SUPPORTED_FILE_SCHEMES`.
@@ -3204,9 +4158,8 @@ def fetch_files_s3(location,                            # type: str
     options, kwargs = resolve_scheme_options(**option_kwargs)
     configs = get_request_options("GET", location, settings)
     options["http"].update(**configs)
-    s3_params = resolve_s3_http_options(**options["http"], **kwargs)
     s3_region = cast("RegionName", options["s3"].pop("region_name", None))
-    s3_client = boto3.client("s3", region_name=s3_region, **s3_params)
+    s3_client = get_s3_client(s3_region, settings=settings, **options["http"], **kwargs)
     s3_bucket, dir_key = location[5:].split("/", 1)
     base_url = f"{s3_client.meta.endpoint_url.rstrip('/')}/"
 
@@ -3216,40 +4169,34 @@ def fetch_files_s3(location,                            # type: str
 
     LOGGER.debug("Resolved S3 Bucket [%s] and Region [%s] for download of files.", s3_bucket, s3_region or "default")
     s3_paging = s3_client.get_paginator("list_objects_v2")
-    LOGGER.debug("Fetching S3 directory [%s] listing.", location)
-    s3_files = (  # definitions with relative paths (like patterns)
-        file
-        for s3_dir_resp in s3_paging.paginate(Bucket=s3_bucket, Prefix=dir_key)
-        for file in s3_dir_resp["Contents"]
-    )
-    s3_files = (file for file in s3_files if not file["Key"].endswith("/"))
-    s3_files = filter_directory_forbidden(s3_files, key=lambda _file: _file["Key"])
-    s3_files = filter_directory_patterns(s3_files, include, exclude, matcher, key=lambda _file: _file["Key"])
+
+    def _list_files():
+        # type: () -> Iterator[Dict[str, Any]]
+        # filter listing by page rather than materializing it entirely, to begin transfers while it is retrieved
+        LOGGER.debug("Fetching S3 directory [%s] listing.", location)
+        for s3_dir_resp in s3_paging.paginate(Bucket=s3_bucket, Prefix=dir_key):
+            s3_page = [file for file in s3_dir_resp.get("Contents", []) if not file["Key"].endswith("/")]
+            s3_page = filter_directory_forbidden(s3_page, key=lambda _file: _file["Key"])
+            s3_page = filter_directory_patterns(s3_page, include, exclude, matcher, key=lambda _file: _file["Key"])
+            yield from s3_page
 
     if out_method == OutputMethod.META:
-        s3_files = list(s3_files)   # ensure generator is not pre-exhausted by following loop
-        for file_meta in s3_files:  # type: MetadataResult
+        for file_meta in _list_files():  # type: MetadataResult
             file_key = file_meta.pop("Key")
             file_meta["Content-Location"] = f"{base_url}{file_key}"
-        return s3_files
-
-    s3_files = [file["Key"] for file in s3_files]
+            yield file_meta
+        return
 
-    # create directories in advance to avoid potential errors in case many workers try to generate the same one
-    base_url = base_url.rstrip("/")
-    sub_dirs = {os.path.split(str(path))[0] for path in s3_files if "://" not in path or path.startswith(base_url)}
-    sub_dirs = [os.path.join(out_dir, path.replace(base_url, "").lstrip("/")) for path in sub_dirs]
-    for _dir in reversed(sorted(sub_dirs)):
-        os.makedirs(_dir, exist_ok=True)
-    base_url += "/"
-
-    LOGGER.debug("Starting fetch of individual S3 files from [%s]:\n%s", base_url, repr_json(s3_files))
     task_kill_event = threading.Event()  # abort remaining tasks if set
+    s3_config = get_s3_transfer_config(settings)
+    max_workers = get_s3_transfer_max_files(settings)
 
     def _abort_callback(_chunk):  # called progressively with downloaded chunks
         # type: (AnyStr) -> None
         if task_kill_event.is_set():
             raise CancelledError("Other failed download task triggered abort event.")
+        if callback:
+            callback(_chunk)
 
     def _download_file(_client, _bucket, _rel_file_path, _out_dir):
         # type: (S3Client, str, str, str) -> str
@@ -3257,7 +4204,7 @@ def fetch_files_s3(location,                            # type: str
             raise CancelledError("Other failed download task triggered abort event.")
         try:
             _out_file = os.path.join(_out_dir, _rel_file_path)
-            _client.download_file(_bucket, _rel_file_path, _out_file, Callback=_abort_callback)
+            _client.download_file(_bucket, _rel_file_path, _out_file, Callback=_abort_callback, Config=s3_config)
         except Exception as exc:
             _file_path = os.path.join(_client.meta.endpoint_url, _bucket, _rel_file_path)
             LOGGER.error("Error raised in download worker for [%s]: [%s]", _file_path, exc, exc_info=exc)
@@ -3265,28 +4212,94 @@ def fetch_files_s3(location,                            # type: str
             raise
         return _out_file
 
-    max_workers = min(len(s3_files), 8)
-    if max_workers <= 0:
-        raise ValueError(f"No files specified for download from reference [{base_url}].")
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = (
-            executor.submit(_download_file, s3_client, s3_bucket, file_key, out_dir)
-            for file_key in s3_files
-        )
-        for future in as_completed(futures):
-            if future.exception():
-                other_futures = set(futures) - {future}
-                for o_future in other_futures:
-                    o_future.cancel()
+    def _completed(_futures):
+        # type: (Iterable[Future]) -> Iterator[str]
+        for _future in _futures:
+            _error = _future.exception()
+            if _error:
                 task_kill_event.set()
-            yield future.result()
-        # wait for any cleanup, must use set() because of https://github.com/python/cpython/issues/86104
-        results, failures = wait_until(set(futures), return_when=ALL_COMPLETED)
-        if failures or any(not path for path in results):
-            raise WeaverException(
-                "Directory download failed due to at least one failing file download in listing: "
-                f"{[repr(exc.exception()) for exc in failures]}"
-            )
+                for _other in futures:
+                    _other.cancel()
+                raise WeaverException(
+                    f"Directory download failed due to at least one failing file download in listing: {_error!r}"
+                ) from _error
+            yield _future.result()
+
+    LOGGER.debug("Starting fetch of individual S3 files from [%s]", base_url)
+    sub_dirs = set()
+    futures = set()  # type: Set[Future]
+    count = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for s3_file in _list_files():
+            file_key = s3_file["Key"]
+            # create directories in advance to avoid potential errors in case many workers try to generate the same one
+            sub_dir = os.path.dirname(os.path.join(out_dir, file_key))
+            if sub_dir not in sub_dirs:
+                os.makedirs(sub_dir, exist_ok=True)
+                sub_dirs.add(sub_dir)
+            futures.add(executor.submit(_download_file, s3_client, s3_bucket, file_key, out_dir))
+            count += 1
+            # limit pending transfers to avoid holding the complete listing while it is being retrieved
+            if len(futures) >= max_workers * 2:
+                done, futures = wait_until(futures, return_when=FIRST_COMPLETED)
+                yield from _completed(done)
+        while futures:
+            done, futures = wait_until(futures, return_when=FIRST_COMPLETED)
+            yield from _completed(done)
+    if not count:
+        raise ValueError(f"No files specified for download from reference [{base_url}].")
+
+
+class FetchConcurrencyLimit(object):
+    """
+    Concurrency limit of file downloads from a single host, adjusted according to observed transfer durations.
+
+    The limit is increased additively while transfer durations remain close to the best one observed, and is reduced
+    by half as soon as they degrade, which indicates that the host (or the network path to it) is saturated by the
+    current amount of concurrent downloads. Durations are normalized by the transferred size such that the download
+    of a large file is not mistaken for a saturated host.
+
+    .. note::
+        Operations are not thread-safe. They are expected to be called only by the thread dispatching downloads.
+    """
+
+    def __init__(self, maximum, adaptive=True):
+        # type: (int, bool) -> None
+        self.maximum = max(maximum, 1)
+        self.adaptive = adaptive
+        self.limit = float(min(FETCH_FILES_ADAPTIVE_START, self.maximum) if adaptive else self.maximum)
+        self.active = 0
+        self.peak = 0
+        self.baseline = None  # type: Optional[float]
+        self._completed = 0
+
+    @property
+    def available(self):
+        # type: () -> bool
+        return self.active < int(self.limit)
+
+    def acquire(self):
+        # type: () -> None
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+
+    def release(self, duration, size):
+        # type: (float, int) -> None
+        """
+        Updates the limit according to the duration of the completed download and the size of the retrieved file.
+        """
+        self.active -= 1
+        if not self.adaptive:
+            return
+        cost = duration / max(1.0, size / DOWNLOAD_CHUNK_SIZE)
+        self.baseline = cost if self.baseline is None else min(cost, self.baseline * 1.02)  # allow slow recovery
+        self._completed += 1
+        if cost > max(self.baseline * FETCH_FILES_ADAPTIVE_TOLERANCE, self.baseline + FETCH_FILES_ADAPTIVE_MIN_DELAY):
+            if self._completed >= self.limit:  # reduce only once per round of concurrent downloads
+                self.limit = max(1.0, self.limit / 2)
+                self._completed = 0
+        else:
+            self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
 
 
 def fetch_files_url(file_references,                    # type: Iterable[str]
@@ -3297,6 +4310,7 @@ def fetch_files_url(file_references,                    # type: Iterable[str]
                     exclude=None,                       # type: Optional[List[str]]
                     matcher=PathMatchingMethod.GLOB,    # type: PathMatchingMethod
                     settings=None,                      # type: Optional[SettingsType]
+                    callback=None,                      # type: Optional[Callable[[AnyStr], None]]
                     **option_kwargs,                    # type: Unpack[Union[SchemeOptions, RequestOptions]]
                     ):                                  # type: (...) -> Iterator[AnyOutputResult]
     """
@@ -3321,6 +4335,8 @@ def fetch_files_url(file_references,                    # type: Iterable[str]
     :param exclude: Any matching patterns for files that should be excluded unless included.
     :param matcher: Pattern matching method to evaluate if a file path matches include and exclude definitions.
     :param settings: Additional request-related settings from the application configuration (notably request-options).
+    :param callback:
+        Function called progressively with downloaded chunks of every file. Raising an error in it aborts all downloads.
     :param option_kwargs:
         Additional keywords to forward to the relevant handling method by scheme.
         Keywords should be defined as ``{scheme}_{option}`` with one of the known :data:`SUPPORTED_FILE_SCHEMES`.
@@ -3336,7 +4352,7 @@ def fetch_files_url(file_references,                    # type: Iterable[str]
     base_url = f"{get_url_without_query(base_url).rstrip('/')}/"
     include = [incl.replace(base_url, "", 1) if incl.startswith(base_url) else incl for incl in include or []]
     exclude = [excl.replace(base_url, "", 1) if excl.startswith(base_url) else excl for excl in exclude or []]
-    file_references = (path for path in file_references if not path.endswith("/"))
+    file_references = [path for path in file_references if not path.endswith("/")]
     file_refs_relative = {path for path in file_references if path.startswith(base_url)}
     file_refs_absolute = set(file_references) - file_refs_relative
     file_refs_relative = {path.replace(base_url, "") for path in file_refs_relative}
@@ -3348,17 +4364,8 @@ def fetch_files_url(file_references,                    # type: Iterable[str]
     file_references = sorted(list(set(file_refs_relative) | set(file_refs_absolute)))
 
     if out_method == OutputMethod.META:
-        return [
-            get_href_headers(
-                url,
-                download_headers=True,
-                location_headers=True,
-                content_headers=True,
-                settings=settings,
-                **option_kwargs
-            )
-            for url in file_references
-        ]
+        yield from fetch_files_metadata(file_references, settings=settings, **option_kwargs)
+        return
 
     # create directories in advance to avoid potential errors in case many workers try to generate the same one
     base_url = base_url.rstrip("/")
@@ -3375,9 +4382,11 @@ def fetch_files_url(file_references,                    # type: Iterable[str]
         # type: (AnyStr) -> None
         if task_kill_event.is_set():
             raise CancelledError("Other failed download task triggered abort event.")
+        if callback:
+            callback(_chunk)
 
-    def _download_file(_file_path):
-        # type: (str) -> str
+    def _resolve_file(_file_path):
+        # type: (str) -> Tuple[str, str]
         _file_parts = _file_path.split("://", 1)
         if len(_file_parts) == 1:  # relative, no scheme
             if not base_url:
@@ -3389,28 +4398,176 @@ def fetch_files_url(file_references,                    # type: Iterable[str]
             _out_file = os.path.join(out_dir, _file_path.replace(base_url, ""))
         else:
             _out_file = os.path.join(out_dir, os.path.split(_file_path)[-1])
-        _out_dir = os.path.split(_out_file)[0]
+        return _file_path, os.path.split(_out_file)[0]
+
+    def _download_file(_file_path, _out_dir):
+        # type: (str, str) -> Tuple[str, float, int]
+        _timer = time.perf_counter()
         try:
-            return fetch_file(_file_path, _out_dir, out_method=out_method,
-                              settings=settings, callback=_abort_callback, **option_kwargs)
+            _path = fetch_file(_file_path, _out_dir, out_method=out_method,
+                               settings=settings, callback=_abort_callback, **option_kwargs)
         except Exception as exc:
             LOGGER.error("Error raised in download worker for [%s]: [%s]", _file_path, exc, exc_info=exc)
             task_kill_event.set()
             raise
+        _duration = time.perf_counter() - _timer
+        try:
+            _size = os.stat(_path).st_size
+        except OSError:  # not a local file (e.g.: link output method)
+            _size = 0
+        return _path, _duration, _size
 
-    max_workers = min(len(file_references), 8)
-    if max_workers <= 0:
+    if not file_references:
         msg_ref = f" from reference [{base_url}]" if base_url else ""
         raise ValueError(f"No files specified for download{msg_ref}.")
+
+    file_tasks = [_resolve_file(file_ref) for file_ref in file_references]
+    file_tasks = [(urlparse(file_url).netloc, (file_url, file_dir)) for file_url, file_dir in file_tasks]
+    for _, path in _fetch_files_dispatch(file_tasks, _download_file, task_kill_event, settings, "Fetched"):
+        yield path
+
+
+def _fetch_files_dispatch(tasks,            # type: List[Tuple[str, Tuple[Any, ...]]]
+                          worker,           # type: Callable[..., Tuple[Return, float, int]]
+                          task_kill_event,  # type: threading.Event
+                          settings,         # type: Optional[AnySettingsContainer]
+                          operation,        # type: str
+                          ):                # type: (...) -> Iterator[Tuple[int, Return]]
+    """
+    Runs the worker function concurrently for every task, respecting concurrency limits in total and per host.
+
+    Tasks are dispatched only from the calling thread, to avoid workers being blocked while waiting for their host
+    to be available. Once any task fails, the abort event is set, no other pending task is started, and the original
+    error is raised. Throughput statistics are logged once all tasks completed.
+
+    :param tasks: Host and arguments of the worker for each task.
+    :param worker: Function that returns the result of the task, its duration and the amount of transferred bytes.
+    :param task_kill_event: Event to set in order to abort ongoing tasks.
+    :param settings: Application settings defining concurrency limits.
+    :param operation: Description of the operation for reporting statistics.
+    :returns: Index of the task and its result as they are completed.
+    """
+    fetch_settings = get_settings(settings) if settings is not None else {}
+    max_workers = max(as_int(fetch_settings.get("weaver.fetch_files_max_workers"), FETCH_FILES_MAX_WORKERS), 1)
+    max_host_workers = as_int(fetch_settings.get("weaver.fetch_files_max_host_workers"), FETCH_FILES_MAX_HOST_WORKERS)
+    adaptive = asbool(fetch_settings.get("weaver.fetch_files_adaptive", True))
+    pending = {}  # type: Dict[str, List[Tuple[int, Tuple[Any, ...]]]]
+    for index, (host, args) in reversed(list(enumerate(tasks))):  # reversed to pop them in order
+        pending.setdefault(host, []).append((index, args))
+    limits = {host: FetchConcurrencyLimit(max_host_workers, adaptive) for host in pending}
+    max_workers = min(len(tasks), max_workers)
+    fetch_count = 0
+    fetch_size = 0
+    fetch_timer = time.perf_counter()
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = (
-            executor.submit(_download_file, file_key)
-            for file_key in file_references
-        )
-        for future in as_completed(futures):
-            if future.exception():
-                task_kill_event.set()
-            yield future.result()
+        futures = {}  # type: Dict[Future, Tuple[str, int]]
+        while pending or futures:
+            for host in list(pending):
+                host_tasks = pending[host]
+                host_limit = limits[host]
+                while host_tasks and host_limit.available and len(futures) < max_workers:
+                    host_limit.acquire()
+                    index, args = host_tasks.pop()
+                    futures[executor.submit(worker, *args)] = (host, index)
+                if not host_tasks:
+                    pending.pop(host)
+            done, _ = wait_until(futures, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda _future: futures[_future][1]):
+                host, index = futures.pop(future)
+                if future.exception():
+                    task_kill_event.set()
+                    pending.clear()
+                result, duration, size = future.result()
+                limits[host].release(duration, size)
+                fetch_count += 1
+                fetch_size += size
+                yield index, result
+
+    fetch_duration = max(time.perf_counter() - fetch_timer, 1e-6)
+    LOGGER.info(
+        "%s %s files (%s) from %s hosts in %.3fs (%.2f files/s, %s/s). Peak concurrent requests by host: %s",
+        operation,
+        fetch_count,
+        apply_number_with_unit(fetch_size, "B", binary=True),
+        len(limits),
+        fetch_duration,
+        fetch_count / fetch_duration,
+        apply_number_with_unit(fetch_size / fetch_duration, "B", binary=True),
+        {host: limit.peak for host, limit in limits.items()},
+    )
+
+
+FETCH_META_CACHE = OrderedDict()  # type: OrderedDict[Tuple[str, str], Tuple[float, MetadataResult]]
+FETCH_META_CACHE_LOCK = threading.Lock()
+
+
+def fetch_files_metadata(file_references,   # type: Iterable[str]
+                         settings=None,     # type: Optional[AnySettingsContainer]
+                         **option_kwargs,   # type: Unpack[Union[SchemeOptions, RequestOptions]]
+                         ):                 # type: (...) -> Iterator[MetadataResult]
+    """
+    Obtain the metadata headers of all listed file references, resolved concurrently.
+
+    Metadata is resolved with the same concurrency limits as file downloads by :func:`fetch_files_url`,
+    but is always returned in the same order as the references. Resolved metadata is memorized for a short
+    duration (``weaver.fetch_meta_cache_expire``), since the same listing is often described repeatedly
+    (e.g.: nested directory references and their parent).
+
+    .. seealso::
+        :func:`get_href_headers`
+
+    :param file_references: Full URL paths of the files to describe.
+    :param settings: Additional request-related settings from the application configuration (notably request-options).
+    :param option_kwargs: Additional keywords to forward to the relevant handling method by scheme.
+    :returns: Metadata of the files.
+    """
+    fetch_settings = get_settings(settings) if settings is not None else {}
+    expire = as_int(fetch_settings.get("weaver.fetch_meta_cache_expire"), FETCH_META_CACHE_EXPIRE)
+    options = repr(sorted(option_kwargs.items(), key=lambda _opt: _opt[0]))
+    task_kill_event = threading.Event()
+
+    def _get_metadata(_file_reference):
+        # type: (str) -> Tuple[MetadataResult, float, int]
+        if task_kill_event.is_set():
+            raise CancelledError("Other failed metadata task triggered abort event.")
+        _timer = time.perf_counter()
+        _key = (_file_reference, options)
+        if expire > 0:
+            with FETCH_META_CACHE_LOCK:
+                _expiry, _meta = FETCH_META_CACHE.get(_key, (0, None))
+            if _meta is not None and _expiry > time.monotonic():
+                return deepcopy(_meta), time.perf_counter() - _timer, 0
+        try:
+            _meta = get_href_headers(
+                _file_reference,
+                download_headers=True,
+                location_headers=True,
+                content_headers=True,
+                settings=settings,
+                **option_kwargs
+            )
+        except Exception as exc:
+            LOGGER.error("Error raised in metadata worker for [%s]: [%s]", _file_reference, exc, exc_info=exc)
+            task_kill_event.set()
+            raise
+        if expire > 0:
+            with FETCH_META_CACHE_LOCK:
+                FETCH_META_CACHE[_key] = (time.monotonic() + expire, deepcopy(_meta))
+                FETCH_META_CACHE.move_to_end(_key)
+                while len(FETCH_META_CACHE) > FETCH_META_CACHE_SIZE:
+                    FETCH_META_CACHE.popitem(last=False)
+        return _meta, time.perf_counter() - _timer, 0
+
+    meta_tasks = [(urlparse(file_ref).netloc, (file_ref, )) for file_ref in file_references]
+    if not meta_tasks:
+        return
+    results = {}  # type: Dict[int, MetadataResult]
+    position = 0
+    for index, meta in _fetch_files_dispatch(meta_tasks, _get_metadata, task_kill_event, settings, "Described"):
+        results[index] = meta
+        while position in results:  # preserve order of references
+            yield results.pop(position)
+            position += 1
 
 
 @overload
@@ -3422,6 +4579,7 @@ def fetch_files_html(html_data,                         # type: str
                      exclude=None,                      # type: Optional[List[str]]
                      matcher=PathMatchingMethod.GLOB,   # type: PathMatchingMethod
                      settings=None,                     # type: Optional[AnySettingsContainer]
+                     callback=None,                     # type: Optional[Callable[[AnyStr], None]]
                      **option_kwargs,                   # type: Unpack[Union[SchemeOptions, RequestOptions]]
                      ):                                 # type: (...) -> Iterator[MetadataResult]
     ...
@@ -3436,6 +4594,7 @@ def fetch_files_html(html_data,                         # type: str
                      exclude=None,                      # type: Optional[List[str]]
                      matcher=PathMatchingMethod.GLOB,   # type: PathMatchingMethod
                      settings=None,                     # type: Optional[AnySettingsContainer]
+                     callback=None,                     # type: Optional[Callable[[AnyStr], None]]
                      **option_kwargs,                   # type: Unpack[Union[SchemeOptions, RequestOptions]]
                      ):                                 # type: (...) -> Iterator[DownloadResult]
     ...
@@ -3449,6 +4608,7 @@ def fetch_files_html(html_data,                         # type: str
                      exclude=None,                      # type: Optional[List[str]]
                      matcher=PathMatchingMethod.GLOB,   # type: PathMatchingMethod
                      settings=None,                     # type: Optional[AnySettingsContainer]
+                     callback=None,                     # type: Optional[Callable[[AnyStr], None]]
                      **option_kwargs,                   # type: Unpack[Union[SchemeOptions, RequestOptions]]
                      ):                                 # type: (...) -> Iterator[AnyOutputResult]
     """
@@ -3478,6 +4638,8 @@ def fetch_files_html(html_data,                         # type: str
     :param exclude: Any matching patterns for files that should be excluded unless included.
     :param matcher: Pattern matching method to evaluate if a file path matches include and exclude definitions.
     :param settings: Additional request-related settings from the application configuration (notably request-options).
+    :param callback:
+        Function called progressively with downloaded chunks of every file. Raising an error in it aborts all downloads.
     :param option_kwargs:
         Additional keywords to forward to the relevant handling method by scheme.
         Keywords should be defined as ``{scheme}_{option}`` with one of the known :data:`SUPPORTED_FILE_SCHEMES`.
@@ -3512,7 +4674,7 @@ def fetch_files_html(html_data,                         # type: str
     return fetch_files_url(
         files, out_dir, out_method, base_url,
         include=include, exclude=exclude, matcher=matcher,
-        settings=settings, **option_kwargs
+        settings=settings, callback=callback, **option_kwargs
     )
 
 
@@ -3586,6 +4748,7 @@ def adjust_directory_local(location,                            # type: Path
       * When the source is a direct directory reference (or a link with differing listing after filter), the
         destination will be a recursive copy of the source directory, but any encountered links will remain links
         instead of resolving them and creating a copy (as accomplished by :attr:`OutputMethod.COPY`).
+        Files are cloned by reflink when supported by the filesystem, as described by :func:`adjust_file_local`.
 
     .. seealso::
         :func:`filter_directory_patterns`
@@ -3657,7 +4820,13 @@ def adjust_directory_local(location,                            # type: Path
     def copy_func(src, dst, *args, **kwargs):
         # type: (Path, Path, *Any, **Any) -> None
         if dst not in desired:
-            shutil.copy2(src, dst, *args, **kwargs)
+            if out_method == OutputMethod.AUTO:
+                stage_method = clone_file(src, dst)
+                shutil.copystat(src, dst)
+            else:
+                shutil.copy2(src, dst, *args, **kwargs)
+                stage_method = "copy"
+            observe_staged_bytes(stage_method, os.stat(dst).st_size)
 
     if out_method == OutputMethod.MOVE:
         # Calling 'shutil.move' raises 'NotADirectoryError' if the source directory is a link
@@ -3705,6 +4874,7 @@ def fetch_directory(location,                           # type: str
                     exclude=None,                       # type: Optional[List[str]]
                     matcher=PathMatchingMethod.GLOB,    # type: PathMatchingMethod
                     settings=None,                      # type: Optional[AnySettingsContainer]
+                    callback=None,                      # type: Optional[Callable[[AnyStr], None]]
                     **option_kwargs,                    # type: Unpack[Union[SchemeOptions, RequestOptions]]
                     ):                                  # type: (...) -> List[MetadataResult]
     ...
@@ -3719,6 +4889,7 @@ def fetch_directory(location,                           # type: str
                     exclude=None,                       # type: Optional[List[str]]
                     matcher=PathMatchingMethod.GLOB,    # type: PathMatchingMethod
                     settings=None,                      # type: Optional[AnySettingsContainer]
+                    callback=None,                      # type: Optional[Callable[[AnyStr], None]]
                     **option_kwargs,                    # type: Unpack[Union[SchemeOptions, RequestOptions]]
                     ):                                  # type: (...) -> List[DownloadResult]
     ...
@@ -3732,6 +4903,7 @@ def fetch_directory(location,                           # type: str
                     exclude=None,                       # type: Optional[List[str]]
                     matcher=PathMatchingMethod.GLOB,    # type: PathMatchingMethod
                     settings=None,                      # type: Optional[AnySettingsContainer]
+                    callback=None,                      # type: Optional[Callable[[AnyStr], None]]
                     **option_kwargs,                    # type: Unpack[Union[SchemeOptions, RequestOptions]]
                     ):                                  # type: (...) -> List[AnyOutputResult]
     """
@@ -3758,6 +4930,8 @@ def fetch_directory(location,                           # type: str
     :param exclude: Any matching patterns for files that should be excluded unless included.
     :param matcher: Pattern matching method to evaluate if a file path matches include and exclude definitions.
     :param settings: Additional request-related settings from the application configuration (notably request-options).
+    :param callback:
+        Function called progressively with downloaded chunks of every file. Raising an error in it aborts all downloads.
     :param option_kwargs:
         Additional keywords to forward to the relevant handling method by scheme.
         Keywords should be defined as ``{scheme}_{option}`` with one of the known :data:`SUPPORTED_FILE_SCHEMES`.
@@ -3772,14 +4946,14 @@ def fetch_directory(location,                           # type: str
         LOGGER.debug("Fetching listed files under directory resolved as S3 bucket reference.")
         listing = fetch_files_s3(location, out_dir, out_method,
                                  include=include, exclude=exclude, matcher=matcher,
-                                 settings=settings, **option_kwargs)
+                                 settings=settings, callback=callback, **option_kwargs)
     elif location.startswith("https://s3."):
         LOGGER.debug("Fetching listed files under directory resolved as HTTP-like S3 bucket reference.")
         s3_ref, s3_region = resolve_s3_from_http(location)
         option_kwargs["s3_region_name"] = s3_region
         listing = fetch_files_s3(s3_ref, out_dir, out_method,
                                  include=include, exclude=exclude,
-                                 settings=settings, **option_kwargs)
+                                 settings=settings, callback=callback, **option_kwargs)
     elif location.startswith("http://") or location.startswith("https://"):
         # Next two lines are added to match behavior of `download_files_s3` and replicate input directory name
         # in output location
@@ -3794,13 +4968,13 @@ def fetch_directory(location,                           # type: str
         if any(_type in ctype for _type in [ContentType.TEXT_HTML] + list(ContentType.ANY_XML)):
             listing = fetch_files_html(resp.text, out_dir, out_method, location,
                                        include=include, exclude=exclude, matcher=matcher,
-                                       settings=settings, **option_kwargs)
+                                       settings=settings, callback=callback, **option_kwargs)
         elif ContentType.APP_JSON in ctype:
             body = resp.json()  # type: JSON
             if isinstance(body, list) and all(isinstance(file, str) for file in body):
                 listing = fetch_files_url(body, out_dir, out_method, location,
                                           include=include, exclude=exclude, matcher=matcher,
-                                          settings=settings, **option_kwargs)
+                                          settings=settings, callback=callback, **option_kwargs)
             else:
                 LOGGER.error("Invalid JSON from [%s] is not a list of files:\n%s", location, repr_json(body))
                 raise ValueError(f"Cannot parse directory location [{location}] "
@@ -1,6 +1,6 @@
 import logging
 import os
-from configparser import ConfigParser
+import threading
 from typing import TYPE_CHECKING
 from urllib.parse import unquote, urlparse
 
@@ -21,6 +21,7 @@ from weaver.database import get_db
 from weaver.datatype import Process
 from weaver.exceptions import handle_known_exceptions
 from weaver.formats import ContentType, get_format, guess_target_format
+from weaver.metrics.utils import cache_region
 from weaver.owsexceptions import OWSException, OWSInvalidParameterValue, OWSNoApplicableCode
 from weaver.processes.convert import get_field, wps2json_job_payload
 from weaver.processes.types import ProcessType
@@ -51,6 +52,7 @@ from weaver.wps_restapi import swagger_definitions as sd
 from weaver.wps_restapi.jobs.utils import get_job_submission_response
 
 LOGGER = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     from typing import Any, Deque, Dict, List, Optional, Union
     from uuid import UUID
@@ -68,6 +70,8 @@ if TYPE_CHECKING:
         WPS_OutputRequested
     )
 
+_PYWPS_WORKER_PROCESS = threading.local()
+
 
 class WorkerRequest(WPSRequest):
     """
@@ -93,7 +97,8 @@ class WorkerRequest(WPSRequest):
         if http_headers:
             self.auth_headers.update(self.parse_auth_headers(http_headers))
 
-    def parse_auth_headers(self, headers):
+    @classmethod
+    def parse_auth_headers(cls, headers):
         # type: (Optional[AnyHeadersCookieContainer]) -> Headers
         if not headers:
             return Headers()
@@ -101,7 +106,7 @@ class WorkerRequest(WPSRequest):
             headers = list(headers.items())
         auth_headers = Headers()
         for name, value in headers:
-            if name in self._auth_headers:
+            if name in cls._auth_headers:
                 auth_headers.add(name, value)
         return auth_headers
 
@@ -453,7 +458,7 @@ def get_pywps_service(environ=None, is_worker=False, process_id=None):
         registry = get_registry()
         settings = get_settings(registry)
         pywps_cfg = environ.get("PYWPS_CFG") or settings.get("PYWPS_CFG") or os.getenv("PYWPS_CFG")
-        if not isinstance(pywps_cfg, ConfigParser) or not settings.get("weaver.wps_configured"):
+        if not settings.get("weaver.wps_configured"):  # avoid reloading on each request once configured
             load_pywps_config(settings, config=pywps_cfg)
 
         # resolve pre-filtered list of process(es), and whether they require any explicit revision tag
@@ -468,6 +473,9 @@ def get_pywps_service(environ=None, is_worker=False, process_id=None):
 
         # call pywps application with processes filtered according to the adapter's definition
         process_store = get_db(registry).get_store(StoreProcesses)  # type: StoreProcesses
+        if process_id and is_worker:
+            process = process_store.fetch_by_id(visibility=Visibility.PUBLIC, process_id=process_id, revision=True)
+            return get_pywps_worker_service(process)
         processes_wps = [
             process.wps() for process in (
                 [process_store.fetch_by_id(visibility=Visibility.PUBLIC, process_id=process_id, revision=True)]
@@ -482,3 +490,34 @@ def get_pywps_service(environ=None, is_worker=False, process_id=None):
         LOGGER.exception("Error occurred during PyWPS Service and/or Processes setup.")
         raise OWSNoApplicableCode(f"Failed setup of PyWPS Service and/or Processes. Error [{ex!r}]")
     return service
+
+
+def get_pywps_worker_service(process):
+    # type: (Process) -> WorkerService
+    """
+    Obtains the PyWPS Service employed by the :term:`Celery` worker to execute the specified :term:`Process`.
+
+    The service, including its loaded :term:`Process` instance (e.g.: :class:`weaver.processes.wps_package.WpsPackage`),
+    is reused across executions by the same worker for as long as the :term:`Process` definition remains identical.
+    Any update or redeployment of the :term:`Process` produces a different revision, which invalidates the cached
+    service transparently. Cached services are safe to reuse since :mod:`pywps` executes a copy of the loaded
+    :term:`Process` for each execution.
+
+    .. seealso::
+        Cache region ``process`` in :func:`weaver.utils.setup_cache`.
+    """
+    # pass the process out of band such that the cache key only depends on its identifier and revision
+    _PYWPS_WORKER_PROCESS.process = process
+    try:
+        return _get_pywps_worker_service_cached(process.id, process.revision_hash)
+    finally:
+        _PYWPS_WORKER_PROCESS.process = None
+
+
+@cache_region("process")
+def _get_pywps_worker_service_cached(process_id, process_revision):
+    # type: (str, str) -> WorkerService
+    process = _PYWPS_WORKER_PROCESS.process  # type: Process
+    LOGGER.debug("Loading PyWPS worker service for process [%s] revision [%s].", process_id, process_revision)
+    settings = get_settings()
+    return WorkerService([process.wps(settings)], is_worker=True, settings=settings)
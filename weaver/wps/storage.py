@@ -1,14 +1,25 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import logging
+import os
+import shutil
 from typing import TYPE_CHECKING
 
+import pywps.configuration as pywps_config
 from pywps.inout.storage import StorageAbstract
+from pywps.inout.storage.file import FileStorage
+from pywps.inout.storage.s3 import S3Storage, _build_s3_file_path
 
+from weaver.utils import copy_file_digest, get_s3_client, get_s3_transfer_config
 from weaver.wps.utils import get_wps_local_status_location
 
 if TYPE_CHECKING:
-    from weaver.typedefs import SettingsType
+    from typing import Any, AnyStr, Dict, IO, Optional, Union
+
+    from weaver.typedefs import AnySettingsContainer, SettingsType
+
+LOGGER = logging.getLogger(__name__)
 
 
 class ReferenceStatusLocationStorage(StorageAbstract):
@@ -40,3 +51,91 @@ class ReferenceStatusLocationStorage(StorageAbstract):
 
     def write(self, *_, **__):
         pass
+
+
+class DigestFileStorage(FileStorage):
+    """
+    Storage of files on the local filesystem that computes their digest while they are copied.
+
+    The digest memorized for each stored file is reported as ``digestMultibase`` in the :term:`Job` results
+    saved on completion, without reading the file contents again.
+
+    .. seealso::
+        :func:`weaver.utils.copy_file_digest`
+    """
+
+    @classmethod
+    def build(cls):
+        # type: () -> DigestFileStorage
+        """
+        Generates the storage from the :mod:`pywps` configuration, similarly to :class:`FileStorageBuilder`.
+        """
+        output_path = pywps_config.get_config_value("server", "outputpath")
+        output_url = pywps_config.get_config_value("server", "outputurl")
+        copy_function = pywps_config.get_config_value("server", "storage_copy_function")
+        return cls(output_path, output_url, copy_function=copy_function)
+
+    @staticmethod
+    def copy(src, dst, copy_function=None):
+        # type: (str, str, Optional[str]) -> None
+        if copy_function == "move":
+            copy_file_digest(src, dst, copy_function=shutil.move)
+        elif copy_function == "link":
+            try:
+                copy_file_digest(src, dst, copy_function=os.link)
+            except OSError:
+                LOGGER.warning("Could not create hardlink. Fallback to copy.")
+                copy_file_digest(src, dst)
+        else:
+            copy_file_digest(src, dst)
+
+
+class S3TransferStorage(S3Storage):
+    """
+    Storage of files on :term:`AWS` :term:`S3` using managed transfers with shared clients.
+
+    Contrary to the original :mod:`pywps` implementation, a single :term:`S3` client is reused for all uploads
+    rather than creating a new one for each operation, and files are streamed from disk with multipart uploads
+    performed concurrently by chunks according to the ``weaver.s3_transfer_[...]`` settings. Because uploads are
+    completed synchronously, there is also no need to wait for the object to become available afterward.
+    """
+
+    def __init__(self, bucket, prefix, public_access, encrypt, region, settings=None):
+        # type: (str, str, bool, bool, Optional[str], Optional[AnySettingsContainer]) -> None
+        super(S3TransferStorage, self).__init__(bucket, prefix, public_access, encrypt, region)
+        self.settings = settings
+
+    @classmethod
+    def build(cls, settings=None):
+        # type: (Optional[AnySettingsContainer]) -> S3TransferStorage
+        """
+        Generates the storage from the :mod:`pywps` configuration, similarly to :class:`S3StorageBuilder`.
+        """
+        bucket = pywps_config.get_config_value("s3", "bucket")
+        prefix = pywps_config.get_config_value("s3", "prefix")
+        public_access = pywps_config.get_config_value("s3", "public")
+        encrypt = pywps_config.get_config_value("s3", "encrypt")
+        region = pywps_config.get_config_value("s3", "region")
+        return cls(bucket, prefix, public_access, encrypt, region, settings=settings)
+
+    @property
+    def client(self):
+        return get_s3_client(self.region or None, settings=self.settings)
+
+    def uploadData(self, data, filename, extraArgs):  # noqa: N802,N803  # pywps naming
+        # type: (Union[AnyStr, IO[bytes]], str, Dict[str, Any]) -> str
+        self.client.put_object(Bucket=self.bucket, Key=filename, Body=data, **extraArgs)
+        LOGGER.debug("S3 Put: [%s] into bucket [%s]", filename, self.bucket)
+        return self.url(filename)
+
+    def uploadFileToS3(self, filename, extraArgs):  # noqa: N802,N803  # pywps naming
+        # type: (str, Dict[str, Any]) -> str
+        s3_path = _build_s3_file_path(self.prefix, os.path.basename(filename))
+        config = get_s3_transfer_config(self.settings)
+        self.client.upload_file(filename, self.bucket, s3_path, ExtraArgs=extraArgs, Config=config)
+        LOGGER.debug("S3 Upload: [%s] into bucket [%s] as [%s]", filename, self.bucket, s3_path)
+        return self.url(s3_path)
+
+    def url(self, destination):
+        # type: (str) -> str
+        return f"{self.client.meta.endpoint_url}/{self.bucket}/{destination}"
@@ -8,7 +8,6 @@ from configparser import ConfigParser
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-from beaker.cache import cache_region
 from owslib.util import Authentication
 from owslib.wps import WebProcessingService, WPSExecution
 from pyramid.httpexceptions import HTTPNotFound, HTTPOk, HTTPUnprocessableEntity
@@ -19,6 +18,7 @@ from webob.acceptparse import create_accept_language_header
 from weaver import owsexceptions, xml_util
 from weaver.config import get_weaver_configuration
 from weaver.formats import AcceptLanguage
+from weaver.metrics.utils import cache_region
 from weaver.utils import (
     bytes2str,
     get_header,
@@ -3,7 +3,6 @@ import logging
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-from beaker.cache import cache_region
 from box import Box
 from cornice.service import get_services
 from pyramid.authentication import Authenticated, IAuthenticationPolicy
@@ -25,7 +24,9 @@ from simplejson import JSONDecodeError
 
 from weaver import __meta__
 from weaver.formats import ContentType, OutputFormat, guess_target_format
+from weaver.metrics.utils import cache_region
 from weaver.owsexceptions import OWSException
+from weaver.renderers import JSON_RENDERER_FAST, get_json_renderer, json_dumps_fast
 from weaver.utils import get_header, get_registry, get_settings, get_weaver_url
 from weaver.wps.utils import get_wps_url
 from weaver.wps_restapi import swagger_definitions as sd
@@ -1015,6 +1016,8 @@ def openapi_json(request):  # noqa: F811
     LOGGER.debug("Request app URL:   [%s]", request.url)
     LOGGER.debug("Weaver config URL: [%s]", weaver_server_url)
     spec = openapi_json_cached(base_url=weaver_server_url, use_docstring_summary=True, container=request)
+    if get_json_renderer(request) == JSON_RENDERER_FAST:  # response body bypasses the registered renderer
+        return HTTPOk(body=json_dumps_fast(spec), content_type=ContentType.APP_OAS_JSON)
     return HTTPOk(json=spec, content_type=ContentType.APP_OAS_JSON)
 
 
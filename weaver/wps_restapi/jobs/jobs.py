@@ -794,7 +794,7 @@ def get_job_output(request):
             "value": result_media_type
         })
 
-    resp = resolve_result_single(job, result, output_id, accept, headers=headers, settings=settings)
+    resp = resolve_result_single(job, result, output_id, accept, headers=headers, settings=settings, request=request)
     resp.headers.add("Link", make_link_header(sd.OGC_API_PROC_PROFILE_OGC_VALUES_URI, rel="profile"))
     return resp
 
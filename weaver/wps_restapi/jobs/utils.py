@@ -1,10 +1,11 @@
 import io
+import logging
 import math
 import os
 import shutil
 from copy import deepcopy
 from typing import TYPE_CHECKING, cast, overload
-from urllib.parse import unquote_plus
+from urllib.parse import quote, unquote_plus
 
 import colander
 from celery.utils.log import get_task_logger
@@ -18,14 +19,18 @@ from pyramid.httpexceptions import (
     HTTPNotAcceptable,
     HTTPNotFound,
     HTTPOk,
+    HTTPServiceUnavailable,
     HTTPUnprocessableEntity
 )
-from pyramid.response import FileResponse
+from pyramid.response import FileResponse, Response
+from pyramid.settings import asbool
 from pyramid_celery import celery_app
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 from webob.headers import ResponseHeaders
+from webob.static import FileIter
 
 from weaver import ogc_definitions as ogc_def
+from weaver.base import Constants
 from weaver.database import get_db
 from weaver.datatype import Job, Process
 from weaver.exceptions import (
@@ -60,15 +65,15 @@ from weaver.processes.utils import deploy_process_from_payload, parse_multipart_
 from weaver.provenance import ProvenanceFormat
 from weaver.status import JOB_STATUS_CATEGORIES, Status, StatusCategory, map_status
 from weaver.store.base import StoreJobs, StoreProcesses, StoreServices
-from weaver.transform.const import EXCLUDED_TYPES
+from weaver.transform.const import CONVERSION_DICT, EXCLUDED_TYPES
 from weaver.transform.handlers import Transform
 from weaver.utils import (
-    compute_file_digest_multibase,
     create_content_id,
     data2str,
     fetch_file,
     get_any_id,
     get_any_value,
+    get_file_digest_multibase,
     get_header,
     get_href_headers,
     get_path_kvp,
@@ -84,6 +89,7 @@ from weaver.visibility import Visibility
 from weaver.wps.utils import (
     get_wps_local_status_location,
     get_wps_output_dir,
+    get_wps_output_path,
     get_wps_output_url,
     map_wps_output_location
 )
@@ -93,7 +99,7 @@ from weaver.wps_restapi.providers.utils import forbid_local_only
 from weaver.wps_restapi.utils import get_wps_restapi_base_url
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, List, NoReturn, Optional, Sequence, Tuple, Type, Union
+    from typing import Any, Dict, Iterator, List, NoReturn, Optional, Sequence, Tuple, Type, Union
 
     from weaver.execute import AnyExecuteResponse, AnyExecuteReturnPreference, AnyExecuteTransmissionMode
     from weaver.formats import AnyContentEncoding, AnyContentType
@@ -134,6 +140,29 @@ if TYPE_CHECKING:
 
 LOGGER = get_task_logger(__name__)
 
+MULTIPART_RESULTS_CHUNK_SIZE = 64 * 1024
+JOB_RESULT_PENDING_RETRY_AFTER = 5
+
+
+class ResultFileOffload(Constants):
+    """
+    Methods to transfer the contents of a by-value file result without passing them through the application.
+    """
+    WSGI = "wsgi"
+    """
+    Contents streamed with the ``wsgi.file_wrapper`` of the server when available (e.g.: ``sendfile``).
+    """
+
+    X_ACCEL_REDIRECT = "x-accel-redirect"
+    """
+    Contents served by the front proxy (e.g.: ``nginx``) from the internal location indicated by the header.
+    """
+
+    X_SENDFILE = "x-sendfile"
+    """
+    Contents served by the front server (e.g.: ``apache`` with ``mod_xsendfile``) from the file path in the header.
+    """
+
 
 def deploy_multipart_job_workflow(request, ctype_full):
     # type: (PyramidRequest, str) -> Tuple[str, JSON]
@@ -658,10 +687,13 @@ def get_results(  # pylint: disable=R1260
                             output["format"][field] = val_item[field]
 
                 # Add digestMultibase for resource integrity verification (W3C VC Data Integrity)
-                # Only compute for local files that can be accessed
+                # Saved with the results on job completion, otherwise only computed for local files that can be accessed
+                digest_mb = val_item.get("digestMultibase")
                 file_path = cast(str, val_data)
                 try:
-                    if file_path.startswith(wps_url):
+                    if digest_mb:
+                        file_path = None
+                    elif file_path.startswith(wps_url):
                         file_path = map_wps_output_location(file_path, settings, exists=True, url=False)
                     elif file_path.startswith("file://"):
                         file_path = file_path[7:]
@@ -670,9 +702,10 @@ def get_results(  # pylint: disable=R1260
                         wps_dir = get_wps_output_dir(settings)
                         file_path = os.path.join(wps_dir, str(job.id), file_path)
 
-                    # Only compute digest for local files
-                    if os.path.isfile(file_path):
-                        digest_mb = compute_file_digest_multibase(file_path)
+                    # Only compute digest for local files, reusing the one memorized when the file was staged
+                    if file_path and os.path.isfile(file_path):
+                        digest_mb = get_file_digest_multibase(file_path)
+                    if digest_mb:
                         output["digestMultibase"] = digest_mb
 
                 except (OSError, ValueError, ImportError) as exc:
@@ -778,7 +811,8 @@ def resolve_result_single(
     headers,            # type: AnyHeadersContainer
     *,                  # force named keyword arguments after
     settings,           # type: AnySettingsContainer
-):                      # type: (...) -> Union[HTTPOk, HTTPNoContent]
+    request=None,       # type: Optional[AnyRequestType]
+):                      # type: (...) -> Union[HTTPOk, HTTPNoContent, Response]
     """
     Resolves and returns a single job result with appropriate format negotiation.
 
@@ -793,6 +827,7 @@ def resolve_result_single(
     :param accept_header: Accept header value from request, if any.
     :param headers: Additional headers to include in the response.
     :param settings: Application settings to resolve locations.
+    :param request: Request that will receive the response, to transfer file results efficiently.
     :return: Response with the single result.
     """
     is_reference = bool(get_any_value(result, key=True, file=True))
@@ -806,7 +841,9 @@ def resolve_result_single(
     if not isinstance(output_format, dict):
         output_format = {"mime_type": output_format}
 
-    return get_job_results_single(job, result, output_id, output_format, headers=headers, settings=settings)
+    return get_job_results_single(
+        job, result, output_id, output_format, headers=headers, settings=settings, request=request
+    )
 
 
 def get_job_results_response(
@@ -1004,7 +1041,7 @@ def get_job_results_response(
     # https://docs.ogc.org/is/18-062r2/18-062r2.html#req_core_process-execute-sync-raw-value-one
     res_id = out_vals[0][0]
     req_fmt = (request_headers or {}).get("accept")
-    return resolve_result_single(job, out_info, res_id, req_fmt, headers=headers, settings=settings)
+    return resolve_result_single(job, out_info, res_id, req_fmt, headers=headers, settings=settings, request=request)
 
 
 def get_job_result_by_index(
@@ -1093,18 +1130,21 @@ def get_job_result_by_index(
 
     accept = guess_target_format(request, default=None)
     headers = ResponseHeaders([("OGC-Output-Values-Count", str(len(output_value)))])
-    return resolve_result_single(job, result, output_id, accept, headers=headers, settings=request)
+    return resolve_result_single(job, result, output_id, accept, headers=headers, settings=request, request=request)
 
 
 def generate_or_resolve_result(
-    job,            # type: Job
-    result,         # type: ExecutionResultObject
-    result_id,      # type: str
-    output_id,      # type: str
-    output_mode,    # type: AnyExecuteTransmissionMode
-    output_format,  # type: Optional[JobValueFormat]
-    settings,       # type: SettingsType
-):                  # type: (...) -> Tuple[HeadersType, Optional[AnyDataStream]]
+    job,                  # type: Job
+    result,               # type: ExecutionResultObject
+    result_id,            # type: str
+    output_id,            # type: str
+    output_mode,          # type: AnyExecuteTransmissionMode
+    output_format,        # type: Optional[JobValueFormat]
+    settings,             # type: SettingsType
+    *,                    # force named keyword arguments after
+    etag_header=False,    # type: bool
+    metadata_only=False,  # type: bool
+):                        # type: (...) -> Tuple[HeadersType, Optional[AnyDataStream]]
     """
     Obtains the local file path and the corresponding :term:`URL` reference for a given result, generating it as needed.
 
@@ -1115,6 +1155,10 @@ def generate_or_resolve_result(
     :param output_mode: Desired output transmission mode.
     :param output_format: Desired output transmission ``format``, with minimally the :term:`Media-Type`.
     :param settings: Application settings to resolve locations.
+    :param etag_header: Whether to include the ``ETag`` header of the file result to support conditional requests.
+    :param metadata_only:
+        Only resolve the headers of a by-value file result (e.g.: for a ``HEAD`` request) without opening it,
+        nor retrieving it locally if it is stored remotely. Returned data is ``None`` in this case.
     :return:
         Resolved headers and data (as applicable) for the result.
         If only returned by reference, ``None`` data is returned. An empty-data contents would be an empty string.
@@ -1159,7 +1203,9 @@ def generate_or_resolve_result(
 
     # Apply transform if type is different from desired output and desired output is different from plain
     if out and out not in EXCLUDED_TYPES and out != typ:
-        file_transform = Transform(file_path=loc, current_media_type=typ, wanted_media_type=out)
+        file_transform = Transform(file_path=loc, current_media_type=typ, wanted_media_type=out, settings=settings)
+        if file_transform.pending():
+            raise_job_result_pending(job, result_id, out, settings)
         typ = out
         file_transform.get()
         loc = file_transform.output_path
@@ -1185,7 +1231,7 @@ def generate_or_resolve_result(
             with open(loc, mode="w", encoding="utf-8") as out_file:
                 out_file.write(data2str(val))
 
-    if is_ref and output_mode == ExecuteTransmissionMode.VALUE and typ != ContentType.APP_DIR:
+    if is_ref and output_mode == ExecuteTransmissionMode.VALUE and typ != ContentType.APP_DIR and not metadata_only:
         res_path = loc
         if not is_local:
             # reference is a remote file, but by-value requested explicitly
@@ -1206,6 +1252,7 @@ def generate_or_resolve_result(
         content_id=cid,
         content_name=result_id,
         content_location=url,   # rewrite back the original URL
+        etag_header=etag_header,
         settings=settings,
     )
     if output_mode == ExecuteTransmissionMode.VALUE and not res_headers.get("Content-Length") and c_length is not None:
@@ -1281,6 +1328,67 @@ def get_job_results_links(
     return headers
 
 
+def make_result_file_response(
+    file_path,      # type: str
+    content_type,   # type: str
+    headers,        # type: AnyHeadersContainer
+    *,              # force named keyword arguments after
+    settings,       # type: AnySettingsContainer
+    request=None,   # type: Optional[AnyRequestType]
+):                  # type: (...) -> AnyResponseType
+    """
+    Generates the response of a by-value file result without loading its contents in memory.
+
+    Using the ``weaver.wps_output_file_offload`` setting, files located under the :term:`WPS` output directory
+    can be delegated to the front server with the ``X-Accel-Redirect`` or ``X-Sendfile`` header, in which case the
+    response has no body. Otherwise, the contents are streamed with the ``wsgi.file_wrapper`` of the server, which
+    usually allows the kernel to transfer the file directly (``sendfile``), or by chunks if it is not provided.
+
+    Streamed responses are conditional. Therefore, ``Range`` and ``If-Range`` requests obtain the partial contents
+    (``206``), while ``If-None-Match`` and ``If-Modified-Since`` requests matching the ``ETag`` or ``Last-Modified``
+    validators of the file obtain a ``304`` response without contents. Offloaded files have these requests handled
+    by the front server.
+
+    :param file_path: Local path of the file result.
+    :param content_type: Media-type of the file result.
+    :param headers: Additional headers to include in the response.
+    :param settings: Application settings to resolve locations.
+    :param request: Request that will receive the response, to employ the file wrapper of the server.
+    :return: Response with the file result.
+    """
+    settings = get_settings(settings)
+    offload = ResultFileOffload.get(settings.get("weaver.wps_output_file_offload"), default=ResultFileOffload.WSGI)
+    skip_headers = ["content-type", "content-length"]
+    if offload != ResultFileOffload.WSGI:
+        out_dir = os.path.abspath(get_wps_output_dir(settings))
+        out_path = os.path.abspath(file_path)
+        if not out_path.startswith(f"{out_dir}/"):
+            LOGGER.debug("Cannot offload file result [%s] not under WPS output directory. Using WSGI.", file_path)
+            offload = ResultFileOffload.WSGI
+    if offload == ResultFileOffload.WSGI:
+        # byte ranges are read from the requested position instead of iterating through the file wrapper of the server
+        ranged = request is not None and request.range is not None
+        resp = FileResponse(file_path, request=None if ranged else request, content_type=content_type)
+        resp.accept_ranges = "bytes"
+        if ranged:
+            file_size = resp.content_length
+            resp.app_iter = FileIter(resp.app_iter.file)
+            resp.content_length = file_size
+        skip_headers.append("last-modified")
+    else:
+        resp = Response(status=200, content_type=content_type)
+        if offload == ResultFileOffload.X_SENDFILE:
+            resp.headers["X-Sendfile"] = out_path
+        else:
+            out_loc = settings.get("weaver.wps_output_file_offload_path") or get_wps_output_path(settings)
+            out_loc = f"{out_loc.rstrip('/')}/{os.path.relpath(out_path, out_dir)}"
+            resp.headers["X-Accel-Redirect"] = quote(out_loc)
+    for name, value in (headers or {}).items():
+        if name.lower() not in skip_headers:
+            resp.headers.add(name, value)
+    return resp
+
+
 def get_job_results_single(
     job,            # type: Job
     result,         # type: ExecutionResultObject
@@ -1289,7 +1397,8 @@ def get_job_results_single(
     headers,        # type: AnyHeadersContainer
     *,              # force named keyword arguments after
     settings,       # type: AnySettingsContainer
-):                  # type: (...) -> Union[HTTPOk, HTTPNoContent]
+    request=None,   # type: Optional[AnyRequestType]
+):                  # type: (...) -> Union[HTTPOk, HTTPNoContent, Response]
     """
     Generates a single result response according to specified or resolved output transmission and format.
 
@@ -1299,6 +1408,7 @@ def get_job_results_single(
     :param output_format: Desired output format for convertion, as applicable.
     :param headers: Additional headers to include in the response.
     :param settings: Application settings to resolve locations.
+    :param request: Request that will receive the response, to transfer file results efficiently.
     :return:
     """
     # FIXME: implement (https://github.com/crim-ca/weaver/pull/548)
@@ -1316,6 +1426,7 @@ def get_job_results_single(
 
     # convert value as needed since reference transmission was not requested/resolved
     out_headers = {}
+    is_head = getattr(request, "method", None) == "HEAD"
     if is_ref:
         output_mode = ExecuteTransmissionMode.VALUE
         out_headers, out_data = generate_or_resolve_result(
@@ -1326,6 +1437,8 @@ def get_job_results_single(
             output_mode,
             output_format,
             settings=settings,
+            etag_header=True,
+            metadata_only=is_head,
         )
         headers.update(out_headers)
 
@@ -1341,10 +1454,26 @@ def get_job_results_single(
     if not ctype:
         ctype = ContentType.TEXT_PLAIN
 
+    if isinstance(out_data, io.FileIO):
+        out_data.close()  # reopened by the response only if contents are not offloaded
+        return make_result_file_response(out_data.name, ctype, headers, settings=settings, request=request)
+    if is_ref and is_head:
+        # only the resolved headers are needed, file was not opened nor retrieved if stored remotely
+        resp = Response(status=200, content_type=ctype, conditional_response=True)
+        resp.headers.extend([
+            (name, value) for name, value in headers.items()
+            if name.lower() not in ["content-type", "content-length"]
+        ])
+        resp.content_length = headers.get("Content-Length")
+        return resp
+
     c_enc = cast("AnyContentEncoding", headers.get("Content-Encoding") or "UTF-8")  # type: AnyContentEncoding
     out_data = data2str(out_data)
     out_data = ContentEncoding.encode(out_data, c_enc)
-    return HTTPOk(body=out_data, content_type=ctype, charset=c_enc, headers=headers)
+    resp = HTTPOk(body=out_data, content_type=ctype, charset=c_enc, headers=headers)
+    resp.conditional_response = True
+    resp.md5_etag()
+    return resp
 
 
 def get_job_results_document(job, results, *, settings):
@@ -1447,12 +1576,14 @@ def get_job_results_multipart(job, results, *, headers, settings):
     :param settings: Application settings to resolve locations.
     """
 
+    streams = []  # type: List[AnyDataStream]
+
     def add_result_parts(result_parts):
         # type: (List[Tuple[str, str, ExecutionResultObject]]) -> MultiPartFieldsType
         for out_id, res_id, result in result_parts:
             if isinstance(result, list):
                 sub_parts = [(out_id, f"{out_id}.{out_idx}", data) for out_idx, data in enumerate(result)]
-                sub_parts = add_result_parts(sub_parts)
+                sub_parts = list(add_result_parts(sub_parts))
                 sub_multi = MultipartEncoder(sub_parts, content_type=ContentType.MULTIPART_MIXED)
                 sub_out_url = job.result_path(output_id=out_id)
                 sub_headers = {
@@ -1462,22 +1593,44 @@ def get_job_results_multipart(job, results, *, headers, settings):
                     "Content-Disposition": f"attachment; name=\"{out_id}\"",
                 }
                 yield res_id, (None, sub_multi, None, sub_headers)
+                continue
 
             is_ref = bool(get_any_value(result, key=True, file=True, data=False))
             out_mode, out_fmt = get_job_output_transmission(job, out_id, is_reference=is_ref)
             res_headers, res_data = generate_or_resolve_result(job, result, res_id, out_id, out_mode, out_fmt, settings)
+            if res_data is not None:
+                streams.append(res_data)
             c_type = res_headers.get("Content-Type")
             c_loc = res_headers.get("Content-Location")
             c_fn = os.path.basename(c_loc) if c_loc else None
             yield res_id, (c_fn, res_data, c_type, res_headers)
 
+    def stream_multipart(encoder):
+        # type: (MultipartEncoder) -> Iterator[bytes]
+        try:
+            while chunk := encoder.read(MULTIPART_RESULTS_CHUNK_SIZE):
+                yield chunk
+        finally:
+            for stream in streams:
+                stream.close()
+
     results_parts = [(_res_id, _res_id, _res_val) for _res_id, _res_val in results.items()]
-    results_parts = list(add_result_parts(results_parts))
-    res_multi = MultipartEncoder(results_parts, content_type=ContentType.MULTIPART_MIXED)
+    try:
+        results_parts = list(add_result_parts(results_parts))
+        res_multi = MultipartEncoder(results_parts, content_type=ContentType.MULTIPART_MIXED)
+    except Exception:
+        for res_stream in streams:
+            res_stream.close()
+        raise
     resp_headers = headers or {}
     resp_headers.update({"Content-Type": res_multi.content_type})
     resp = HTTPOk(detail=f"Multipart Response for {job}", headers=resp_headers)
-    resp.body = res_multi.read()
+    # stream parts read lazily by chunks (including nested array multiparts) to avoid loading large files in memory
+    resp.app_iter = stream_multipart(res_multi)
+    try:
+        resp.content_length = res_multi.len
+    except (OSError, TypeError, ValueError):  # length of some part cannot be computed without reading it
+        resp.content_length = None
     return resp
 
 
@@ -1735,6 +1888,84 @@ def raise_job_result_gone(job, container=None):
     )
 
 
+def precompute_job_results_formats(job, settings, logger=LOGGER):
+    # type: (Job, SettingsType, Optional[logging.Logger]) -> int
+    """
+    Generates the alternate representations of :term:`Job` file results requested by the execution ``format``.
+
+    Converted files are stored in the transform cache such that later requests of the corresponding result
+    representation are served directly, instead of being converted during the request. Failing conversions are
+    reported in the :term:`Job` logs, but are otherwise ignored since the original result remains available.
+
+    :returns: Number of generated result representations.
+    """
+    if not asbool(settings.get("weaver.transform_precompute", False)):
+        return 0
+    wps_out_url = get_wps_output_url(settings)
+    count = 0
+    for result in job.results or []:
+        out_id = get_any_id(result)
+        _, out_fmt = get_job_output_transmission(job, out_id, is_reference=True)
+        out_type = clean_media_type_format(get_field(out_fmt, "mime_type", search_variations=True, default=None))
+        if not out_type or out_type in EXCLUDED_TYPES:
+            continue
+        items = get_any_value(result)
+        items = items if isinstance(items, list) else [result]
+        for item in items:
+            href = get_any_value(item, file=True, data=False) if isinstance(item, dict) else None
+            typ = item.get("type") if isinstance(item, dict) else None
+            typ = typ or get_field(item, "mime_type", search_variations=True, default=None)
+            if not isinstance(href, str) or out_type == typ or out_type not in CONVERSION_DICT.get(typ, []):
+                continue
+            job_out_url = job.result_path(output_id=out_id)
+            if href.startswith(f"/{job_out_url}/"):  # job "relative" path
+                href = os.path.join(wps_out_url, href[1:])
+            loc = map_wps_output_location(href, settings, exists=True, url=False)
+            if not loc:
+                continue  # remote storage, converted on demand
+            file_transform = Transform(file_path=loc, current_media_type=typ, wanted_media_type=out_type,
+                                       settings=settings)
+            if file_transform.cache is None:
+                return count
+            try:
+                file_transform.process_cached(precompute=True)
+                count += 1
+            except Exception as exc:  # pragma: no cover  # noqa: W0718
+                LOGGER.warning("Failed precompute of result [%s] as [%s].", out_id, out_type, exc_info=exc)
+                job.save_log(
+                    logger=logger,
+                    level=logging.WARNING,
+                    message=f"Could not generate result [{out_id}] representation as [{out_type}]: [{exc!s}]",
+                )
+    if count:
+        job.save_log(logger=logger, message=f"Generated [{count}] result representation(s) requested as format.")
+    return count
+
+
+def raise_job_result_pending(job, result_id, media_type, container=None):
+    # type: (Job, str, str, Optional[AnySettingsContainer]) -> NoReturn
+    """
+    Raise a message indicating that the requested representation of a :term:`Job` result is still being generated.
+    """
+    settings = get_settings(container)
+    job_links = job.links(settings, self_link="results")
+    job_links = [link for link in job_links if link["rel"] in ["status", "collection", "up", "results"]]
+    headers = [("Link", make_link_header(link)) for link in job_links]
+    headers.append(("Retry-After", str(JOB_RESULT_PENDING_RETRY_AFTER)))
+    raise HTTPServiceUnavailable(
+        headers=headers,
+        json={
+            "title": "JobResultConversionPending",
+            "type": sd.OGC_API_PROC_PART1_EXC_RESULT_NOT_READY_URI,
+            "status": HTTPServiceUnavailable.code,
+            "detail": "Requested representation of the Job result is being generated. Retry later.",
+            "cause": {"output": result_id, "mediaType": media_type},
+            "value": str(job.id),
+            "links": job_links
+        }
+    )
+
+
 def raise_job_dismissed(job, container=None):
     # type: (Job, Optional[AnySettingsContainer]) -> None
     """
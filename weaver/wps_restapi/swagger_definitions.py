@@ -406,6 +406,7 @@ TAG_LOGS = "Logs"
 TAG_STATISTICS = "Statistics"
 TAG_PROVENANCE = "Provenance"
 TAG_VAULT = "Vault"
+TAG_METRICS = "Metrics"
 TAG_WPS = "WPS"
 TAG_DEPRECATED = "Deprecated Endpoints"
 
@@ -580,6 +581,8 @@ provider_result_service = Service(name="provider_result", path=provider_service.
 vault_service = Service(name="vault", path="/vault")
 vault_file_service = Service(name="vault_file", path=f"{vault_service.path}/{{file_id}}")
 
+metrics_service = Service(name="metrics", path="/metrics")
+
 
 #########################################################
 # Generic schemas
@@ -7195,6 +7198,20 @@ class WpsOutputContextHeader(ExtendedSchemaNode):
     default = None
 
 
+class JobProfilingHeader(ExtendedSchemaNode):
+    name = "X-Weaver-Profiling"
+    description = (
+        "Request profiling of the job execution, if permitted by the server configuration. "
+        "Boolean-like value enables or disables profiling using the default format. "
+        "Alternatively, the profiling format can be specified explicitly. "
+        "The location of the resulting profiling artifact is reported in the job logs."
+    )
+    schema_type = String
+    missing = drop
+    example = "collapsed"
+    validator = OneOf(["true", "false", "pstats", "collapsed"])
+
+
 class JobExecuteHeaders(ExtendedMappingSchema):
     description = "Indicates the relevant headers that were supplied for job execution or a null value if omitted."
     accept = AcceptHeader(missing=None)
@@ -7794,6 +7811,7 @@ class ExecuteHeadersBase(RequestHeadersBody):
     description = "Request headers supported for job execution."
     prefer = PreferHeader(missing=drop)
     x_wps_output_context = WpsOutputContextHeader()
+    x_weaver_profiling = JobProfilingHeader()
 
 
 class ExecuteHeadersJSON(ExecuteHeadersBase):
@@ -9055,6 +9073,20 @@ class GoneVaultFileDownloadResponse(ExtendedMappingSchema):
     body = ErrorJsonResponseBodySchema()
 
 
+class MetricsEndpoint(ExtendedMappingSchema):
+    header = RequestHeadersNoBody()
+
+
+class MetricsResponseBody(ExtendedSchemaNode):
+    schema_type = String
+    description = "Runtime metrics of the API and workers in Prometheus text exposition format."
+
+
+class OkGetMetricsResponse(ExtendedMappingSchema):
+    header = ResponsePlainTextHeaders()
+    body = MetricsResponseBody()
+
+
 get_api_frontpage_responses = {
     "200": OkGetFrontpageResponse(description="success"),
     "405": MethodNotAllowedErrorResponseSchema(),
@@ -9091,6 +9123,12 @@ get_api_conformance_responses = {
     "406": NotAcceptableErrorResponseSchema(),
     "500": InternalServerErrorResponseSchema(),
 }
+get_api_metrics_responses = {
+    "200": OkGetMetricsResponse(description="success"),
+    "405": MethodNotAllowedErrorResponseSchema(),
+    "406": NotAcceptableErrorResponseSchema(),
+    "500": InternalServerErrorResponseSchema(),
+}
 get_processes_responses = {
     "200": OkGetProcessesListResponse(examples={
         "ProcessesListing": {